@@ -20,10 +20,11 @@ def strongly_connected_components(node_gen, parents_gen_fn):
     lowlinks = {}
     stack = []
     stack_members = set()
-    nodes = set(node_gen)
+    node_list = list(node_gen)
+    nodes = set(node_list)
     sccs = []
-    for node in nodes:
-        while node not in indices:
+    for node in node_list:
+        if node not in indices:
             index = _strongconnect(node, sccs, nodes, parents_gen_fn, indices,
                                    lowlinks, stack, stack_members, index)
     return sccs
@@ -40,22 +41,21 @@ def _strongconnect(node, sccs, nodes, parents_gen_fn, indices, lowlinks, stack,
     if parents is not None:
         for parent in parents:
             if parent not in nodes:
-                pass
+                continue
             if parent not in indices:
                 index = _strongconnect(parent, sccs, nodes, parents_gen_fn,
                                        indices, lowlinks, stack, stack_members,
                                        index)
                 lowlinks[node] = min(lowlinks[node], lowlinks[parent])
-            else:
-                while parent in stack_members:
-                    lowlinks[node] = min(lowlinks[node], indices[parent])
+            elif parent in stack_members:
+                lowlinks[node] = min(lowlinks[node], indices[parent])
     if lowlinks[node] == indices[node]:
         scc = []
         sccs.append(scc)
-        v = stack.pop()
-        stack_members.remove(v)
-        scc.append(v)
-        if v is node:
-            break
-            continue
+        while True:
+            v = stack.pop()
+            stack_members.remove(v)
+            scc.append(v)
+            if v is node:
+                break
     return index
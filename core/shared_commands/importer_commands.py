@@ -0,0 +1,34 @@
+import time
+from sims4.importer import import_profiler
+import sims4.commands
+
+@sims4.commands.Command('importer.profile.dump', command_type=sims4.commands.CommandType.Automation)
+def import_profile_dump(sort_key='exclusive_time', _connection=None):
+    output = sims4.commands.Output(_connection)
+    if sort_key not in import_profiler.ModuleImportRecord._fields:
+        output('Unknown sort key {}. Valid keys: {}'.format(sort_key, ', '.join(import_profiler.ModuleImportRecord._fields)))
+        return
+    records = import_profiler.get_records()
+    if not records:
+        output('No imports have been profiled. Set IMPORT_PROFILER_ENABLED in __hooks__ to profile startup.')
+        return
+    current_time = time.strftime('%Y-%m-%d-%H-%M-%S', time.gmtime())
+    report_name = 'import_profile-{}.csv'.format(current_time)
+    with open(report_name, 'w') as fd:
+        import_profiler.write_report(fd, sort_key=sort_key)
+    stacks_name = 'import_profile-{}.folded'.format(current_time)
+    with open(stacks_name, 'w') as fd:
+        import_profiler.write_folded_stacks(fd)
+    total_time = sum(record.exclusive_time for record in records)
+    output("Profiled {} module imports ({:.3f} s). Wrote '{}' and '{}'.".format(len(records), total_time, report_name, stacks_name))
+
+@sims4.commands.Command('importer.profile.enable', command_type=sims4.commands.CommandType.Automation)
+def import_profile_enable(enable:bool=True, _connection=None):
+    if enable:
+        import_profiler.enable()
+    else:
+        import_profiler.disable()
+
+@sims4.commands.Command('importer.profile.clear', command_type=sims4.commands.CommandType.Automation)
+def import_profile_clear(_connection=None):
+    import_profiler.clear()
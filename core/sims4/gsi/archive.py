@@ -90,6 +90,20 @@ class Archiver:
             else:
                 archive_data[self._type_name] = archive_list
 
+def get_archive_records_gen(type_name, zone_id=None):
+    archive = archive_data.get(type_name)
+    if archive is None:
+        return
+    if isinstance(archive, dict):
+        archive_lists = list(archive.values())
+    else:
+        archive_lists = (archive,)
+    for archive_list in archive_lists:
+        for record in archive_list:
+            if zone_id is not None and zone_id != record.zone_id:
+                continue
+            yield record
+
 class ArchiveRecord:
     __qualname__ = 'ArchiveRecord'
     __slots__ = ('zone_id', 'object_id', 'timestamp', 'uid', 'compressed_json')
@@ -105,6 +119,10 @@ class ArchiveRecord:
             uncompressed_json = json.dumps(full_dict)
         self.compressed_json = zlib.compress(uncompressed_json.encode())
 
+    @property
+    def uncompressed_json(self):
+        return zlib.decompress(self.compressed_json).decode('utf-8')
+
     def flatten_archive(self, full_dict):
         data_fields = full_dict['data']
         for (key, field) in data_fields.items():
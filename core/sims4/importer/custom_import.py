@@ -1,6 +1,7 @@
 from importlib.machinery import PathFinder
 import builtins
 import sys
+from sims4.importer import import_profiler
 import sims4.importer.layering
 import sims4.reload
 import sims4.tuning.serialization
@@ -28,8 +29,18 @@ class CustomLoader:
         self._real_loader = real_loader
 
     def load_module(self, load_fullname):
-        mod = self._real_loader.load_module(load_fullname)
-        self.post_load(mod)
+        if not import_profiler.is_enabled():
+            mod = self._real_loader.load_module(load_fullname)
+            self.post_load(mod)
+            return mod
+        import_profiler.begin_module(load_fullname)
+        try:
+            mod = self._real_loader.load_module(load_fullname)
+            import_profiler.begin_tuning()
+            self.post_load(mod)
+            import_profiler.end_tuning()
+        finally:
+            import_profiler.end_module()
         return mod
 
     def post_load(self, module):
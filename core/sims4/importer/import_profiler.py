@@ -0,0 +1,101 @@
+import collections
+import sys
+import time
+import sims4.reload
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+ModuleImportRecord = collections.namedtuple('ModuleImportRecord', ('name', 'stack', 'inclusive_time', 'exclusive_time', 'tuning_time', 'inclusive_allocations', 'exclusive_allocations'))
+with sims4.reload.protected(globals()):
+    _enabled = False
+    _started_tracemalloc = False
+    _stack = []
+    _records = []
+
+class _ImportFrame:
+    __qualname__ = '_ImportFrame'
+    __slots__ = ('name', 'start_time', 'start_allocations', 'child_time', 'child_allocations', 'tuning_start_time', 'tuning_time')
+
+    def __init__(self, name):
+        self.name = name
+        self.start_time = time.perf_counter()
+        self.start_allocations = _get_allocations()
+        self.child_time = 0
+        self.child_allocations = 0
+        self.tuning_start_time = None
+        self.tuning_time = 0
+
+def _get_allocations():
+    if _started_tracemalloc:
+        return tracemalloc.get_traced_memory()[0]
+    if hasattr(sys, 'getallocatedblocks'):
+        return sys.getallocatedblocks()
+    return 0
+
+def enable():
+    global _enabled, _started_tracemalloc
+    if _enabled:
+        return
+    _enabled = True
+    if tracemalloc is not None and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        _started_tracemalloc = True
+
+def disable():
+    global _enabled, _started_tracemalloc
+    _enabled = False
+    if _started_tracemalloc:
+        tracemalloc.stop()
+        _started_tracemalloc = False
+    del _stack[:]
+
+def is_enabled():
+    return _enabled
+
+def clear():
+    del _records[:]
+
+def get_records():
+    return list(_records)
+
+def begin_module(name):
+    if _enabled:
+        _stack.append(_ImportFrame(name))
+
+def begin_tuning():
+    if _enabled and _stack:
+        _stack[-1].tuning_start_time = time.perf_counter()
+
+def end_tuning():
+    if _enabled and _stack:
+        frame = _stack[-1]
+        if frame.tuning_start_time is not None:
+            frame.tuning_time += time.perf_counter() - frame.tuning_start_time
+            frame.tuning_start_time = None
+
+def end_module():
+    if not _enabled or not _stack:
+        return
+    inclusive_time = time.perf_counter() - _stack[-1].start_time
+    inclusive_allocations = _get_allocations() - _stack[-1].start_allocations
+    stack = tuple(frame.name for frame in _stack)
+    frame = _stack.pop()
+    _records.append(ModuleImportRecord(frame.name, stack, inclusive_time, inclusive_time - frame.child_time, frame.tuning_time, inclusive_allocations, inclusive_allocations - frame.child_allocations))
+    if _stack:
+        parent = _stack[-1]
+        parent.child_time += inclusive_time
+        parent.child_allocations += inclusive_allocations
+
+def write_report(file, sort_key='exclusive_time'):
+    records = sorted(_records, key=lambda record: getattr(record, sort_key), reverse=True)
+    file.write('Module,Depth,Inclusive (ms),Exclusive (ms),Tuning (ms),Inclusive Allocations,Exclusive Allocations\n')
+    for record in records:
+        file.write('{},{},{:.3f},{:.3f},{:.3f},{},{}\n'.format(record.name, len(record.stack) - 1, record.inclusive_time*1000, record.exclusive_time*1000, record.tuning_time*1000, record.inclusive_allocations, record.exclusive_allocations))
+
+def write_folded_stacks(file):
+    folded = collections.Counter()
+    for record in _records:
+        folded[';'.join(record.stack)] += int(record.exclusive_time*1000000)
+    for (stack, microseconds) in sorted(folded.items()):
+        file.write('{} {}\n'.format(stack, microseconds))
@@ -29,6 +29,160 @@ def pop_weighted(pairs, random=random, flipped=False):
     if choice_index is not None:
         return pairs.pop(choice_index)[value_index]
 
+def weighted_random_sample(pairs, count, random=random, flipped=False):
+    return WeightedSampler(pairs, random=random, flipped=flipped).pop_many(count)
+
+class WeightedSampler:
+    __qualname__ = 'WeightedSampler'
+    __slots__ = ('_values', '_weights', '_tree', '_remaining', '_remaining_count', '_weighted_count', '_first_remaining', '_random')
+
+    def __init__(self, pairs, random=random, flipped=False):
+        weight_index = 1 if flipped else 0
+        value_index = 0 if flipped else 1
+        self._values = [pair[value_index] for pair in pairs]
+        self._weights = [pair[weight_index] for pair in pairs]
+        self._remaining = [True]*len(self._values)
+        self._first_remaining = 0
+        self._random = random
+        count = len(self._weights)
+        tree = [0]*(count + 1)
+        for (index, weight) in enumerate(self._weights, 1):
+            tree[index] += weight
+            parent = index + (index & -index)
+            if parent <= count:
+                tree[parent] += tree[index]
+        self._tree = tree
+        self._remaining_count = count
+        self._weighted_count = sum(1 for weight in self._weights if weight)
+
+    def __len__(self):
+        return self._remaining_count
+
+    def __bool__(self):
+        return self._remaining_count > 0
+
+    @property
+    def total_weight(self):
+        return self._prefix_sum(len(self._weights))
+
+    def _prefix_sum(self, position):
+        tree = self._tree
+        total = 0
+        while position > 0:
+            total += tree[position]
+            position -= position & -position
+        return total
+
+    def _add(self, index, delta):
+        tree = self._tree
+        count = len(tree) - 1
+        position = index + 1
+        while position <= count:
+            tree[position] += delta
+            position += position & -position
+
+    def _find(self, select):
+        if select <= 0:
+            return self._get_first_remaining()
+        tree = self._tree
+        count = len(tree) - 1
+        position = 0
+        step = 1 << count.bit_length() - 1
+        while step:
+            next_position = position + step
+            if next_position <= count and tree[next_position] < select:
+                position = next_position
+                select -= tree[next_position]
+            step >>= 1
+        index = min(position, count - 1)
+        while not self._remaining[index]:
+            index -= 1
+            if index < 0:
+                return self._get_first_remaining()
+        return index
+
+    def _get_first_remaining(self):
+        remaining = self._remaining
+        while not remaining[self._first_remaining]:
+            self._first_remaining += 1
+        return self._first_remaining
+
+    def _choose_index(self):
+        if not self._remaining_count:
+            return
+        return self._find(self._random.uniform(0, self.total_weight))
+
+    def sample(self):
+        index = self._choose_index()
+        if index is not None:
+            return self._values[index]
+
+    def pop(self):
+        index = self._choose_index()
+        if index is None:
+            return
+        self._remaining[index] = False
+        self._remaining_count -= 1
+        weight = self._weights[index]
+        if weight:
+            self._weighted_count -= 1
+            if self._weighted_count:
+                self._add(index, -weight)
+            else:
+                self._tree = [0]*len(self._tree)
+        return self._values[index]
+
+    def pop_many(self, count):
+        return [self.pop() for _ in range(min(count, self._remaining_count))]
+
+class AliasSampler:
+    __qualname__ = 'AliasSampler'
+    __slots__ = ('_values', '_probabilities', '_aliases', '_random')
+
+    def __init__(self, pairs, random=random, flipped=False):
+        weight_index = 1 if flipped else 0
+        value_index = 0 if flipped else 1
+        self._values = [pair[value_index] for pair in pairs]
+        self._random = random
+        count = len(self._values)
+        self._probabilities = [0]*count
+        self._aliases = [0]*count
+        total = sum(pair[weight_index] for pair in pairs)
+        if total <= 0:
+            return
+        scaled = [pair[weight_index]*count/total for pair in pairs]
+        small = [index for (index, weight) in enumerate(scaled) if weight < 1]
+        large = [index for (index, weight) in enumerate(scaled) if weight >= 1]
+        while small and large:
+            small_index = small.pop()
+            large_index = large.pop()
+            self._probabilities[small_index] = scaled[small_index]
+            self._aliases[small_index] = large_index
+            scaled[large_index] -= 1 - scaled[small_index]
+            if scaled[large_index] < 1:
+                small.append(large_index)
+            else:
+                large.append(large_index)
+        for index in small + large:
+            self._probabilities[index] = 1
+            self._aliases[index] = index
+
+    def __len__(self):
+        return len(self._values)
+
+    def sample(self):
+        count = len(self._values)
+        if not count:
+            return
+        select = self._random.random()*count
+        index = int(select)
+        if select - index >= self._probabilities[index]:
+            index = self._aliases[index]
+        return self._values[index]
+
+    def sample_many(self, count):
+        return [self.sample() for _ in range(count)]
+
 def random_chance(chance_value, random=random):
     if chance_value == 0:
         return False
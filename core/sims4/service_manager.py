@@ -1,6 +1,10 @@
+from collections import OrderedDict, namedtuple
+from graph_algos import topological_sort
 import re
+import time
 import sims4.log
 logger = sims4.log.Logger('Services')
+ServiceStartTime = namedtuple('ServiceStartTime', ('milliseconds', 'deferred'))
 
 class Service:
     __qualname__ = 'Service'
@@ -45,6 +49,14 @@ class Service:
     def can_incremental_start(self):
         return False
 
+    @property
+    def service_dependencies(self):
+        return ()
+
+    @property
+    def can_defer_start(self):
+        return False
+
     def update_incremental_start(self):
         pass
 
@@ -65,6 +77,9 @@ class ServiceManager:
         self._init_critical_services = []
         self._services_to_start = []
         self._incremental_start_in_progress = False
+        self._deferred_services = OrderedDict()
+        self._zone = None
+        self.service_start_times = OrderedDict()
 
     def register_service(self, service, is_init_critical=False):
         if not isinstance(service, Service):
@@ -73,6 +88,36 @@ class ServiceManager:
         if is_init_critical:
             self._init_critical_services.append(service)
 
+    def _get_start_order(self):
+        services_by_name = {service.get_zone_variable_name(): service for service in self.services}
+
+        def get_dependencies(service):
+            return [services_by_name[name] for name in service.service_dependencies if name in services_by_name]
+
+        try:
+            return topological_sort(self.services, get_dependencies)
+        except ValueError:
+            logger.exception('Service dependencies are cyclic. Services will start in registration order.')
+            return list(self.services)
+
+    def _record_start_time(self, service, start_time, deferred=False):
+        milliseconds = (time.monotonic() - start_time)*1000
+        start_record = self.service_start_times.get(service)
+        if start_record is not None:
+            milliseconds += start_record.milliseconds
+        self.service_start_times[service] = ServiceStartTime(milliseconds, deferred)
+
+    def _start_service(self, service, deferred=False):
+        for name in service.service_dependencies:
+            self.start_deferred_service(name)
+        start_time = time.monotonic()
+        try:
+            service.start()
+        except Exception:
+            logger.exception('Error during start of service {}. This will likely cause additional errors in the future.', service)
+        finally:
+            self._record_start_time(service, start_time, deferred=deferred)
+
     def start_services(self, zone=None, gameplay_zone_data=None, save_slot_data=None, defer_start_to_tick=False):
         for service in self.services:
             if zone is not None:
@@ -82,25 +127,56 @@ class ServiceManager:
             except Exception:
                 logger.error('Error during setup of service {}. This will likely cause additional errors in the future.', service)
         logger.info('Starting all services. zone: {}. defer: {}.', zone, defer_start_to_tick)
+        start_order = self._get_start_order()
         if defer_start_to_tick:
-            self._services_to_start = [service for service in self.services if service not in self._init_critical_services]
-            for service in self._init_critical_services:
-                try:
-                    service.start()
-                except Exception:
-                    logger.exception('Error during start of service {}. This will likely cause additional errors in the future.', service)
+            self._services_to_start = [service for service in start_order if service not in self._init_critical_services]
+            for service in start_order:
+                if service in self._init_critical_services:
+                    self._start_service(service)
             logger.info('Defer {} services to load separately.', len(self._services_to_start))
-        else:
-            for service in self.services:
-                try:
-                    service.start()
-                except Exception:
-                    logger.exception('Error during start of service {}. This will likely cause additional errors in the future.', service)
+            return
+        if zone is not None:
+            self._zone = zone
+            for service in start_order:
+                if service.can_defer_start:
+                    name = service.get_zone_variable_name()
+                    delattr(zone, name)
+                    self._deferred_services[name] = service
+            logger.info('Defer {} services until first use or until the loading screen is finished.', len(self._deferred_services))
+        for service in start_order:
+            if service.get_zone_variable_name() not in self._deferred_services:
+                self._start_service(service)
+
+    def start_deferred_service(self, name):
+        service = self._deferred_services.pop(name, None)
+        if service is None:
+            return
+        logger.info('Starting deferred service: {}. Pending deferred services count: {}.', service, len(self._deferred_services))
+        setattr(self._zone, name, service)
+        self._start_service(service, deferred=True)
+        return service
+
+    def _get_services_for_hook_gen(self, hook_name):
+        for service in self.services:
+            name = service.get_zone_variable_name()
+            if name in self._deferred_services:
+                if getattr(type(service), hook_name) is getattr(Service, hook_name):
+                    continue
+                self.start_deferred_service(name)
+            yield service
+
+    def get_deferred_services_gen(self):
+        yield from self._deferred_services.values()
+
+    def start_deferred_services(self):
+        while self._deferred_services:
+            self.start_deferred_service(next(iter(self._deferred_services)))
 
     def start_single_service(self):
         if not self._services_to_start:
             return True
         service = self._services_to_start[0]
+        start_time = time.monotonic()
         try:
             logger.info('Starting Service: {}. Pending services count: {}.', service, len(self._services_to_start), owner='manus')
             if self._incremental_start_in_progress:
@@ -120,6 +196,8 @@ class ServiceManager:
             logger.exception('Error during initialization of service {}. This will likely cause additional errors in the future.', service)
             self._incremental_start_in_progress = False
             self._services_to_start.pop(0)
+        finally:
+            self._record_start_time(service, start_time, deferred=True)
         if not self._services_to_start:
             return True
         return False
@@ -128,38 +206,40 @@ class ServiceManager:
         logger.debug('stop_services')
         while self.services:
             service = self.services.pop()
-            logger.debug('Shutting Down Service: {}', service)
-            try:
-                service.stop()
-            except Exception:
-                logger.exception('Error during shutdown of service {}. This will likely cause additional errors in the future.', service)
-            while zone is not None:
-                setattr(zone, service.get_zone_variable_name(), None)
-                continue
+            name = service.get_zone_variable_name()
+            if self._deferred_services.pop(name, None) is None:
+                logger.debug('Shutting Down Service: {}', service)
+                try:
+                    service.stop()
+                except Exception:
+                    logger.exception('Error during shutdown of service {}. This will likely cause additional errors in the future.', service)
+            if zone is not None:
+                setattr(zone, name, None)
+        self._zone = None
 
     def on_client_connect(self, client):
-        for service in self.services:
+        for service in self._get_services_for_hook_gen('on_client_connect'):
             try:
                 service.on_client_connect(client)
             except Exception:
                 logger.exception('{} failed to handle client connection due to exception', service)
 
     def on_client_disconnect(self, client):
-        for service in self.services:
+        for service in self._get_services_for_hook_gen('on_client_disconnect'):
             try:
                 service.on_client_disconnect(client)
             except Exception:
                 logger.exception('{} failed to handle client disconnect due to exception', service)
 
     def on_all_households_and_sim_infos_loaded(self, client):
-        for service in self.services:
+        for service in self._get_services_for_hook_gen('on_all_households_and_sim_infos_loaded'):
             try:
                 service.on_all_households_and_sim_infos_loaded(client)
             except Exception:
                 logger.exception('{} failed to handle on_all_households_and_sim_infos_loaded due to exception', service)
 
     def on_cleanup_zone_objects(self, client):
-        for service in self.services:
+        for service in self._get_services_for_hook_gen('on_cleanup_zone_objects'):
             try:
                 service.on_cleanup_zone_objects(client)
             except Exception:
@@ -168,6 +248,11 @@ class ServiceManager:
     def save_all_services(self, persistence_service, error_code_start_value, **kwargs):
         initial_persistence_error_code = persistence_service.save_error_code if persistence_service is not None else None
         for (index, service) in enumerate(reversed(self.services)):
+            name = service.get_zone_variable_name()
+            if name in self._deferred_services:
+                if type(service).pre_save is Service.pre_save and type(service).save is Service.save:
+                    continue
+                self.start_deferred_service(name)
             try:
                 service.pre_save()
             except BaseException as exc:
@@ -175,6 +260,8 @@ class ServiceManager:
                     persistence_service.save_error_code = int(error_code_start_value) + index
                 raise
         for (index, service) in enumerate(reversed(self.services)):
+            if service.get_zone_variable_name() in self._deferred_services:
+                continue
             try:
                 service.save(**kwargs)
             except BaseException as exc:
@@ -183,15 +270,15 @@ class ServiceManager:
                 raise
 
     def load_all_services(self, zone_data=None):
-        for service in self.services:
+        for service in self._get_services_for_hook_gen('load'):
             service.load(zone_data=zone_data)
 
     def save_options(self, options_proto):
-        for service in self.services:
+        for service in self._get_services_for_hook_gen('save_options'):
             service.save_options(options_proto)
 
     def load_options(self, options_proto):
-        for service in self.services:
+        for service in self._get_services_for_hook_gen('load_options'):
             try:
                 service.load_options(options_proto)
             except:
@@ -98,7 +98,8 @@ class TunedInstanceMetaclass(type):
         setattr(cls, tunable_name, tunable.default)
 
     def generate_tuned_type(cls, name, *args, **kwargs):
-        tuning_class_instance = type(cls)(name, (cls,), {}, custom_module_name=TUNING_FILE_MODULE_NAME)
+        namespace = {'__slots__': ()} if cls.__dictoffset__ == 0 else {}
+        tuning_class_instance = type(cls)(name, (cls,), namespace, custom_module_name=TUNING_FILE_MODULE_NAME)
         return tuning_class_instance
 
 class HashedTunedInstanceMetaclass(TunedInstanceMetaclass):
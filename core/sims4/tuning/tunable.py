@@ -1249,6 +1249,7 @@ class TunableReference(_TunableHasPackSafeMixin, Tunable):
 
 class HasTunableReference:
     __qualname__ = 'HasTunableReference'
+    __slots__ = ()
 
     @classmethod
     def TunableReference(cls, *args, class_restrictions=DEFAULT, **kwargs):
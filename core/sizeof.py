@@ -19,8 +19,7 @@ def recursive_sizeof(roots, skip_atomic=False):
         visited.add(id(obj))
         for child in enumerate_children(obj, handler_cache):
             if child is not None:
-                pass
-            pending.append((child, root))
+                pending.append((child, root))
     results = []
     for root in roots:
         results.append((root, sizes[id(root)]))
@@ -41,6 +40,40 @@ def report(labeled_roots, skip_atomic=False):
     return counter
 
 
+class _DictLayout:
+    __qualname__ = '_DictLayout'
+
+
+def slot_names(t):
+    names = []
+    for cls in reversed(t.__mro__):
+        slots = vars(cls).get('__slots__', ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        for name in slots:
+            if name not in ('__dict__', '__weakref__'):
+                names.append(name)
+    return names
+
+
+def instance_sizeof(obj):
+    size = sys.getsizeof(obj)
+    obj_dict = getattr(obj, '__dict__', None)
+    if obj_dict is not None:
+        size += sys.getsizeof(obj_dict)
+    return size
+
+
+def dict_layout_sizeof(obj):
+    layout = _DictLayout()
+    for name in slot_names(type(obj)):
+        if hasattr(obj, name):
+            setattr(layout, name, None)
+    for name in getattr(obj, '__dict__', ()):
+        setattr(layout, name, None)
+    return sys.getsizeof(layout) + sys.getsizeof(layout.__dict__)
+
+
 def object_iter(obj):
     children = []
     for attr in dir(obj):
@@ -48,11 +81,11 @@ def object_iter(obj):
             v = getattr(obj, attr, None)
         except:
             continue
-        ref = sys.getrefcount(v)
-        while not v is None:
-            if ref == 2:
-                pass
-            children.append(v)
+        if v is None:
+            continue
+        if sys.getrefcount(v) == 2:
+            continue
+        children.append(v)
     return children
 
 
@@ -63,7 +96,7 @@ def module_iter(module):
     for value in module_dict.values():
         if isinstance(value,
                       (type, FunctionType)) and value.__module__ != name:
-            pass
+            continue
         members.append(value)
     members.append(vars(module))
     return members
@@ -86,11 +119,81 @@ def enumerate_children(obj, handler_cache):
     if t not in handler_cache:
         for st in t.__mro__:
             handler = HANDLERS.get(st)
-            while handler is not None:
+            if handler is not None:
                 handler_cache[t] = handler
                 break
-        handler_cache[t] = None
+        else:
+            handler_cache[t] = None
     handler = handler_cache[t]
     if handler is not None:
         return handler(obj)
     return ()
+
+
+def is_imported_global(module_name, value):
+    if isinstance(value, ModuleType):
+        return True
+    return isinstance(value, (type, FunctionType)) and value.__module__ != module_name
+
+
+class HeapCensus:
+    __qualname__ = 'HeapCensus'
+
+    def __init__(self, labeled_roots, skip_atomic=False, ignore=(),
+                 batch_size=1000, get_referents=gc.get_referents):
+        self._labeled_roots = labeled_roots
+        self._skip_atomic = skip_atomic
+        self._ignore = ignore
+        self._batch_size = batch_size
+        self._get_referents = get_referents
+        self.sizes = collections.Counter()
+        self.counts = collections.Counter()
+        self.complete = False
+
+    def walk_gen(self):
+        # Objects are owned by the first label that reaches them, and every
+        # root is reserved up front so one label never walks into another.
+        # Module dicts are reserved too, otherwise function globals would
+        # pull whole modules into whichever label reaches them first.
+        # Visited objects are tracked by id, and ids can be reused if an
+        # object dies between steps, so results are approximate.
+        self.sizes.clear()
+        self.counts.clear()
+        self.complete = False
+        visited = {id(self), id(self._labeled_roots), id(sys.modules)}
+        visited.update(id(obj) for obj in self._ignore)
+        for module in list(sys.modules.values()):
+            if module is not None:
+                visited.add(id(module))
+                visited.add(id(vars(module)))
+        for (_, roots) in self._labeled_roots:
+            visited.update(id(root) for root in roots)
+        processed = 0
+        for (label, roots) in self._labeled_roots:
+            pending = collections.deque(roots)
+            while pending:
+                obj = pending.popleft()
+                if not self._skip_atomic or gc.is_tracked(obj):
+                    self.sizes[label] += sys.getsizeof(obj)
+                self.counts[label] += 1
+                for child in self._get_referents(obj):
+                    child_id = id(child)
+                    if child_id not in visited:
+                        visited.add(child_id)
+                        pending.append(child)
+                processed += 1
+                if processed >= self._batch_size:
+                    processed = 0
+                    yield
+        self.complete = True
+
+
+def diff_census(before, after):
+    growth = []
+    for label in set(before) | set(after):
+        delta = after.get(label, 0) - before.get(label, 0)
+        if delta:
+            growth.append((label, before.get(label, 0), after.get(label, 0),
+                           delta))
+    growth.sort(key=lambda entry: entry[3], reverse=True)
+    return growth
@@ -1,4 +1,5 @@
 RELOADER_ENABLED = False
+IMPORT_PROFILER_ENABLED = False
 __enable_gc_callback = True
 import gc
 try:
@@ -10,6 +11,9 @@ except:
 def system_init(gameplay):
     import sims4.importer
     sims4.importer.enable()
+    if IMPORT_PROFILER_ENABLED:
+        import sims4.importer.import_profiler
+        sims4.importer.import_profiler.enable()
     try:
         import debugger
         debugger.initialize()
@@ -75,7 +75,7 @@ class Broadcaster(HasTunableReference, metaclass=HashedTunedInstanceMetaclass, m
     def _on_broadcasting_object_deleted(self, _):
         current_zone = services.current_zone()
         if current_zone is not None:
-            broadcaster_service = current_zone.broadcaster_service
+            broadcaster_service = current_zone.get_service('broadcaster_service')
             if broadcaster_service is not None:
                 broadcaster_service.remove_broadcaster(self)
 
@@ -83,7 +83,7 @@ class Broadcaster(HasTunableReference, metaclass=HashedTunedInstanceMetaclass, m
         self.regenerate_constraint()
         current_zone = services.current_zone()
         if current_zone is not None:
-            broadcaster_service = current_zone.broadcaster_service
+            broadcaster_service = current_zone.get_service('broadcaster_service')
             if broadcaster_service is not None:
                 broadcaster_service.update_cluster_request(self)
 
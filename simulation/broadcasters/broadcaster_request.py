@@ -27,7 +27,7 @@ class BroadcasterRequest(elements.ParentElement, HasTunableFactory, AutoFactoryI
     def start(self, *_, **__):
         if self._target.is_prop:
             return
-        broadcaster_service = services.current_zone().broadcaster_service
+        broadcaster_service = services.broadcaster_service()
         if broadcaster_service is not None:
             for broadcaster_type in self.broadcaster_types:
                 broadcaster = broadcaster_type(broadcasting_object=self._target, interaction=self._interaction)
@@ -35,7 +35,7 @@ class BroadcasterRequest(elements.ParentElement, HasTunableFactory, AutoFactoryI
                 broadcaster_service.add_broadcaster(broadcaster)
 
     def stop(self, *_, **__):
-        broadcaster_service = services.current_zone().broadcaster_service
+        broadcaster_service = services.broadcaster_service()
         if broadcaster_service is not None:
             for broadcaster in self._broadcasters:
                 broadcaster_service.remove_broadcaster(broadcaster)
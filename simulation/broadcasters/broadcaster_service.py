@@ -28,6 +28,15 @@ class BroadcasterService(Service):
         self._object_cache = None
         self._pending_update = False
         self._quadtrees = defaultdict(sims4.geometry.QuadTree)
+        self._active_broadcasters_version = 0
+
+    @property
+    def service_dependencies(self):
+        return ('object_manager',)
+
+    @property
+    def can_defer_start(self):
+        return True
 
     def start(self):
         self._alarm_handle = add_alarm_real_time(self, interval_in_real_seconds(self.INTERVAL), self._on_update, repeating=True, use_sleep_time=False)
@@ -60,6 +69,7 @@ class BroadcasterService(Service):
             self._remove_from_cluster_request(broadcaster)
             self._remove_broadcaster_from_quadtree(broadcaster)
             self._active_broadcasters.remove(broadcaster)
+            self._active_broadcasters_version += 1
         broadcaster.on_removed()
         self._on_update_callbacks()
 
@@ -124,9 +134,8 @@ class BroadcasterService(Service):
 
     def _get_broadcasters_for_cluster_request_gen(self, broadcaster_type, broadcaster_level):
         for broadcaster in self._active_broadcasters:
-            while broadcaster.guid == broadcaster_type.guid:
-                if broadcaster.should_cluster() and broadcaster.routing_surface.secondary_id == broadcaster_level:
-                    yield broadcaster
+            if broadcaster.guid == broadcaster_type.guid and broadcaster.should_cluster() and broadcaster.routing_surface.secondary_id == broadcaster_level:
+                yield broadcaster
 
     def get_broadcasters_gen(self, inspect_only=False):
         for (cluster_request_key, cluster_request) in self._cluster_requests.items():
@@ -134,29 +143,27 @@ class BroadcasterService(Service):
             if is_cluster_dirty:
                 for broadcaster in self._get_broadcasters_for_cluster_request_gen(*cluster_request_key):
                     broadcaster.regenerate_constraint()
-            while not is_cluster_dirty or not inspect_only:
-                while True:
-                    for cluster in cluster_request.get_clusters_gen():
-                        broadcaster_iter = cluster.objects_gen()
-                        master_broadcaster = next(broadcaster_iter)
-                        master_broadcaster.set_linked_broadcasters(list(broadcaster_iter))
-                        yield master_broadcaster
+            if not is_cluster_dirty or not inspect_only:
+                for cluster in cluster_request.get_clusters_gen():
+                    broadcaster_iter = cluster.objects_gen()
+                    master_broadcaster = next(broadcaster_iter)
+                    master_broadcaster.set_linked_broadcasters(list(broadcaster_iter))
+                    yield master_broadcaster
         for broadcaster in self._active_broadcasters:
-            while not broadcaster.should_cluster():
-                if self._is_valid_broadcaster(broadcaster):
-                    yield broadcaster
+            if not broadcaster.should_cluster() and self._is_valid_broadcaster(broadcaster):
+                yield broadcaster
 
     def get_pending_broadcasters_gen(self):
-        yield self._pending_broadcasters
+        yield from self._pending_broadcasters
 
     def _get_all_objects_gen(self):
         if any(broadcaster.allow_objects for broadcaster in self._active_broadcasters):
             if self._object_cache is None:
                 self._object_cache = WeakSet(services.object_manager().valid_objects())
-            yield list(self._object_cache)
+            yield from list(self._object_cache)
         else:
             self._object_cache = None
-            yield services.sim_info_manager().instanced_sims_gen()
+            yield from services.sim_info_manager().instanced_sims_gen()
 
     def register_callback(self, callback):
         if callback not in self._on_update_callbacks:
@@ -170,27 +177,43 @@ class BroadcasterService(Service):
         self._pending_update = True
 
     def update(self):
+        for _ in self.update_gen():
+            pass
+
+    def update_gen(self):
         if self._pending_update:
             self._pending_update = False
-            self._update()
+            yield from self._update_gen()
 
     def _update(self):
+        for _ in self._update_gen():
+            pass
+
+    def _update_gen(self):
         try:
             self._activate_pending_broadcasters()
             current_broadcasters = set(self.get_broadcasters_gen())
-            for obj in self._get_all_objects_gen():
+            active_broadcasters_version = self._active_broadcasters_version
+            object_manager = services.object_manager()
+            for obj in tuple(self._get_all_objects_gen()):
+                yield
+                if active_broadcasters_version != self._active_broadcasters_version:
+                    active_broadcasters_version = self._active_broadcasters_version
+                    current_broadcasters = {broadcaster for broadcaster in current_broadcasters if broadcaster in self._active_broadcasters}
+                if object_manager.get(obj.id) is not obj:
+                    continue
                 is_affected = False
                 for broadcaster in current_broadcasters:
-                    while broadcaster.can_affect(obj):
-                        constraint = broadcaster.get_constraint()
-                        if not constraint.valid:
-                            pass
-                        if constraint.geometry is None or constraint.geometry.contains_point(obj.position) and constraint.routing_surface == obj.routing_surface:
-                            broadcaster.apply_broadcaster_effect(obj)
-                            is_affected = True
-                while not is_affected:
-                    if self._object_cache is not None:
-                        self._object_cache.remove(obj)
+                    if not broadcaster.can_affect(obj):
+                        continue
+                    constraint = broadcaster.get_constraint()
+                    if not constraint.valid:
+                        continue
+                    if constraint.geometry is None or constraint.geometry.contains_point(obj.position) and constraint.routing_surface == obj.routing_surface:
+                        broadcaster.apply_broadcaster_effect(obj)
+                        is_affected = True
+                if not is_affected and self._object_cache is not None:
+                    self._object_cache.discard(obj)
             for broadcaster in current_broadcasters:
                 broadcaster.on_processed()
         finally:
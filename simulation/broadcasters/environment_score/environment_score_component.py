@@ -31,14 +31,14 @@ class EnvironmentScoreComponent(Component, component_name=objects.components.typ
     def _start_broadcaster(self):
         if not self.should_broadcast:
             return
-        broadcaster_service = services.current_zone().broadcaster_service
+        broadcaster_service = services.broadcaster_service()
         if broadcaster_service is not None and self._broadcaster is None:
             self._broadcaster = EnvironmentScoreTuning.ENVIRONMENT_SCORE_BROADCASTER(broadcasting_object=self.owner)
             broadcaster_service.add_broadcaster(self._broadcaster)
 
     def _stop_broadcaster(self):
         if self._broadcaster is not None:
-            broadcaster_service = services.current_zone().broadcaster_service
+            broadcaster_service = services.broadcaster_service()
             if broadcaster_service is not None:
                 broadcaster_service.remove_broadcaster(self._broadcaster)
             self._broadcaster = None
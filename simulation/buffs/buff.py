@@ -187,6 +187,14 @@ class GameEffectModifiers(HasTunableFactory):
         self._relationship_track_decay_lockers.clear()
         self._relationship_track_decay_lockers = []
 
+    @property
+    def has_affordance_modifiers(self):
+        return bool(self._affordance_modifiers)
+
+    @property
+    def has_effective_skill_modifiers(self):
+        return bool(self._effective_skill_modifiers)
+
     def get_affordance_scoring_modifier(self, affordance):
         return sum(modifier.get_score_for_type(affordance) for modifier in self._affordance_modifiers)
 
@@ -741,7 +741,7 @@ class CareerBase:
             if self.current_track_tuning.branches:
                 sim_info = self._sim_info
                 if sim_info.is_selectable and sim_info.valid_for_distribution:
-                    if services.current_zone().ui_dialog_service.auto_respond:
+                    if services.ui_dialog_service().auto_respond:
                         self.set_new_career_track(self.current_track_tuning.branches[0].guid64)
                         return False
                     msg = self.get_select_career_track_pb(sim_info, self, self.current_track_tuning.branches)
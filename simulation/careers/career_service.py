@@ -16,6 +16,10 @@ class CareerService(Service):
         self._career_list_seed = None
         self._last_day_updated = None
 
+    @property
+    def can_defer_start(self):
+        return True
+
     def load(self, zone_data=None):
         save_slot_data_msg = services.get_persistence_service().get_save_slot_proto_buff()
         if save_slot_data_msg.gameplay_data.HasField('career_choices_seed'):
@@ -61,7 +61,7 @@ class Field:
         if self._should_distribute(inst):
             op = self.get_op(inst)
             if op is not None:
-                distributor.system.Distributor.instance().add_op(inst, op)
+                distributor.system.Distributor.instance().add_op(inst, op, coalesce_key=self)
         return ret
 
     def getter(self, getter):
@@ -76,7 +76,7 @@ class Field:
             if self._should_distribute(inst):
                 op = self.get_op(inst)
                 if op is not None:
-                    distributor.system.Distributor.instance().add_op(inst, op)
+                    distributor.system.Distributor.instance().add_op(inst, op, coalesce_key=self)
 
         return _resend
 
@@ -132,7 +132,7 @@ class ComponentField(Field):
         if self._should_distribute(inst.owner):
             op = self.get_op(inst)
             if op is not None:
-                distributor.system.Distributor.instance().add_op(inst.owner, op)
+                distributor.system.Distributor.instance().add_op(inst.owner, op, coalesce_key=self)
         return ret
 
     def get_resend(self):
@@ -141,7 +141,7 @@ class ComponentField(Field):
             if self._should_distribute(component.owner):
                 op = self.get_op(component)
                 if op is not None:
-                    distributor.system.Distributor.instance().add_op(component.owner, op)
+                    distributor.system.Distributor.instance().add_op(component.owner, op, coalesce_key=self)
 
         return _resend
 
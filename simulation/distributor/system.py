@@ -1,4 +1,4 @@
-from collections import namedtuple
+from collections import OrderedDict, namedtuple
 from contextlib import contextmanager
 import weakref
 from distributor import logger
@@ -10,6 +10,7 @@ from protocolbuffers.Consts_pb2 import MSG_OBJECTS_VIEW_UPDATE, MGR_UNMANAGED
 from sims4.callback_utils import consume_exceptions
 from sims4.repr_utils import standard_repr
 from uid import UniqueIdGenerator
+import distributor.ops
 import elements
 import gsi_handlers
 import protocolbuffers.DistributorOps_pb2
@@ -34,17 +35,33 @@ class Journal:
     JournalEntry = namedtuple('JournalEntry', ('object', 'protocol_buffer', 'manager_id', 'debug_object_name'))
     JournalEntry.__repr__ = lambda self: standard_repr(self, self.object, self.protocol_buffer, self.manager_id, self.debug_object_name)
 
+    class PendingOp:
+        __qualname__ = 'Journal.PendingOp'
+        __slots__ = ('object_id', 'manager_id', 'op', 'entry', 'coalesced_count')
+
+        def __init__(self, object_id, manager_id, op=None, entry=None):
+            self.object_id = object_id
+            self.manager_id = manager_id
+            self.op = op
+            self.entry = entry
+            self.coalesced_count = 0
+
+        def __repr__(self):
+            return standard_repr(self, self.object_id, self.op, self.manager_id, self.entry)
+
     def __init__(self):
         self.entries = []
         self.deferred_ops = []
         self.deferring = False
+        self._coalescable_ops = {}
+        self.coalesced_op_count = 0
 
     def __repr__(self):
         return '<Journal ops={}>'.format(self.op_count)
 
     @property
     def op_count(self):
-        return len(self.entries)
+        return len(self.entries) - self.coalesced_op_count
 
     def start_deferring(self):
         self.deferring = True
@@ -56,9 +73,10 @@ class Journal:
         for (_, ((obj, op), entry)) in deferred_ops:
             if entry is None:
                 entry = self._build_journal_entry(obj, op)
-            self.entries.append(entry)
+            self.entries.append(Journal.PendingOp(entry.object, entry.manager_id, entry=entry))
+        self._coalescable_ops.clear()
 
-    def add(self, obj, op, ignore_deferral=False):
+    def add(self, obj, op, ignore_deferral=False, coalesce_key=None):
         for tag in _current_tag_set:
             op.block_on_tag(tag)
         op_task_owner = None
@@ -66,23 +84,26 @@ class Journal:
         if time_service is not None and time_service.sim_timeline is not None:
             timeline = time_service.sim_timeline
             current_element = timeline.get_current_element()
-            if isinstance(current_element, reset.ResettableElement):
-                op_task_owner = current_element.obj
-                break
-            if isinstance(current_element, elements.AllElement):
-                break
-            if current_element._parent_handle is None:
-                break
-            current_element = current_element._parent_handle.element
-            continue
+            while current_element is not None:
+                if isinstance(current_element, reset.ResettableElement):
+                    op_task_owner = current_element.obj
+                    break
+                if isinstance(current_element, elements.AllElement):
+                    break
+                if current_element._parent_handle is None:
+                    break
+                current_element = current_element._parent_handle.element
         if op_task_owner is not None and op_task_owner is not obj and (obj is None or op_task_owner.id != obj.id):
             op_task_owner_manager = getattr(op_task_owner, 'manager', None)
             if op_task_owner_manager is not None and hasattr(op_task_owner_manager, 'id'):
                 op.add_additional_channel(op_task_owner_manager.id, op_task_owner.id, mask=op._primary_channel_mask_override)
                 op._primary_channel_mask_override = 0
         if not self.deferring or ignore_deferral:
-            entry = self._build_journal_entry(obj, op)
-            self.entries.append(entry)
+            (object_id, manager_id) = self._get_journal_target(obj)
+            pending_op = Journal.PendingOp(object_id, manager_id)
+            if not self._coalesce(pending_op, op, coalesce_key):
+                pending_op.entry = self._write_journal_entry(object_id, manager_id, op)
+            self.entries.append(pending_op)
             return
         if obj is None or not hasattr(obj, 'ref'):
             self.deferred_ops.append((None, [(obj, op), None]))
@@ -90,22 +111,69 @@ class Journal:
 
         def on_object_deleted(ref):
             for (other_ref, key_and_entry) in self.deferred_ops:
-                while other_ref == ref:
+                if other_ref == ref:
                     entry = self._build_journal_entry(obj, op)
                     key_and_entry[1] = entry
 
         obj_ref = obj.ref(on_object_deleted)
         self.deferred_ops.append((obj_ref, [(obj, op), None]))
 
+    @staticmethod
+    def _is_coalescing_barrier(op):
+        if op._force_execution_on_tag:
+            return True
+        if any(channel[0] == MGR_UNMANAGED for channel in op._additional_channels):
+            return True
+        return isinstance(op, (distributor.ops.StartArb, distributor.ops.ElementDistributionOpMixin))
+
+    def _coalesce(self, pending_op, op, coalesce_key):
+        if self._is_coalescing_barrier(op):
+            self._coalescable_ops.clear()
+            return False
+        channel_key = (pending_op.object_id, pending_op.manager_id)
+        if coalesce_key is None or pending_op.manager_id == MGR_UNMANAGED or op._additional_channels or op._primary_channel_mask_override is not None:
+            self._coalescable_ops.pop(channel_key, None)
+            return False
+        pending_op.op = op
+        channel_ops = self._coalescable_ops.get(channel_key)
+        if channel_ops is None:
+            channel_ops = self._coalescable_ops[channel_key] = {}
+        previous_op = channel_ops.get(coalesce_key)
+        if previous_op is not None:
+            previous_op.op = None
+            pending_op.coalesced_count = previous_op.coalesced_count + 1
+            self.coalesced_op_count += 1
+        channel_ops[coalesce_key] = pending_op
+        return True
+
+    def build_entries(self):
+        entries = []
+        bytes_saved = 0
+        for pending_op in self.entries:
+            entry = pending_op.entry
+            if entry is None:
+                if pending_op.op is None:
+                    continue
+                entry = self._write_journal_entry(pending_op.object_id, pending_op.manager_id, pending_op.op)
+            if pending_op.coalesced_count:
+                bytes_saved += pending_op.coalesced_count*entry.protocol_buffer.ByteSize()
+            entries.append(entry)
+        return (entries, bytes_saved)
+
     def _build_journal_entry(self, obj, op):
+        (object_id, manager_id) = self._get_journal_target(obj)
+        return self._write_journal_entry(object_id, manager_id, op)
+
+    @staticmethod
+    def _get_journal_target(obj):
+        if obj is None:
+            return (0, MGR_UNMANAGED)
+        return (obj.id, obj.manager.id)
+
+    @staticmethod
+    def _write_journal_entry(object_id, manager_id, op):
         object_name = None
         proto_buff = protocolbuffers.DistributorOps_pb2.Operation()
-        if obj is None:
-            object_id = 0
-            manager_id = MGR_UNMANAGED
-        else:
-            object_id = obj.id
-            manager_id = obj.manager.id
         mask_override = None
         if manager_id == MGR_UNMANAGED:
             mask_override = 0
@@ -126,6 +194,52 @@ class Journal:
 
     def clear(self):
         del self.entries[:]
+        self._coalescable_ops.clear()
+        self.coalesced_op_count = 0
+
+CoalescingStats = namedtuple('CoalescingStats', ('ops_sent', 'ops_coalesced', 'bytes_saved'))
+
+class EncodedViewUpdate:
+    __qualname__ = 'EncodedViewUpdate'
+    __slots__ = ('entries', '_buffers')
+
+    def __init__(self, entries):
+        self.entries = entries
+        self._buffers = {}
+
+    @classmethod
+    def encode(cls, all_ops):
+        entries = []
+        view_update = protocols.ViewUpdate()
+        entry = None
+        last_obj_id = None
+        last_manager_id = None
+        for (obj_id, operation, manager_id, obj_name) in all_ops:
+            if entry is None or obj_id != last_obj_id or manager_id != last_manager_id:
+                if entry is not None:
+                    entries.append((last_manager_id, view_update.SerializeToString()))
+                    view_update.Clear()
+                if _distributor_log_enabled:
+                    logger.error('    Object: {}', obj_name or obj_id)
+                entry = view_update.entries.add()
+                entry.primary_channel.id.manager_id = manager_id
+                entry.primary_channel.id.object_id = obj_id
+                last_obj_id = obj_id
+                last_manager_id = manager_id
+            entry.operation_list.operations.append(operation)
+        if entry is not None:
+            entries.append((last_manager_id, view_update.SerializeToString()))
+        return cls(entries)
+
+    def get_buffer(self, manager_ids=None):
+        buffer = self._buffers.get(manager_ids)
+        if buffer is None:
+            if manager_ids is None:
+                buffer = b''.join(encoded_entry for (_, encoded_entry) in self.entries)
+            else:
+                buffer = b''.join(encoded_entry for (manager_id, encoded_entry) in self.entries if manager_id in manager_ids)
+            self._buffers[manager_ids] = buffer
+        return buffer
 
 class Distributor:
     __qualname__ = 'Distributor'
@@ -134,7 +248,11 @@ class Distributor:
         self.journal = Journal()
         self._pending_creates = weakref.WeakSet()
         self.client = None
+        self._observer_clients = OrderedDict()
+        self._pending_archive = []
         self.events = []
+        self.last_coalescing_stats = CoalescingStats(0, 0, 0)
+        self.total_coalescing_stats = CoalescingStats(0, 0, 0)
 
     def __repr__(self):
         return '<Distributor events={}>'.format(len(self.events))
@@ -186,13 +304,15 @@ class Distributor:
         self.client = client
         self._add_ops_for_client_connect(client)
 
-    def _add_ops_for_client_connect(self, client):
+    def _get_create_order(self, client):
         node_gen = client.get_objects_in_view_gen()
         parents_gen_fn = lambda obj: obj.get_create_after_objs()
-        create_order = topological_sort(node_gen, parents_gen_fn)
-        for obj in create_order:
+        return topological_sort(node_gen, parents_gen_fn)
+
+    def _add_ops_for_client_connect(self, client):
+        for obj in self._get_create_order(client):
             create_op = obj.get_create_op()
-            while create_op is not None:
+            if create_op is not None:
                 self.journal.add(obj, create_op)
 
     def remove_client(self, client):
@@ -200,6 +320,34 @@ class Distributor:
         self.process()
         self.client = None
 
+    def add_observer_client(self, client, manager_ids=None):
+        if client is self.client or client in self._observer_clients:
+            raise ValueError('Client is already registered')
+        self.process()
+        logger.info('Adding observer {0}', client)
+        if manager_ids is not None:
+            manager_ids = frozenset(manager_ids) | {MGR_UNMANAGED}
+        create_ops = []
+        for obj in self._get_create_order(client):
+            if manager_ids is not None and obj.manager.id not in manager_ids:
+                continue
+            create_op = obj.get_create_op()
+            if create_op is not None:
+                create_ops.append(self.journal._build_journal_entry(obj, create_op))
+        self._observer_clients[client] = manager_ids
+        if create_ops:
+            self._send_encoded_view_update(client, EncodedViewUpdate.encode(create_ops), manager_ids)
+            self._queue_archive(create_ops, ((client, manager_ids),))
+
+    def remove_observer_client(self, client):
+        logger.info('Removing observer {0}', client)
+        self.process()
+        self._observer_clients.pop(client, None)
+
+    @property
+    def observer_clients(self):
+        return tuple(self._observer_clients)
+
     def _debug_validate_op(self, obj, op):
         objs = getattr(obj, 'client_objects_gen', None)
         if objs:
@@ -211,8 +359,8 @@ class Distributor:
             if not (getattr(obj, 'valid_for_distribution', True) or getattr(op, 'is_create_op', False)):
                 logger.error('Operation is being added for {}, but it is not valid_for_distribution. Operation type: {}. This will result in errors in client state.', obj, op)
 
-    def add_op(self, obj, op):
-        self.journal.add(obj, op)
+    def add_op(self, obj, op, coalesce_key=None):
+        self.journal.add(obj, op, coalesce_key=coalesce_key)
 
     def add_op_with_no_owner(self, op):
         self.journal.add(None, op)
@@ -228,6 +376,8 @@ class Distributor:
     def process(self):
         self.process_events()
         self._send_view_updates()
+        if self._pending_archive:
+            self._archive_sent_ops()
 
     def process_events(self):
         for (msg_id, msg) in self.events:
@@ -237,39 +387,55 @@ class Distributor:
     def _send_view_updates(self):
         journal = self.journal
         if journal.entries:
-            ops = list(journal.entries)
+            ops_coalesced = journal.coalesced_op_count
+            (ops, bytes_saved) = journal.build_entries()
             journal.clear()
+            self._update_coalescing_stats(len(ops), ops_coalesced, bytes_saved)
             try:
-                while self.client is not None:
-                    self._send_view_updates_for_client(self.client, ops)
+                self._send_view_updates_to_clients(ops)
             except:
                 logger.exception('Error sending view updates to client!')
         self._pending_creates.clear()
 
-    def _send_view_updates_for_client(self, client, all_ops):
-        global _send_index
-        view_update = None
-        last_obj_id = None
-        last_manager_id = None
-        for (obj_id, operation, manager_id, obj_name) in all_ops:
-            if view_update is None:
-                view_update = protocols.ViewUpdate()
-            if obj_id != last_obj_id or manager_id != last_manager_id:
-                if _distributor_log_enabled:
-                    logger.error('    Object: {}', obj_name or obj_id)
-                entry = view_update.entries.add()
-                entry.primary_channel.id.manager_id = manager_id
-                entry.primary_channel.id.object_id = obj_id
-                last_obj_id = obj_id
-                last_manager_id = manager_id
-            entry.operation_list.operations.append(operation)
-            while gsi_handlers.distributor_handlers.archiver.enabled:
-                _send_index += 1
-                if _send_index >= 4294967295:
-                    _send_index = 0
-                archive_operation(obj_id, obj_name, manager_id, operation, _send_index, client)
-        if view_update is not None:
-            client.send_message(MSG_OBJECTS_VIEW_UPDATE, view_update)
+    def _update_coalescing_stats(self, ops_sent, ops_coalesced, bytes_saved):
+        self.last_coalescing_stats = CoalescingStats(ops_sent, ops_coalesced, bytes_saved)
+        total = self.total_coalescing_stats
+        self.total_coalescing_stats = CoalescingStats(total.ops_sent + ops_sent, total.ops_coalesced + ops_coalesced, total.bytes_saved + bytes_saved)
+
+    def _get_clients_and_filters(self):
+        if self.client is not None:
+            yield (self.client, None)
+        yield from self._observer_clients.items()
+
+    def _send_view_updates_to_clients(self, all_ops):
+        clients = tuple(self._get_clients_and_filters())
+        if not clients:
+            return
+        encoded_view_update = EncodedViewUpdate.encode(all_ops)
+        for (client, manager_ids) in clients:
+            self._send_encoded_view_update(client, encoded_view_update, manager_ids)
+        self._queue_archive(all_ops, clients)
+
+    def _send_encoded_view_update(self, client, encoded_view_update, manager_ids):
+        buffer = encoded_view_update.get_buffer(manager_ids)
+        if buffer:
+            client.send_serialized_message(MSG_OBJECTS_VIEW_UPDATE, buffer)
             if _distributor_log_enabled:
                 logger.error('------- SENT --------')
 
+    def _queue_archive(self, all_ops, clients):
+        if gsi_handlers.distributor_handlers.archiver.enabled:
+            self._pending_archive.append((all_ops, clients))
+
+    def _archive_sent_ops(self):
+        global _send_index
+        for (all_ops, clients) in self._pending_archive:
+            for (client, manager_ids) in clients:
+                for (obj_id, operation, manager_id, obj_name) in all_ops:
+                    if manager_ids is not None and manager_id not in manager_ids:
+                        continue
+                    _send_index += 1
+                    if _send_index >= 4294967295:
+                        _send_index = 0
+                    archive_operation(obj_id, obj_name, manager_id, operation, _send_index, client)
+        del self._pending_archive[:]
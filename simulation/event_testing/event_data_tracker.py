@@ -1,16 +1,70 @@
-from collections import namedtuple
+from collections import namedtuple, defaultdict
 from date_and_time import TimeSpan, DateAndTime
 from event_testing.event_data_const import TimeData
 from event_testing.event_data_object import EventDataObject
 from event_testing.resolver import DataResolver
 from event_testing.results import TestResultNumeric
+from event_testing.test_events import TestEvent
 from gsi_handlers.achievement_handlers import archiver
 import alarms
 import services
+import sims4.callback_utils
 import sims4.log
 logger = sims4.log.Logger('Event Data Tracker')
 ObjectiveUpdateInfo = namedtuple('ObjectiveUpdateInfo', ['current_value', 'objective_value', 'is_money', 'from_init'])
 
+class _ObjectiveEventIndex:
+    __qualname__ = '_ObjectiveEventIndex'
+    __slots__ = ('_keyed_objectives', '_unregistered_objectives', '_always_tested_objectives')
+
+    def __init__(self, objectives):
+        keyed_objectives = defaultdict(set)
+        unregistered_objectives = defaultdict(set)
+        always_tested_objectives = set()
+        for objective in objectives:
+            objective_test = objective.objective_test
+            registered_events = set()
+            for test_event in objective_test.get_test_events_to_register():
+                keyed_objectives[(test_event, None)].add(objective)
+                registered_events.add(test_event)
+            for (test_event, custom_key) in objective_test.get_custom_event_registration_keys():
+                keyed_objectives[(test_event, custom_key)].add(objective)
+                registered_events.add(test_event)
+            for test_event in objective_test.test_events:
+                if test_event not in registered_events:
+                    unregistered_objectives[test_event].add(objective)
+                    registered_events.add(test_event)
+            if not registered_events:
+                always_tested_objectives.add(objective)
+        self._keyed_objectives = dict(keyed_objectives)
+        self._unregistered_objectives = dict(unregistered_objectives)
+        self._always_tested_objectives = frozenset(always_tested_objectives)
+
+    def get_objectives(self, event, custom_keys):
+        objectives = set(self._always_tested_objectives)
+        objectives.update(self._unregistered_objectives.get(event, ()))
+        keyed_objectives = self._keyed_objectives
+        objectives.update(keyed_objectives.get((event, None), ()))
+        for custom_key in custom_keys:
+            objectives.update(keyed_objectives.get((event, custom_key), ()))
+        return objectives
+
+_objective_event_indexes = {}
+
+def purge_cache():
+    _objective_event_indexes.clear()
+
+sims4.callback_utils.add_callbacks(sims4.callback_utils.CallbackEvent.TUNING_CODE_RELOAD, purge_cache)
+
+def _get_objectives_for_event(milestone, event, resolver):
+    custom_keys = getattr(resolver, 'custom_keys', None)
+    if custom_keys is None or event == TestEvent.UpdateObjectiveData:
+        return
+    index = _objective_event_indexes.get(milestone)
+    if index is None:
+        index = _objective_event_indexes[milestone] = _ObjectiveEventIndex(milestone.objectives)
+    return index.get_objectives(event, custom_keys)
+
 class EventDataTracker:
     __qualname__ = 'EventDataTracker'
     TIME_DATA_UPDATE_RATE = 60000
@@ -50,9 +104,12 @@ class EventDataTracker:
             milestone_process_data = []
         if not self.milestone_completed(milestone.guid64):
             objectives_completed = 0
+            objectives_for_event = _get_objectives_for_event(milestone, event, resolver)
             for objective in milestone.objectives:
                 milestone_event_data = None
                 if not self.objective_completed(objective.guid64):
+                    if objectives_for_event is not None and objective not in objectives_for_event:
+                        continue
                     if log_enabled:
                         milestone_event_data = self.gsi_event_data(milestone, objective, True, 'Objective Completed')
                     if self._should_handle_objective(milestone, objective, resolver):
@@ -73,7 +130,7 @@ class EventDataTracker:
                     if resolver.on_zone_load:
                         goal_value = objective.goal_value()
                         self.update_objective(objective.guid64, goal_value, goal_value, objective.is_goal_value_money)
-                while log_enabled and milestone_event_data is not None:
+                if log_enabled and milestone_event_data is not None:
                     milestone_process_data.append(milestone_event_data)
             if objectives_completed >= self.required_completion_count(milestone):
                 self.complete_milestone(milestone, resolver.sim_info)
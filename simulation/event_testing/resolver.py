@@ -10,6 +10,8 @@ logger = sims4.log.Logger('Resolver')
 with sims4.reload.protected(globals()):
     RESOLVER_PARTICIPANT = 'resolver'
     test_profile = None
+SINGLE_PARTICIPANT_TYPES = frozenset((ParticipantType.Affordance, ParticipantType.InteractionContext, event_testing.test_events.FROM_DATA_OBJECT, event_testing.test_events.OBJECTIVE_GUID64, event_testing.test_events.FROM_EVENT_DATA))
+UNMEMOIZED_PARTICIPANT_TYPES = frozenset((event_testing.test_events.FROM_DATA_OBJECT, event_testing.test_events.OBJECTIVE_GUID64, event_testing.test_events.FROM_EVENT_DATA))
 
 class Resolver:
     __qualname__ = 'Resolver'
@@ -17,6 +19,8 @@ class Resolver:
     def __init__(self, skip_safe_tests=False, search_for_tooltip=False):
         self._skip_safe_tests = skip_safe_tests
         self._search_for_tooltip = search_for_tooltip
+        self._participant_memo = None
+        self._participant_memo_depth = 0
 
     @property
     def skip_safe_tests(self):
@@ -30,16 +34,36 @@ class Resolver:
     def interaction(self):
         pass
 
+    def begin_participant_memo(self):
+        if not self._participant_memo_depth:
+            self._participant_memo = {}
+        self._participant_memo_depth += 1
+
+    def end_participant_memo(self):
+        self._participant_memo_depth -= 1
+        if not self._participant_memo_depth:
+            self._participant_memo = None
+
+    def clear_participant_memo(self):
+        if self._participant_memo is not None:
+            self._participant_memo.clear()
+
     def get_resolved_args(self, expected):
         if expected is None:
             raise ValueError('Expected arguments from test instance get_expected_args are undefined: {}'.format(expected))
-        single_types = {ParticipantType.Affordance, ParticipantType.InteractionContext, event_testing.test_events.FROM_DATA_OBJECT, event_testing.test_events.OBJECTIVE_GUID64, event_testing.test_events.FROM_EVENT_DATA}
+        memo = self._participant_memo
         ret = {}
         for (event_key, participant_type) in expected.items():
-            if participant_type in single_types:
+            if memo is not None and participant_type not in UNMEMOIZED_PARTICIPANT_TYPES:
+                if participant_type in memo:
+                    ret[event_key] = memo[participant_type]
+                    continue
+            if participant_type in SINGLE_PARTICIPANT_TYPES:
                 value = self.get_participant(participant_type, event_key=event_key)
             else:
                 value = self.get_participants(participant_type, event_key=event_key)
+            if memo is not None and participant_type not in UNMEMOIZED_PARTICIPANT_TYPES:
+                memo[participant_type] = value
             ret[event_key] = value
         return ret
 
@@ -150,8 +174,8 @@ class InteractionResolver(Resolver):
         super().__init__(skip_safe_tests, search_for_tooltip)
         self.affordance = affordance
         self._interaction = interaction
-        self.target = interaction.target if target is DEFAULT else target
-        self.context = interaction.context if context is DEFAULT else context
+        self._target = interaction.target if target is DEFAULT else target
+        self._context = interaction.context if context is DEFAULT else context
         self.custom_sim = custom_sim
         self.super_interaction = super_interaction
         self.interaction_parameters = interaction_parameters
@@ -163,6 +187,24 @@ class InteractionResolver(Resolver):
     def interaction(self):
         return self._interaction
 
+    @property
+    def target(self):
+        return self._target
+
+    @target.setter
+    def target(self, value):
+        self._target = value
+        self.clear_participant_memo()
+
+    @property
+    def context(self):
+        return self._context
+
+    @context.setter
+    def context(self, value):
+        self._context = value
+        self.clear_participant_memo()
+
     @property
     def profile_metric_key(self):
         if self.affordance is None:
@@ -333,9 +375,10 @@ class DoubleSimResolver(SingleSimResolver):
 class DataResolver(Resolver):
     __qualname__ = 'DataResolver'
 
-    def __init__(self, sim_info, event_kwargs=None):
+    def __init__(self, sim_info, event_kwargs=None, custom_keys=()):
         super().__init__()
         self.sim_info = sim_info
+        self.custom_keys = custom_keys
         if event_kwargs is not None:
             self._interaction = event_kwargs.get('interaction', None)
             self.on_zone_load = event_kwargs.get('init', False)
@@ -251,7 +251,7 @@ class EventManager(Service):
             key = (event_type, custom_key)
             self._update_call_counter(key)
             handlers = self._test_event_callback_map.get(key)
-            while handlers:
+            if handlers:
                 original_handlers.update(handlers)
         key = (event_type, None)
         self._update_call_counter(key)
@@ -263,11 +263,11 @@ class EventManager(Service):
         if sim_info is None:
             resolver = None
         else:
-            resolver = event_testing.resolver.DataResolver(sim_info, event_kwargs=kwargs)
+            resolver = event_testing.resolver.DataResolver(sim_info, event_kwargs=kwargs, custom_keys=custom_keys)
         tests_for_event = tuple(original_handlers)
         for test in tests_for_event:
             try:
-                while test in original_handlers:
+                if test in original_handlers:
                     test.handle_event(sim_info, event_type, resolver)
             except Exception as e:
                 logger.exception('Exception raised while trying to run a test event in test_events.py:', exc=e)
@@ -56,11 +56,12 @@ class CompoundTestList(list):
             for test in test_group:
                 if test is None:
                     logger.error('Tuning Error: A None value was detected in a tunable test for {}', resolver)
+                    continue
                 if skip_safe_tests and test.safe_to_skip:
-                    pass
+                    continue
                 result &= resolver(test)
                 if result:
-                    pass
+                    continue
                 if group_result:
                     group_result = result
                 if not search_for_tooltip:
@@ -72,12 +73,16 @@ class CompoundTestList(list):
                     break
             if failed_result is not None:
                 group_result = failed_result
-            while result:
+            if result:
                 return result
         return group_result
 
     def run_tests(self, resolver, skip_safe_tests=False, search_for_tooltip=False):
-        return self._run_method_over_tests(resolver, skip_safe_tests, search_for_tooltip)
+        resolver.begin_participant_memo()
+        try:
+            return self._run_method_over_tests(resolver, skip_safe_tests, search_for_tooltip)
+        finally:
+            resolver.end_participant_memo()
 
     def can_make_pass(self, resolver, skip_safe_tests=False, search_for_tooltip=False):
         return self._run_method_over_tests(resolver.can_make_pass, skip_safe_tests, False)
@@ -133,11 +138,12 @@ class TestList(list):
         for test in self:
             if test is None:
                 logger.error('Tuning Error: A None value was detected in a tunable test for {}', resolver, test)
+                continue
             if skip_safe_tests and test.safe_to_skip:
-                pass
+                continue
             result &= resolver(test)
             if result:
-                pass
+                continue
             if not search_for_tooltip:
                 break
             if result.tooltip is not None:
@@ -150,7 +156,11 @@ class TestList(list):
         return result
 
     def run_tests(self, resolver, skip_safe_tests=False, search_for_tooltip=False):
-        return self._run_method_over_tests(resolver, skip_safe_tests, search_for_tooltip)
+        resolver.begin_participant_memo()
+        try:
+            return self._run_method_over_tests(resolver, skip_safe_tests, search_for_tooltip)
+        finally:
+            resolver.end_participant_memo()
 
     def can_make_pass(self, resolver, skip_safe_tests=False, search_for_tooltip=False):
         return self._run_method_over_tests(resolver.can_make_pass, skip_safe_tests, search_for_tooltip)
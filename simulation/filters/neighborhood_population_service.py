@@ -1,3 +1,4 @@
+import collections
 import operator
 import random
 from distributor.rollback import ProtocolBufferRollback
@@ -12,6 +13,7 @@ import elements
 import services
 import sims4.log
 logger = sims4.log.Logger('NeighborhoodPopulation')
+HouseholdPlacementData = collections.namedtuple('HouseholdPlacementData', ('num_sims', 'has_married_sims', 'has_kids', 'relationship_weight'))
 
 class _NeighborhoodPopulationServiceRequstMixin:
     __qualname__ = '_NeighborhoodPopulationServiceRequstMixin'
@@ -96,47 +98,29 @@ class _FillZonePopulationRequest(_BasePopulationRequest):
         return False
 
     def _get_available_households(self, total_beds, lot_has_double_beds, lot_has_kid_beds):
-        household_manager = services.household_manager()
+        placement_index = services.neighborhood_population_service().household_placement_index
+        placement_index.refresh()
+        nums_sims_to_weight_bonus = NeighborhoodPopulationService.NUM_BEDS_TO_IDEAL_HOUSEHOLD_CURVE.get(total_beds)
         weighted_households = []
-        for household in tuple(household_manager.values()):
+        for household in tuple(services.household_manager().values()):
             if not household.is_persistent_npc:
-                pass
+                continue
             if household.home_zone_id:
-                pass
-            num_sims = len(household)
-            if not num_sims:
-                pass
-            nums_sims_to_weight_bonus = NeighborhoodPopulationService.NUM_BEDS_TO_IDEAL_HOUSEHOLD_CURVE.get(total_beds)
+                continue
+            if not len(household):
+                continue
+            placement_data = placement_index.get_placement_data(household)
             if nums_sims_to_weight_bonus is not None:
-                weight = nums_sims_to_weight_bonus.get(num_sims)
+                weight = nums_sims_to_weight_bonus.get(placement_data.num_sims)
             else:
                 weight = 1
             if weight <= 0:
-                pass
-            household_has_married_sims = False
-            household_has_kids = False
-            total_household_relationship_weight = 0
-            sim_info_manager = services.sim_info_manager()
-            for sim_info in household:
-                if lot_has_double_beds:
-                    spouse_sim_id = sim_info.spouse_sim_id
-                    if not spouse_sim_id and household.get_sim_info_by_id(spouse_sim_id):
-                        household_has_married_sims = True
-                if lot_has_kid_beds and sim_info.age <= Age.TEEN:
-                    household_has_kids = True
-                total_sim_info_weight = 0
-                for relationship in sim_info.relationship_tracker:
-                    target_sim_info = sim_info_manager.get(relationship.target_sim_id)
-                    while target_sim_info is not None and target_sim_info.household is not None and not target_sim_info.household.is_persistent_npc:
-                        total_sim_info_weight = relationship.depth*self.RELATIONSHIP_DEPTH_WEIGHT
-                        total_sim_info_weight += len(relationship.bit_track_tracker)*self.RELATIONSHIP_TRACK_MULTIPLIER
-                total_household_relationship_weight += total_sim_info_weight
-            total_household_relationship_weight /= num_sims
+                continue
             if self.RELATIONSHIP_UTILITY_CURVE is not None:
-                weight *= self.RELATIONSHIP_UTILITY_CURVE.get(total_household_relationship_weight)
-            if household_has_kids:
+                weight *= self.RELATIONSHIP_UTILITY_CURVE.get(placement_data.relationship_weight)
+            if lot_has_kid_beds and placement_data.has_kids:
                 weight *= NeighborhoodPopulationService.KID_TO_KID_BED_MULTIPLIER
-            if household_has_married_sims:
+            if lot_has_double_beds and placement_data.has_married_sims:
                 weight *= NeighborhoodPopulationService.SIGNIFICANT_OTHER_MULTIPLIER
             weighted_households.append((weight, household.id))
         return weighted_households
@@ -167,33 +151,82 @@ class _FillZonePopulationRequest(_BasePopulationRequest):
         if not (household_population_data or self._try_existing_households):
             logger.debug('There is no HouseholdPopulationRegionData for region: {}', neighborhood_proto.region_id)
             return
-        while self._num_to_fill > 0:
-            while self._available_zone_ids:
-                zone_id = self._available_zone_ids.pop(random.randint(0, len(self._available_zone_ids) - 1))
-                templates_and_bed_data = self._get_household_templates_and_bed_data(zone_id, household_population_data)
-                (household_templates, total_beds, lot_has_double_bed, lot_has_kid_bed) = templates_and_bed_data
-                if total_beds <= 0:
-                    continue
-                moved_household_into_zone = False
-                if self._try_existing_households:
-                    weighted_households = self._get_available_households(total_beds, lot_has_double_bed, lot_has_kid_bed)
-                    if household_templates:
-                        ideal_household_curve = NeighborhoodPopulationService.NUM_BEDS_TO_IDEAL_HOUSEHOLD_CURVE.get(total_beds, None)
-                        if ideal_household_curve is not None:
-                            ideal_household_weight = next(iter(sorted(ideal_household_curve.points, key=operator.itemgetter(1), reverse=True)))
-                            weighted_households.append((ideal_household_weight[1], GENERATE_HOUSEHOLD_ID))
-                    if weighted_households:
-                        household_id = sims4.random.weighted_random_item(weighted_households)
-                        if household_id != GENERATE_HOUSEHOLD_ID:
-                            household = services.household_manager().get(household_id)
-                            if household is not None:
-                                self._move_household_into_zone(household, neighborhood_proto, zone_id)
-                                moved_household_into_zone = True
-                if not moved_household_into_zone and household_templates:
-                    moved_household_into_zone = self._add_household_template_to_zone(household_templates, total_beds, lot_has_double_bed, lot_has_kid_bed, neighborhood_proto, zone_id)
-                if moved_household_into_zone:
-                    pass
-                yield element_utils.run_child(timeline, element_utils.sleep_until_next_tick_element())
+        while self._num_to_fill > 0 and self._available_zone_ids:
+            zone_id = self._available_zone_ids.pop(random.randint(0, len(self._available_zone_ids) - 1))
+            templates_and_bed_data = self._get_household_templates_and_bed_data(zone_id, household_population_data)
+            (household_templates, total_beds, lot_has_double_bed, lot_has_kid_bed) = templates_and_bed_data
+            if total_beds <= 0:
+                continue
+            moved_household_into_zone = False
+            if self._try_existing_households:
+                weighted_households = self._get_available_households(total_beds, lot_has_double_bed, lot_has_kid_bed)
+                if household_templates:
+                    ideal_household_curve = NeighborhoodPopulationService.NUM_BEDS_TO_IDEAL_HOUSEHOLD_CURVE.get(total_beds, None)
+                    if ideal_household_curve is not None:
+                        ideal_household_weight = next(iter(sorted(ideal_household_curve.points, key=operator.itemgetter(1), reverse=True)))
+                        weighted_households.append((ideal_household_weight[1], GENERATE_HOUSEHOLD_ID))
+                if weighted_households:
+                    household_id = sims4.random.weighted_random_item(weighted_households)
+                    if household_id != GENERATE_HOUSEHOLD_ID:
+                        household = services.household_manager().get(household_id)
+                        if household is not None:
+                            self._move_household_into_zone(household, neighborhood_proto, zone_id)
+                            moved_household_into_zone = True
+            if not moved_household_into_zone and household_templates:
+                moved_household_into_zone = self._add_household_template_to_zone(household_templates, total_beds, lot_has_double_bed, lot_has_kid_bed, neighborhood_proto, zone_id)
+            if moved_household_into_zone:
+                self._num_to_fill -= 1
+            yield element_utils.run_child(timeline, element_utils.sleep_until_next_tick_element())
+
+class _HouseholdPlacementIndex:
+    __qualname__ = '_HouseholdPlacementIndex'
+
+    def __init__(self):
+        self._entries = {}
+        self._played_sim_ids = frozenset()
+
+    def refresh(self):
+        household_manager = services.household_manager()
+        played_sim_ids = frozenset(sim_info.sim_id for household in household_manager.values() if not household.is_persistent_npc for sim_info in household)
+        if played_sim_ids != self._played_sim_ids:
+            self._played_sim_ids = played_sim_ids
+            self._entries.clear()
+            return
+        for household_id in tuple(self._entries):
+            if household_id not in household_manager:
+                del self._entries[household_id]
+
+    def clear(self):
+        self._entries.clear()
+        self._played_sim_ids = frozenset()
+
+    def get_placement_data(self, household):
+        cache_key = tuple((sim_info.sim_id, sim_info.age, sim_info.spouse_sim_id, sim_info.relationship_tracker.relationships_version) for sim_info in household)
+        entry = self._entries.get(household.id)
+        if entry is not None and entry[0] == cache_key:
+            return entry[1]
+        placement_data = self._build_placement_data(household)
+        self._entries[household.id] = (cache_key, placement_data)
+        return placement_data
+
+    def _build_placement_data(self, household):
+        num_sims = len(household)
+        has_married_sims = False
+        has_kids = False
+        total_relationship_weight = 0
+        for sim_info in household:
+            spouse_sim_id = sim_info.spouse_sim_id
+            if spouse_sim_id and household.get_sim_info_by_id(spouse_sim_id) is not None:
+                has_married_sims = True
+            if sim_info.age <= Age.TEEN:
+                has_kids = True
+            sim_info_relationship_weight = 0
+            for relationship in sim_info.relationship_tracker:
+                if relationship.target_sim_id in self._played_sim_ids:
+                    sim_info_relationship_weight = relationship.depth*_FillZonePopulationRequest.RELATIONSHIP_DEPTH_WEIGHT
+                    sim_info_relationship_weight += len(relationship.bit_track_tracker)*_FillZonePopulationRequest.RELATIONSHIP_TRACK_MULTIPLIER
+            total_relationship_weight += sim_info_relationship_weight
+        return HouseholdPlacementData(num_sims, has_married_sims, has_kids, total_relationship_weight/num_sims if num_sims else 0)
 
 class _CreateHomelessHouseholdRequest(_BasePopulationRequest):
     __qualname__ = '_CreateHomelessHouseholdRequest'
@@ -228,6 +261,14 @@ class NeighborhoodPopulationService(Service):
     def __init__(self):
         self._requests = []
         self._processing_element_handle = None
+        self._household_placement_index = _HouseholdPlacementIndex()
+
+    def stop(self):
+        self._household_placement_index.clear()
+
+    @property
+    def household_placement_index(self):
+        return self._household_placement_index
 
     def _process_population_request_gen(self, timeline):
         while self._requests:
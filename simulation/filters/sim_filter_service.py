@@ -226,12 +226,17 @@ class SimFilterService(Service):
         self._global_blacklist = collections.defaultdict(list)
 
     def update(self):
+        for _ in self.update_gen():
+            pass
+
+    def update_gen(self):
         try:
             while self._filter_requests:
                 current_request = self._filter_requests[0]
                 current_request.run()
-                while current_request.is_complete:
+                if current_request.is_complete and self._filter_requests and self._filter_requests[0] is current_request:
                     del self._filter_requests[0]
+                yield
         except Exception:
             logger.exception('Exception while updating the sim filter service..')
 
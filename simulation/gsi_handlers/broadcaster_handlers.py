@@ -21,7 +21,7 @@ def generate_broadcaster_data():
 
     def _get_broadcasters_gen():
         try:
-            broadcaster_service = services.current_zone().broadcaster_service
+            broadcaster_service = services.broadcaster_service()
             while broadcaster_service is not None:
                 for broadcaster in broadcaster_service.get_broadcasters_gen(inspect_only=True):
                     yield ('Active', broadcaster)
@@ -1,90 +1,168 @@
 import datetime
 import gzip
+import json
 import os.path
-import pickle
 from gsi_handlers.gsi_dump_handlers import archive_gsi_dump
+from zone_tick_scheduler import TickService
+import alarms
+import clock
 import services
+import sims4.gsi.archive
 import sims4.gsi.dispatcher
 import sims4.log
+import sims4.reload
 logger = sims4.log.Logger('GSI')
-GSI_DUMP_VERSION = 1
+GSI_DUMP_VERSION = 2
+DUMP_CHUNK_RECORDS = 200
+INCREMENTAL_DUMP_STEP_SECONDS = 0.1
+with sims4.reload.protected(globals()):
+    _incremental_dump = None
 
-def save_dump_to_location(location, filename=None, console_output=None, compress_file=True, error_str='Default'):
+def _get_dump_path(location, filename, compress_file):
     now = datetime.datetime.now()
     if filename is None:
         filename = '{}-{}-{}_{}h{}m{}s'.format(now.year, now.month, now.day, now.hour, now.minute, now.second)
-    filename_w_ext = '{}.gsidump'.format(filename)
-    filename_zip = '{}.gz'.format(filename_w_ext)
-    full_path = os.path.join(location, filename_w_ext)
-    full_zip_path = os.path.join(location, filename_zip)
+    extension = '.gsidump.gz' if compress_file else '.gsidump'
+    full_path = os.path.join(location, filename + extension)
     fail_count = 0
     while os.path.exists(full_path):
         fail_count += 1
-        filename_w_ext = '{}_{}.gsidump'.format(filename, fail_count)
-        full_path = os.path.join(location, filename_w_ext)
-    archive_gsi_dump(filename, error_str)
-    with open(full_path, mode='wb') as file:
-        pickle.dump({'version': GSI_DUMP_VERSION}, file, protocol=3)
-        for (entry, schema, entry_data) in get_dump_gen(console_output):
-            pickle.dump({'entry': entry, 'data': entry_data, 'schema': schema}, file, protocol=3)
+        full_path = os.path.join(location, '{}_{}{}'.format(filename, fail_count, extension))
+    return (filename, full_path)
+
+def _open_dump_file(full_path, compress_file):
     if compress_file:
-        with open(full_path, mode='rb') as file_in, gzip.open(full_zip_path, 'wb') as file_out:
-            file_out.writelines(file_in)
-        os.remove(full_path)
-        return full_zip_path
+        return gzip.open(full_path, 'wt', encoding='utf-8')
+    return open(full_path, 'w', encoding='utf-8')
+
+def save_dump_to_location(location, filename=None, console_output=None, compress_file=True, error_str='Default'):
+    (filename, full_path) = _get_dump_path(location, filename, compress_file)
+    archive_gsi_dump(filename, error_str)
+    with _open_dump_file(full_path, compress_file) as file:
+        for _ in write_dump_gen(file, console_output):
+            pass
     return full_path
 
-def get_dump_gen(console_output):
+def write_dump_gen(file, console_output=None):
+    file.write(json.dumps({'version': GSI_DUMP_VERSION}))
+    file.write('\n')
+    archive_paths = {type_name.strip('/'): type_name for type_name in sims4.gsi.archive.archive_data}
+    written_schemas = set()
+    for (entry, schema, zone_id, lines_gen) in _get_dump_entries_gen(archive_paths, console_output):
+        if entry not in written_schemas:
+            written_schemas.add(entry)
+            file.write(json.dumps({'entry': entry, 'schema': schema}))
+            file.write('\n')
+        line_count = 0
+        for line in lines_gen:
+            file.write(line)
+            file.write('\n')
+            line_count += 1
+            if line_count >= DUMP_CHUNK_RECORDS:
+                line_count = 0
+                yield
+        yield
+
+def _get_dump_entries_gen(archive_paths, console_output):
     GsiSchema = sims4.gsi.schema.GsiSchema
-    for zone_id in services._zone_manager:
+    for zone_id in list(services._zone_manager):
         zone = services.get_zone(zone_id)
         if zone is None or not zone.is_instantiated:
             logger.warn("[cgast] Trying to dump GSI Data for zone {} but it's not instantiated.", zone_id)
+            continue
         sim_info_manager = services.sim_info_manager(zone_id=zone_id)
-        sim_ids = set()
-        for sim_info in list(sim_info_manager.objects):
-            sim_ids.add(sim_info.sim_id)
-        for (entry, dispatch_data) in sims4.gsi.dispatcher.dispatch_table.items():
+        sim_ids = [sim_info.sim_id for sim_info in list(sim_info_manager.objects)]
+        for (entry, dispatch_data) in list(sims4.gsi.dispatcher.dispatch_table.items()):
             schema = dispatch_data[1]
             if schema is None:
-                pass
+                continue
             if isinstance(schema, GsiSchema):
                 schema = schema.output
-            if 'is_global_cheat' in schema and schema['is_global_cheat']:
-                pass
+            if schema.get('is_global_cheat'):
+                continue
             if entry == 'command':
-                pass
-            entry_data = []
-            if 'sim_specific' in schema and schema['sim_specific']:
+                continue
+            if entry in archive_paths:
+                yield (entry, schema, zone_id, _archive_lines_gen(entry, archive_paths[entry], zone_id))
+            elif schema.get('sim_specific'):
                 for sim_id in sim_ids:
-                    new_entry = _build_dump_entry(entry, schema, {'sim_id': sim_id, 'zone_id': zone_id})
-                    if new_entry is not None:
-                        entry_data.append(new_entry)
-                    else:
-                        while console_output is not None:
-                            try:
-                                console_output('Failed to collect data for {} on Sim ID {}'.format(entry, sim_id))
-                            except:
-                                pass
+                    yield (entry, schema, zone_id, _handler_lines_gen(entry, schema, {'sim_id': sim_id, 'zone_id': zone_id}, console_output))
             else:
-                new_entry = _build_dump_entry(entry, schema, {'zone_id': zone_id})
-                if new_entry is not None:
-                    entry_data.append(new_entry)
-                elif console_output is not None:
-                    try:
-                        console_output('Failed to collect data for {}'.format(entry))
-                    except:
-                        pass
-            yield (entry, schema, entry_data)
+                yield (entry, schema, zone_id, _handler_lines_gen(entry, schema, {'zone_id': zone_id}, console_output))
+
+def _archive_lines_gen(entry, type_name, zone_id):
+    encoded_entry = json.dumps(entry)
+    for record in sims4.gsi.archive.get_archive_records_gen(type_name, zone_id=zone_id):
+        yield '{{"entry": {}, "params": {}, "record": {}}}'.format(encoded_entry, json.dumps({'zone_id': zone_id, 'object_id': record.object_id}), record.uncompressed_json)
 
-def _build_dump_entry(entry, schema, params):
+def _handler_lines_gen(entry, schema, params, console_output):
+    response = _get_dump_response(entry, schema, params)
+    if response is not None:
+        yield json.dumps({'entry': entry, 'params': params, 'response': response})
+    elif console_output is not None:
+        try:
+            console_output('Failed to collect data for {} with {}'.format(entry, params))
+        except:
+            pass
+
+def _get_dump_response(entry, schema, params):
     string_params = {key: str(value) for (key, value) in params.items()}
     try:
-        response = sims4.gsi.dispatcher.handle_request(entry, string_params)
+        return sims4.gsi.dispatcher.handle_request(entry, string_params)
     except:
         logger.exception('Exception in handler: {}', schema)
-        response = None
-    if response is not None:
-        return {'params': params, 'response': response}
-    return
 
+class _IncrementalDump:
+    __qualname__ = '_IncrementalDump'
+
+    def __init__(self, file, full_path, console_output):
+        self.file = file
+        self.full_path = full_path
+        self.console_output = console_output
+        self.started = False
+        self.failed = False
+        self.complete = False
+
+    def write_gen(self):
+        if self.started:
+            self.failed = True
+            return
+        self.started = True
+        yield from write_dump_gen(self.file, self.console_output)
+        self.complete = True
+
+def start_incremental_dump(location, filename=None, console_output=None, compress_file=True, error_str='Default'):
+    global _incremental_dump
+    if _incremental_dump is not None:
+        return
+    (filename, full_path) = _get_dump_path(location, filename, compress_file)
+    archive_gsi_dump(filename, error_str)
+    dump = _IncrementalDump(_open_dump_file(full_path, compress_file), full_path, console_output)
+    alarm_handle = alarms.add_alarm_real_time(start_incremental_dump, clock.interval_in_real_seconds(INCREMENTAL_DUMP_STEP_SECONDS), _incremental_dump_step, repeating=True, use_sleep_time=False)
+    _incremental_dump = (dump, alarm_handle)
+    return full_path
+
+def _incremental_dump_step(_):
+    (dump, _) = _incremental_dump
+    services.current_zone().tick_scheduler.run_gen(TickService.GSI_DUMP, dump.write_gen)
+    if dump.complete or dump.failed:
+        stop_incremental_dump()
+        if dump.console_output is not None:
+            try:
+                if dump.complete:
+                    dump.console_output('Dump successfully written to {}'.format(dump.full_path))
+                else:
+                    dump.console_output('Dump to {} failed. See the log for the exception.'.format(dump.full_path))
+            except:
+                pass
+
+def stop_incremental_dump():
+    global _incremental_dump
+    if _incremental_dump is None:
+        return
+    (dump, alarm_handle) = _incremental_dump
+    _incremental_dump = None
+    alarms.cancel_alarm(alarm_handle)
+    if not dump.complete:
+        services.current_zone().tick_scheduler.cancel(TickService.GSI_DUMP)
+    dump.file.close()
@@ -0,0 +1,96 @@
+import argparse
+import collections
+import gzip
+import json
+import pickle
+import sys
+GsiDump = collections.namedtuple('GsiDump', ('version', 'schemas', 'data'))
+
+def _open_dump(path):
+    with open(path, 'rb') as file:
+        is_compressed = file.read(2) == b'\x1f\x8b'
+    if is_compressed:
+        return gzip.open(path, 'rb')
+    return open(path, 'rb')
+
+def _legacy_lines_gen(file):
+    header = pickle.load(file)
+    yield {'version': header.get('version', 1)}
+    while True:
+        try:
+            chunk = pickle.load(file)
+        except EOFError:
+            break
+        entry = chunk['entry']
+        yield {'entry': entry, 'schema': chunk['schema']}
+        for entry_data in chunk['data']:
+            yield {'entry': entry, 'params': entry_data['params'], 'response': entry_data['response']}
+
+def read_dump_gen(path, entries=None, zone_id=None, object_id=None):
+    with _open_dump(path) as file:
+        if file.peek(1)[:1] == b'{':
+            lines_gen = (json.loads(line.decode('utf-8')) for line in file if line.strip())
+        else:
+            lines_gen = _legacy_lines_gen(file)
+        for line in lines_gen:
+            entry = line.get('entry')
+            if entry is None:
+                yield line
+                continue
+            if entries is not None and entry not in entries:
+                continue
+            params = line.get('params')
+            if params is not None:
+                if zone_id is not None and params.get('zone_id') != zone_id:
+                    continue
+                if object_id is not None and params.get('object_id', params.get('sim_id')) != object_id:
+                    continue
+            yield line
+
+def load_dump(path, entries=None, zone_id=None, object_id=None):
+    version = None
+    schemas = {}
+    data = collections.defaultdict(list)
+    for line in read_dump_gen(path, entries=entries, zone_id=zone_id, object_id=object_id):
+        if 'version' in line:
+            version = line['version']
+        elif 'schema' in line:
+            schemas[line['entry']] = line['schema']
+        elif 'record' in line:
+            data[line['entry']].append(line['record'])
+        else:
+            response = line['response']
+            if isinstance(response, str):
+                try:
+                    response = json.loads(response)
+                except ValueError:
+                    pass
+            data[line['entry']].append({'params': line['params'], 'response': response})
+    return GsiDump(version, schemas, dict(data))
+
+def _parse_id(value):
+    return int(value, 0)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Read and filter a GSI dump written by gsi.dump.')
+    parser.add_argument('path')
+    parser.add_argument('--entry', action='append', dest='entries', help='Only include this GSI entry. May be given more than once.')
+    parser.add_argument('--zone', type=_parse_id, default=None)
+    parser.add_argument('--object', type=_parse_id, default=None, help='Only include records for this object or Sim id.')
+    parser.add_argument('--list', action='store_true', help='List the entries in the dump with their record counts.')
+    args = parser.parse_args(argv)
+    entries = set(args.entries) if args.entries else None
+    if args.list:
+        counts = collections.Counter()
+        for line in read_dump_gen(args.path, entries=entries, zone_id=args.zone, object_id=args.object):
+            if 'record' in line or 'response' in line:
+                counts[line['entry']] += 1
+        for (entry, count) in sorted(counts.items()):
+            sys.stdout.write('{:60} : {}\n'.format(entry, count))
+        return counts
+    for line in read_dump_gen(args.path, entries=entries, zone_id=args.zone, object_id=args.object):
+        if 'record' in line or 'response' in line:
+            sys.stdout.write(json.dumps(line) + '\n')
+
+if __name__ == '__main__':
+    main()
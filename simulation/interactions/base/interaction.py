@@ -1417,6 +1417,7 @@ class Interaction(HasTunableReference, metaclass=HashedTunedInstanceMetaclass, m
         self._pipeline_progress = PipelineProgress.NONE
         self._constraint_cache = WeakKeyDictionary()
         self._constraint_cache_final = WeakKeyDictionary()
+        self._constraints_version = 0
         self._target = None
         self.set_target(aop.target)
         self.carry_track = None
@@ -2025,9 +2026,14 @@ class Interaction(HasTunableReference, metaclass=HashedTunedInstanceMetaclass, m
                     arb_element = ArbElement(reaction_arb)
                     arb_element.distribute()
 
+    @property
+    def constraints_version(self):
+        return self._constraints_version
+
     def refresh_constraints(self):
         self._constraint_cache.clear()
         self._constraint_cache_final.clear()
+        self._constraints_version += 1
 
     def apply_posture_state(self, posture_state, participant_type=ParticipantType.Actor, sim=DEFAULT):
         if posture_state in self._constraint_cache_final:
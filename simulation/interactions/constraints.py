@@ -68,6 +68,10 @@ class ScoringFunctionBase:
     def get_combined_score(self, position, orientation, routing_surface):
         return (self.get_score(position, orientation, routing_surface), 0.0)
 
+    def get_combined_scores(self, positions, orientations, routing_surfaces):
+        get_combined_score = self.get_combined_score
+        return [get_combined_score(position, orientation, routing_surface) for (position, orientation, routing_surface) in zip(positions, orientations, routing_surfaces)]
+
     def get_posture_cost_attenuation(self, body_target):
         return 1.0
 
@@ -85,6 +89,10 @@ class ScoringFunctionNative(ScoringFunctionBase):
         score = self._c_scoring_function.get_score(position, routing_surface)
         return score
 
+    def get_combined_scores(self, positions, orientations, routing_surfaces):
+        get_score = self._c_scoring_function.get_score
+        return [(get_score(position, routing_surface), 0.0) for (position, routing_surface) in zip(positions, routing_surfaces)]
+
 class ConstraintScoringFunctionLinear(ScoringFunctionNative):
     __qualname__ = 'ConstraintScoringFunctionLinear'
 
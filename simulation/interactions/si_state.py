@@ -21,8 +21,23 @@ import role
 import scheduling
 import services
 import sims4.log
+import sims4.reload
 __all__ = ['SIState']
 logger = sims4.log.Logger('SIState')
+COMBINED_CONSTRAINT_CACHE_SIZE = 32
+with sims4.reload.protected(globals()):
+    _combined_constraint_cache_hits = 0
+    _combined_constraint_cache_misses = 0
+
+def get_combined_constraint_cache_stats():
+    total = _combined_constraint_cache_hits + _combined_constraint_cache_misses
+    hit_rate = _combined_constraint_cache_hits/total if total else 0
+    return (_combined_constraint_cache_hits, _combined_constraint_cache_misses, hit_rate)
+
+def reset_combined_constraint_cache_stats():
+    global _combined_constraint_cache_hits, _combined_constraint_cache_misses
+    _combined_constraint_cache_hits = 0
+    _combined_constraint_cache_misses = 0
 
 def can_priority_displace(priority_new, priority_existing, allow_clobbering=False):
     if priority_new is None:
@@ -197,6 +212,8 @@ class SIState:
         self._sim = sim.ref() if sim else None
         self._watchers = {}
         self._constraints = {}
+        self._version = 0
+        self._combined_constraint_cache = OrderedDict()
         self.on_changed = CallableList()
 
     @property
@@ -204,6 +221,10 @@ class SIState:
         if self._sim:
             return self._sim()
 
+    @property
+    def version(self):
+        return self._version
+
     def __contains__(self, key):
         return key in self._super_interactions
 
@@ -365,7 +386,29 @@ class SIState:
     def _get_must_include_sis(self, priority, group_id, existing_si=None):
         return set(si_mi for si_mi in self.all_guaranteed_si_gen(priority, group_id=group_id) if self._common_included_si_tests(si_mi) and (existing_si is None or existing_si.super_affordance_klobberers is None or not existing_si.super_affordance_klobberers(si_mi.affordance)))
 
+    def _get_si_phase_key(self, si):
+        return (id(si), si.pipeline_progress, si.priority, si.is_finishing, si.is_guaranteed(), si.has_active_cancel_replacement, si.constraints_version)
+
     def get_combined_constraint(self, existing_constraint=None, priority=None, group_id=None, to_exclude=None, include_inertial_sis=False, force_inertial_sis=False, existing_si=None, posture_state=DEFAULT, allow_posture_providers=True, include_existing_constraint=True, participant_type=ParticipantType.Actor):
+        global _combined_constraint_cache_hits, _combined_constraint_cache_misses
+        sim_posture_state = self.sim.posture_state
+        cache_refs = (existing_constraint, to_exclude, existing_si, posture_state, sim_posture_state)
+        existing_si_key = None if existing_si is None else (existing_si.group_id, existing_si.pipeline_progress, existing_si.constraints_version)
+        cache_key = (self._version, tuple(id(ref) for ref in cache_refs), existing_si_key, priority, group_id, include_inertial_sis, force_inertial_sis, allow_posture_providers, include_existing_constraint, participant_type, tuple(self._get_si_phase_key(si) for si in self._super_interactions))
+        cache_entry = self._combined_constraint_cache.get(cache_key)
+        if cache_entry is not None:
+            _combined_constraint_cache_hits += 1
+            self._combined_constraint_cache.move_to_end(cache_key)
+            (total_constraint, included_sis, _) = cache_entry
+            return (total_constraint, set(included_sis))
+        _combined_constraint_cache_misses += 1
+        (total_constraint, included_sis) = self._get_combined_constraint(existing_constraint, priority, group_id, to_exclude, include_inertial_sis, force_inertial_sis, existing_si, posture_state, allow_posture_providers, include_existing_constraint, participant_type)
+        self._combined_constraint_cache[cache_key] = (total_constraint, frozenset(included_sis), cache_refs)
+        if len(self._combined_constraint_cache) > COMBINED_CONSTRAINT_CACHE_SIZE:
+            self._combined_constraint_cache.popitem(last=False)
+        return (total_constraint, included_sis)
+
+    def _get_combined_constraint(self, existing_constraint, priority, group_id, to_exclude, include_inertial_sis, force_inertial_sis, existing_si, posture_state, allow_posture_providers, include_existing_constraint, participant_type):
         included_sis = set()
         if include_inertial_sis:
             if existing_si is not None and any(si.id == existing_si.continuation_id for si in self):
@@ -375,18 +418,18 @@ class SIState:
             if force_inertial_sis:
                 for si in self._super_interactions:
                     if si in sis_must_include:
-                        pass
+                        continue
                     if not allow_posture_providers and self.sim.posture_state.is_source_interaction(si):
-                        pass
+                        continue
                     if not self._common_included_si_tests(si):
-                        pass
+                        continue
                     sis_must_include.add(si)
             to_consider = set()
             for non_guaranteed_si in self._super_interactions:
                 if non_guaranteed_si in sis_must_include:
-                    pass
+                    continue
                 if not allow_posture_providers and self.sim.posture_state.is_source_interaction(non_guaranteed_si):
-                    pass
+                    continue
                 to_consider.add(non_guaranteed_si)
         else:
             sis_must_include = self._get_must_include_sis(priority, group_id, existing_si=existing_si)
@@ -396,11 +439,11 @@ class SIState:
             for si in sis_must_include:
                 owned_posture = self.sim.posture_state.get_source_or_owned_posture_for_si(si)
                 if owned_posture is None:
-                    pass
+                    continue
                 if owned_posture.track != postures.PostureTrack.BODY:
-                    pass
+                    continue
                 if owned_posture.source_interaction.is_finishing:
-                    pass
+                    continue
                 additional_posture_sis.add(owned_posture.source_interaction)
             sis_must_include.update(additional_posture_sis)
             additional_posture_sis.clear()
@@ -408,34 +451,35 @@ class SIState:
         included_carryables = set()
         for si_must_include in sis_must_include:
             if si_must_include.is_finishing:
-                pass
-            while not si_must_include is to_exclude:
-                if si_must_include is existing_si:
-                    pass
-                if existing_si is not None and existing_si.group_id == si_must_include.group_id:
-                    pass
-                my_role = si_must_include.get_participant_type(self.sim)
-                if existing_si is not None:
-                    existing_participant_type = existing_si.get_participant_type(self.sim)
-                    if not self.are_sis_compatible(si_must_include, existing_si, my_role, existing_participant_type, ignore_geometry=True):
-                        return (Nowhere(), sis_must_include)
-                si_constraint = si_must_include.constraint_intersection(participant_type=my_role, posture_state=posture_state)
-                if existing_si is not None:
-                    if (existing_si.should_rally or existing_si.relocate_main_group) and (si_must_include.is_social and si_must_include.social_group is not None) and si_must_include.social_group is si_must_include.sim.get_main_group():
-                        si_constraint = si_constraint.generate_posture_only_constraint()
-                    si_constraint = si_constraint.apply_posture_state(None, existing_si.get_constraint_resolver(None, participant_type=participant_type))
-                if existing_constraint is not None:
-                    si_constraint = si_constraint.apply(existing_constraint)
-                test_constraint = total_constraint.intersect(si_constraint)
-                if not test_constraint.valid:
-                    break
-                carry_target = si_must_include.targeted_carryable
-                if carry_target is not None:
-                    if len(included_carryables) == 2 and carry_target not in included_carryables:
-                        pass
-                    included_carryables.add(carry_target)
-                total_constraint = test_constraint
-                included_sis.add(si_must_include)
+                continue
+            if si_must_include is to_exclude:
+                continue
+            if si_must_include is existing_si:
+                continue
+            if existing_si is not None and existing_si.group_id == si_must_include.group_id:
+                continue
+            my_role = si_must_include.get_participant_type(self.sim)
+            if existing_si is not None:
+                existing_participant_type = existing_si.get_participant_type(self.sim)
+                if not self.are_sis_compatible(si_must_include, existing_si, my_role, existing_participant_type, ignore_geometry=True):
+                    return (Nowhere(), sis_must_include)
+            si_constraint = si_must_include.constraint_intersection(participant_type=my_role, posture_state=posture_state)
+            if existing_si is not None:
+                if (existing_si.should_rally or existing_si.relocate_main_group) and (si_must_include.is_social and si_must_include.social_group is not None) and si_must_include.social_group is si_must_include.sim.get_main_group():
+                    si_constraint = si_constraint.generate_posture_only_constraint()
+                si_constraint = si_constraint.apply_posture_state(None, existing_si.get_constraint_resolver(None, participant_type=participant_type))
+            if existing_constraint is not None:
+                si_constraint = si_constraint.apply(existing_constraint)
+            test_constraint = total_constraint.intersect(si_constraint)
+            if not test_constraint.valid:
+                break
+            carry_target = si_must_include.targeted_carryable
+            if carry_target is not None:
+                if len(included_carryables) == 2 and carry_target not in included_carryables:
+                    continue
+                included_carryables.add(carry_target)
+            total_constraint = test_constraint
+            included_sis.add(si_must_include)
         if len(included_carryables) == 2 and existing_si is not None:
             existing_carry_target = existing_si.carry_target or existing_si.target
             if existing_carry_target is not None and existing_carry_target.carryable_component is not None:
@@ -450,16 +494,16 @@ class SIState:
         if to_consider:
             for si in self._sis_sorted(to_consider):
                 if si is to_exclude:
-                    pass
+                    continue
                 if existing_si is not None and existing_si.group_id == si.group_id:
-                    pass
+                    continue
                 if not self._common_included_si_tests(si):
-                    pass
+                    continue
                 my_role = si.get_participant_type(self.sim)
                 if existing_si is not None:
                     existing_participant_type = existing_si.get_participant_type(self.sim)
                     if not self.are_sis_compatible(si, existing_si, my_role, existing_participant_type, ignore_geometry=True):
-                        pass
+                        continue
                 si_constraint = si.constraint_intersection(participant_type=my_role, posture_state=posture_state)
                 if existing_si is not None:
                     si_constraint = si_constraint.apply_posture_state(None, existing_si.get_constraint_resolver(None, participant_type=participant_type))
@@ -468,25 +512,21 @@ class SIState:
                 test_constraint = total_constraint.intersect(si_constraint)
                 if existing_constraint is not None:
                     test_constraint_plus_existing = test_constraint.intersect(existing_constraint)
-                    while not not test_constraint_plus_existing.valid:
-                        if test_constraint_plus_existing.tentative:
-                            pass
-                        test_constraint = test_constraint.apply(existing_constraint)
-                        if test_constraint.valid:
-                            total_constraint = test_constraint
-                            included_sis.add(si)
-                        while total_constraint.tentative:
-                            break
+                    if not test_constraint_plus_existing.valid:
+                        continue
+                    if test_constraint_plus_existing.tentative:
+                        continue
+                    test_constraint = test_constraint.apply(existing_constraint)
                 if test_constraint.valid:
                     total_constraint = test_constraint
                     included_sis.add(si)
-                while total_constraint.tentative:
+                if total_constraint.tentative:
                     break
         if allow_posture_providers:
             additional_posture_sis = set()
             for si in included_sis:
                 owned_posture = self.sim.posture_state.get_source_or_owned_posture_for_si(si)
-                while owned_posture is not None and owned_posture.source_interaction not in included_sis and owned_posture.track == postures.PostureTrack.BODY:
+                if owned_posture is not None and owned_posture.source_interaction not in included_sis and owned_posture.track == postures.PostureTrack.BODY:
                     additional_posture_sis.add(owned_posture.source_interaction)
             included_sis.update(additional_posture_sis)
         if include_existing_constraint and existing_constraint is not None:
@@ -608,9 +648,11 @@ class SIState:
             for interaction in super_interactions:
                 with consume_exceptions('SIState', 'Exception raised while clearing SIState:'):
                     interaction.on_reset()
-            while self._super_interactions:
+            if self._super_interactions:
                 logger.error('Super Interactions {} should be empty after a reset. List will be cleared.', self._super_interactions, owner='mduke')
                 self._super_interactions.clear()
+                self._version += 1
+                self._combined_constraint_cache.clear()
         finally:
             self._resetting = False
 
@@ -700,12 +742,14 @@ class SIState:
         return self._watchers.pop(handle)
 
     def notify_dirty(self):
+        self._version += 1
+        self._combined_constraint_cache.clear()
         for watcher in self._watchers.values():
             watcher(self)
 
     def save_interactions(self):
         interaction_save_state = gameplay_serialization.SuperInteractionSaveState()
-        sorted_sis = sorted(self._super_interactions, key=lambda si: return 0 if self.sim.posture_state.is_source_interaction(si) else 1)
+        sorted_sis = sorted(self._super_interactions, key=lambda si: 0 if self.sim.posture_state.is_source_interaction(si) else 1)
         for si in sorted_sis:
             if not si.saveable:
                 pass
@@ -31,6 +31,14 @@ class BuffComponent(objects.components.Component, component_name=objects.compone
     def __init__(self, owner):
         super().__init__(owner)
         self._active_buffs = {}
+        self._mood_weights = {}
+        self._changeable_mood_weights = {}
+        self._polarity_to_changeable_buffs = collections.defaultdict(list)
+        self._affordance_modifier_buffs = []
+        self._effective_skill_modifier_buffs = []
+        self._scoring_modifier_cache = {}
+        self._success_modifier_cache = {}
+        self._effective_skill_modifier_cache = {}
         self._get_next_handle_id = UniqueIdGenerator()
         self._success_chance_modification = 0
         self._active_mood = self.DEFAULT_MOOD
@@ -70,6 +78,7 @@ class BuffComponent(objects.components.Component, component_name=objects.compone
             self.remove_auto_update(buff_type)
             buff_entry.clean_up()
         self._active_buffs.clear()
+        self._clear_buff_index()
         self.on_mood_changed.clear()
         self.on_buff_added.clear()
         self.on_buff_removed.clear()
@@ -106,6 +115,7 @@ class BuffComponent(objects.components.Component, component_name=objects.compone
             buff = buff_type(self.owner, commodity_guid, replacing_buff, transition_into_buff_id)
             self._active_buffs[buff_type] = buff
             buff.on_add(self.load_in_progress)
+            self._index_buff(buff)
             self._update_chance_modifier()
             if update_mood:
                 self._update_current_mood()
@@ -141,10 +151,11 @@ class BuffComponent(objects.components.Component, component_name=objects.compone
     @objects.components.componentmethod
     def remove_buff(self, handle_id, update_mood=True, immediate=False, on_destroy=False):
         for (buff_type, buff_entry) in self._active_buffs.items():
-            while handle_id in buff_entry.handle_ids:
+            if handle_id in buff_entry.handle_ids:
                 should_remove = buff_entry.remove_handle(handle_id)
                 if should_remove:
                     del self._active_buffs[buff_type]
+                    self._unindex_buff(buff_entry)
                     buff_entry.on_remove(not self.load_in_progress and not on_destroy)
                     if not on_destroy:
                         if update_mood:
@@ -220,6 +231,7 @@ class BuffComponent(objects.components.Component, component_name=objects.compone
             elif buff_entry.buff_type in self._active_buffs:
                 buff_entry.on_remove(on_destroy)
                 del self._active_buffs[buff_entry.buff_type]
+                self._unindex_buff(buff_entry)
                 if not on_destroy:
                     self._update_chance_modifier()
                     self._update_current_mood()
@@ -251,16 +263,22 @@ class BuffComponent(objects.components.Component, component_name=objects.compone
 
     @objects.components.componentmethod
     def get_actor_scoring_modifier(self, affordance):
-        total = 0
-        for buff_entry in self._active_buffs.values():
-            total += buff_entry.effect_modification.get_affordance_scoring_modifier(affordance)
+        total = self._scoring_modifier_cache.get(affordance)
+        if total is None:
+            total = 0
+            for buff_entry in self._affordance_modifier_buffs:
+                total += buff_entry.effect_modification.get_affordance_scoring_modifier(affordance)
+            self._scoring_modifier_cache[affordance] = total
         return total
 
     @objects.components.componentmethod
     def get_actor_success_modifier(self, affordance):
-        total = 0
-        for buff_entry in self._active_buffs.values():
-            total += buff_entry.effect_modification.get_affordance_success_modifier(affordance)
+        total = self._success_modifier_cache.get(affordance)
+        if total is None:
+            total = 0
+            for buff_entry in self._affordance_modifier_buffs:
+                total += buff_entry.effect_modification.get_affordance_success_modifier(affordance)
+            self._success_modifier_cache[affordance] = total
         return total
 
     @objects.components.componentmethod
@@ -272,7 +290,7 @@ class BuffComponent(objects.components.Component, component_name=objects.compone
         param_name = self._active_mood.asm_param_name
         if param_name is not None:
             return param_name
-        (mood, _, _) = self._get_largest_mood(predicate=lambda mood: return True if mood.asm_param_name else False)
+        (mood, _, _) = self._get_largest_mood(predicate=lambda mood: True if mood.asm_param_name else False)
         return mood.asm_param_name
 
     @objects.components.componentmethod
@@ -285,18 +303,21 @@ class BuffComponent(objects.components.Component, component_name=objects.compone
             skill = self.owner.get_stat_instance(skill)
             if skill is None:
                 return 0
-        modifier = 0
-        for buff_entry in self._active_buffs.values():
-            modifier += buff_entry.effect_modification.get_effective_skill_modifier(skill)
+        modifier = self._effective_skill_modifier_cache.get(skill.skill_type)
+        if modifier is None:
+            modifier = 0
+            for buff_entry in self._effective_skill_modifier_buffs:
+                modifier += buff_entry.effect_modification.get_effective_skill_modifier(skill)
+            self._effective_skill_modifier_cache[skill.skill_type] = modifier
         return skill.get_user_value() + modifier
 
     @objects.components.componentmethod
     def effective_skill_modified_buff_gen(self, skill):
         if skill.stat_type == skill:
             skill = self.owner.get_stat_instance(skill)
-        for buff_entry in self._active_buffs.values():
+        for buff_entry in self._effective_skill_modifier_buffs:
             modifier = buff_entry.effect_modification.get_effective_skill_modifier(skill)
-            while modifier != 0:
+            if modifier != 0:
                 yield (buff_entry, modifier)
 
     @objects.components.componentmethod
@@ -392,32 +413,99 @@ class BuffComponent(objects.components.Component, component_name=objects.compone
                 negative_success_buff_delta *= 1 + buff_entry.get_success_modifier
         self._success_chance_modification = positive_success_buff_delta - (1 - negative_success_buff_delta)
 
+    def _index_buff(self, buff_entry):
+        mood = buff_entry.mood_type
+        if mood is not None and buff_entry.mood_weight != 0:
+            if buff_entry.is_changeable:
+                self._polarity_to_changeable_buffs[mood.buff_polarity].append(buff_entry)
+                self._changeable_mood_weights[mood] = self._changeable_mood_weights.get(mood, 0) + buff_entry.mood_weight
+            else:
+                self._mood_weights[mood] = self._mood_weights.get(mood, 0) + buff_entry.mood_weight
+        effect_modification = buff_entry.effect_modification
+        if effect_modification.has_affordance_modifiers:
+            self._affordance_modifier_buffs.append(buff_entry)
+            self._scoring_modifier_cache.clear()
+            self._success_modifier_cache.clear()
+        if effect_modification.has_effective_skill_modifiers:
+            self._effective_skill_modifier_buffs.append(buff_entry)
+            self._effective_skill_modifier_cache.clear()
+
+    def _unindex_buff(self, buff_entry):
+        mood = buff_entry.mood_type
+        if mood is not None and buff_entry.mood_weight != 0:
+            if buff_entry.is_changeable:
+                changeable_buffs = self._polarity_to_changeable_buffs[mood.buff_polarity]
+                if buff_entry in changeable_buffs:
+                    changeable_buffs.remove(buff_entry)
+                    if not changeable_buffs:
+                        del self._polarity_to_changeable_buffs[mood.buff_polarity]
+                    self._remove_mood_weight(self._changeable_mood_weights, mood, buff_entry.mood_weight)
+            else:
+                self._remove_mood_weight(self._mood_weights, mood, buff_entry.mood_weight)
+        if buff_entry in self._affordance_modifier_buffs:
+            self._affordance_modifier_buffs.remove(buff_entry)
+            self._scoring_modifier_cache.clear()
+            self._success_modifier_cache.clear()
+        if buff_entry in self._effective_skill_modifier_buffs:
+            self._effective_skill_modifier_buffs.remove(buff_entry)
+            self._effective_skill_modifier_cache.clear()
+
+    @staticmethod
+    def _remove_mood_weight(mood_weights, mood, weight):
+        total_weight = mood_weights.get(mood, 0) - weight
+        if total_weight != 0:
+            mood_weights[mood] = total_weight
+        else:
+            mood_weights.pop(mood, None)
+
+    def _clear_buff_index(self):
+        self._mood_weights.clear()
+        self._changeable_mood_weights.clear()
+        self._polarity_to_changeable_buffs.clear()
+        del self._affordance_modifier_buffs[:]
+        del self._effective_skill_modifier_buffs[:]
+        self._scoring_modifier_cache.clear()
+        self._success_modifier_cache.clear()
+        self._effective_skill_modifier_cache.clear()
+
     def _get_largest_mood(self, predicate=None, buffs_to_ignore=()):
+        if predicate is None and not buffs_to_ignore:
+            polarity_to_largest_mood_and_weight = {}
+            for (current_mood, total_current_weight) in self._mood_weights.items():
+                current_polarity = current_mood.buff_polarity
+                (largest_mood, largest_weight) = polarity_to_largest_mood_and_weight.get(current_polarity, (None, None))
+                if largest_mood is None or total_current_weight > largest_weight:
+                    polarity_to_largest_mood_and_weight[current_polarity] = (current_mood, total_current_weight)
+                elif total_current_weight == largest_weight:
+                    break
+            else:
+                result = self._choose_largest_mood(polarity_to_largest_mood_and_weight, self._polarity_to_changeable_buffs, allow_ties=False)
+                if result is not None:
+                    return result
         weights = {}
         polarity_to_changeable_buffs = collections.defaultdict(list)
         polarity_to_largest_mood_and_weight = {}
         for buff_entry in self._active_buffs.values():
             current_mood = buff_entry.mood_type
             current_weight = buff_entry.mood_weight
-            while not current_mood is None:
-                if current_weight == 0:
-                    pass
-                if not (predicate is not None and predicate(current_mood)):
-                    pass
-                if buff_entry in buffs_to_ignore:
-                    pass
-                current_polarity = current_mood.buff_polarity
-                if buff_entry.is_changeable:
-                    polarity_to_changeable_buffs[current_polarity].append(buff_entry)
-                total_current_weight = weights.get(current_mood, 0)
-                total_current_weight += current_weight
-                weights[current_mood] = total_current_weight
-                (largest_mood, largest_weight) = polarity_to_largest_mood_and_weight.get(current_polarity, (None, None))
-                if largest_mood is None:
-                    polarity_to_largest_mood_and_weight[current_polarity] = (current_mood, total_current_weight)
-                else:
-                    while total_current_weight > largest_weight:
-                        polarity_to_largest_mood_and_weight[current_polarity] = (current_mood, total_current_weight)
+            if current_mood is None or current_weight == 0:
+                continue
+            if predicate is not None and not predicate(current_mood):
+                continue
+            if buff_entry in buffs_to_ignore:
+                continue
+            current_polarity = current_mood.buff_polarity
+            if buff_entry.is_changeable:
+                polarity_to_changeable_buffs[current_polarity].append(buff_entry)
+                continue
+            total_current_weight = weights.get(current_mood, 0) + current_weight
+            weights[current_mood] = total_current_weight
+            (largest_mood, largest_weight) = polarity_to_largest_mood_and_weight.get(current_polarity, (None, None))
+            if largest_mood is None or total_current_weight > largest_weight:
+                polarity_to_largest_mood_and_weight[current_polarity] = (current_mood, total_current_weight)
+        return self._choose_largest_mood(polarity_to_largest_mood_and_weight, polarity_to_changeable_buffs)
+
+    def _choose_largest_mood(self, polarity_to_largest_mood_and_weight, polarity_to_changeable_buffs, allow_ties=True):
         all_changeable_buffs = []
         for (buff_polarity, changeable_buffs) in polarity_to_changeable_buffs.items():
             (largest_mood, largest_weight) = polarity_to_largest_mood_and_weight.get(buff_polarity, (None, None))
@@ -428,26 +516,26 @@ class BuffComponent(objects.components.Component, component_name=objects.compone
                     largest_weight += buff_entry.mood_weight
                 polarity_to_largest_mood_and_weight[buff_polarity] = (largest_mood, largest_weight)
             else:
-                weights = {}
+                changeable_weights = {}
                 largest_weight = 0
                 for buff_entry in changeable_buffs:
                     if buff_entry.mood_override is not None:
                         all_changeable_buffs.append((buff_entry, None))
                     current_mood = buff_entry.mood_type
-                    current_weight = buff_entry.mood_weight
-                    total_current_weight = weights.get(current_mood, 0)
-                    total_current_weight += current_weight
-                    weights[current_mood] = total_current_weight
-                    while total_current_weight > largest_weight:
+                    total_current_weight = changeable_weights.get(current_mood, 0) + buff_entry.mood_weight
+                    changeable_weights[current_mood] = total_current_weight
+                    if total_current_weight > largest_weight:
                         largest_weight = total_current_weight
                         largest_mood = current_mood
-                while largest_mood is not None and largest_weight != 0:
+                if largest_mood is not None and largest_weight != 0:
                     polarity_to_largest_mood_and_weight[buff_polarity] = (largest_mood, largest_weight)
         largest_weight = 0
         largest_mood = self.DEFAULT_MOOD
         active_mood = self._active_mood
         if polarity_to_largest_mood_and_weight:
             (mood, weight) = max(polarity_to_largest_mood_and_weight.values(), key=operator.itemgetter(1))
+            if not allow_ties and sum(1 for (_, polarity_weight) in polarity_to_largest_mood_and_weight.values() if polarity_weight == weight) > 1:
+                return
             if weight > largest_weight or weight == largest_weight and mood is active_mood:
                 largest_weight = weight
                 largest_mood = mood
@@ -493,7 +581,7 @@ class BuffComponent(objects.components.Component, component_name=objects.compone
         active_mood_intensity = self._active_mood_intensity
         if mood is active_mood:
             return intensity != active_mood_intensity
-        total_weight = sum(buff_entry.mood_weight for buff_entry in self._active_buffs.values() if buff_entry.mood_type is active_mood)
+        total_weight = self._mood_weights.get(active_mood, 0) + self._changeable_mood_weights.get(active_mood, 0)
         active_mood_intensity = self._get_intensity_from_mood(active_mood, total_weight)
         if changeable_buffs and not self._active_mood.is_changeable:
             buffs_to_ignore = [changeable_buff for (changeable_buff, _) in changeable_buffs]
@@ -57,6 +57,13 @@ class _InventoryComponent(Component):
             self._overflow_items = []
         self.inventory_manager = services.current_zone().inventory_manager
         self._inventory_state_triggers = []
+        self._definition_index = {}
+        self._stack_id_index = {}
+        self._stack_signatures = {}
+        self._stack_signature_index = {}
+        self._dirty_stack_signatures = {}
+        self._volatile_stack_signatures = {}
+        self._stack_signature_watchers = {}
 
     @property
     def inventory_value(self):
@@ -124,6 +131,95 @@ class _InventoryComponent(Component):
     def can_add(self, obj):
         return self._common_test(obj, error_on_failure=False)
 
+    def _index_item(self, obj, stackable=True):
+        self._definition_index.setdefault(obj.definition.id, {})[obj.id] = obj
+        self._stack_id_index.setdefault(obj.inventoryitem_component.get_stack_id(), {})[obj.id] = obj
+        if stackable:
+            self._dirty_stack_signatures[obj.id] = obj
+            statistic_component = obj.get_component(types.STATISTIC_COMPONENT)
+            if statistic_component is not None:
+                for tracker in statistic_component.get_all_stats_gen():
+                    self.watch_stack_signature_tracker(obj, tracker)
+
+    def _unindex_item(self, obj):
+        items = self._definition_index.get(obj.definition.id)
+        if items is not None and items.pop(obj.id, None) is not None and not items:
+            del self._definition_index[obj.definition.id]
+        stack_id = obj.inventoryitem_component.get_stack_id()
+        items = self._stack_id_index.get(stack_id)
+        if items is not None and items.pop(obj.id, None) is not None and not items:
+            del self._stack_id_index[stack_id]
+        self._release_stack_signature(obj)
+        self._dirty_stack_signatures.pop(obj.id, None)
+        for (tracker, handle) in self._stack_signature_watchers.pop(obj.id, ()):
+            if tracker.has_watcher(handle):
+                tracker.remove_watcher(handle)
+
+    def _clear_index(self):
+        self._definition_index.clear()
+        self._stack_id_index.clear()
+        self._stack_signatures.clear()
+        self._stack_signature_index.clear()
+        self._dirty_stack_signatures.clear()
+        self._volatile_stack_signatures.clear()
+        for watchers in self._stack_signature_watchers.values():
+            for (tracker, handle) in watchers:
+                if tracker.has_watcher(handle):
+                    tracker.remove_watcher(handle)
+        self._stack_signature_watchers.clear()
+
+    @staticmethod
+    def _get_stack_signature(obj):
+        obj_count = obj.stack_count()
+        obj.set_stack_count(1)
+        save_data = obj.get_attribute_save_data()
+        obj.set_stack_count(obj_count)
+        return save_data.SerializeToString()
+
+    @staticmethod
+    def _is_stack_signature_volatile(obj):
+        statistic_component = obj.get_component(types.STATISTIC_COMPONENT)
+        if statistic_component is None:
+            return False
+        for tracker in statistic_component.get_all_stats_gen():
+            for stat in tracker:
+                if stat.continuous and stat.persisted and stat.get_change_rate():
+                    return True
+        return False
+
+    def _release_stack_signature(self, obj):
+        self._volatile_stack_signatures.pop(obj.id, None)
+        signature = self._stack_signatures.pop(obj.id, None)
+        if signature is None:
+            return
+        items = self._stack_signature_index.get(signature)
+        if items is not None and items.pop(obj.id, None) is not None and not items:
+            del self._stack_signature_index[signature]
+
+    def _refresh_stack_signatures(self):
+        dirty_stack_signatures = self._dirty_stack_signatures
+        dirty_stack_signatures.update(self._volatile_stack_signatures)
+        self._dirty_stack_signatures = {}
+        for (obj_id, obj) in dirty_stack_signatures.items():
+            self._release_stack_signature(obj)
+            signature = self._get_stack_signature(obj)
+            self._stack_signatures[obj_id] = signature
+            self._stack_signature_index.setdefault(signature, {})[obj_id] = obj
+            if self._is_stack_signature_volatile(obj):
+                self._volatile_stack_signatures[obj_id] = obj
+
+    def invalidate_stack_signature(self, obj):
+        if obj.id in self._stack_signatures:
+            self._release_stack_signature(obj)
+            self._dirty_stack_signatures[obj.id] = obj
+
+    def watch_stack_signature_tracker(self, obj, tracker):
+        if obj.id not in self._stack_signatures and obj.id not in self._dirty_stack_signatures:
+            return
+        handle = tracker.add_watcher(lambda *_: self.invalidate_stack_signature(obj))
+        self._stack_signature_watchers.setdefault(obj.id, []).append((tracker, handle))
+        self.invalidate_stack_signature(obj)
+
     def _added(self, obj, send_ui=True, object_with_inventory=None):
         obj.inventoryitem_component.set_inventory_type(self._inventory_type, object_with_inventory)
         if obj.id in services.object_manager():
@@ -182,6 +278,7 @@ class _InventoryComponent(Component):
                 return True
         if self.max_size and len(self._inventory_items) < self.max_size:
             self._inventory_items[obj.id] = obj
+            self._index_item(obj)
             obj.item_location = self._get_default_item_location()
             if call_add:
                 self._added(obj, object_with_inventory=object_with_inventory)
@@ -189,29 +286,26 @@ class _InventoryComponent(Component):
         if use_overflow and self.max_overflow_size:
             if len(self._overflow_items) == self.max_overflow_size:
                 obj_to_destroy = self._overflow_items.pop(0)
+                self._unindex_item(obj_to_destroy)
                 logger.warn('Overflow inventory item being destroyed: {0}', obj_to_destroy)
                 obj_to_destroy.destroy(source=self.owner, cause='Overflow inventory item being destroyed.')
             self._overflow_items.append(obj)
+            self._index_item(obj)
             if call_add:
                 self._added(obj, object_with_inventory=object_with_inventory)
             return True
         return False
 
     def _find_matching_item(self, obj_to_match, object_with_inventory):
-        def_id = obj_to_match.definition.id
-        save_data = None
-        for obj in self:
-            while obj.definition.id == def_id:
-                if not save_data:
-                    obj_to_match.inventoryitem_component.set_inventory_type(self._inventory_type, object_with_inventory)
-                    save_data = obj_to_match.get_attribute_save_data()
-                    obj_to_match.inventoryitem_component.set_inventory_type(None, None)
-                obj_count = obj.stack_count()
-                obj.set_stack_count(obj_to_match.stack_count())
-                obj_save_data = obj.get_attribute_save_data()
-                obj.set_stack_count(obj_count)
-                if save_data == obj_save_data:
-                    return obj
+        if obj_to_match.definition.id not in self._definition_index:
+            return
+        self._refresh_stack_signatures()
+        obj_to_match.inventoryitem_component.set_inventory_type(self._inventory_type, object_with_inventory)
+        signature = self._get_stack_signature(obj_to_match)
+        obj_to_match.inventoryitem_component.set_inventory_type(None, None)
+        items = self._stack_signature_index.get(signature)
+        if items:
+            return next(iter(items.values()))
 
     def try_remove_object_by_id(self, obj_id, on_manager_remove=False, force_remove_stack=False):
         if self.max_size:
@@ -219,6 +313,7 @@ class _InventoryComponent(Component):
             if obj is not None:
                 in_stack = obj.stack_count() > 1
                 self._inventory_items.pop(obj_id)
+                self._unindex_item(obj)
                 obj.item_location = ItemLocation.ON_LOT
                 if not force_remove_stack and in_stack and not on_manager_remove:
                     self._try_stack_removal(obj)
@@ -234,6 +329,7 @@ class _InventoryComponent(Component):
                     if not force_remove_stack and self._try_stack_removal(obj):
                         return True
                     self._overflow_items.remove(obj)
+                    self._unindex_item(obj)
                     self._removed(obj, on_manager_remove=on_manager_remove)
                     return True
         return False
@@ -243,9 +339,11 @@ class _InventoryComponent(Component):
         new_count = obj.stack_count()
         new_obj.set_stack_count(new_count)
         old_obj_id = obj.id
+        self._unindex_item(obj)
         obj.destroy(source=self.owner, cause='Object being added to a stack')
         self._obj_stacked(new_obj, old_obj_id)
         self._inventory_items[new_obj.id] = new_obj
+        self._index_item(new_obj)
 
     def _try_stack_removal(self, obj):
         if obj.stack_count() > 1:
@@ -254,6 +352,7 @@ class _InventoryComponent(Component):
             obj.set_stack_count(1)
             self._obj_stacked(clone, obj.id)
             self._inventory_items[clone.id] = clone
+            self._index_item(clone)
             return True
         return False
 
@@ -265,12 +364,11 @@ class _InventoryComponent(Component):
             obj.destroy(source=self.owner, cause='Purging inventory')
 
     def try_destroy_object_by_definition(self, obj_def, source=None, cause=None):
-        for obj in self:
-            while obj.definition == obj_def:
-                if self.try_remove_object_by_id(obj.id):
-                    obj.destroy(source=source, cause=cause)
-                    return True
-                return False
+        for obj in self.get_items_with_definition_gen(obj_def):
+            if self.try_remove_object_by_id(obj.id):
+                obj.destroy(source=source, cause=cause)
+                return True
+            return False
         return False
 
     def try_destroy_object(self, obj, force_remove_stack=False, source=None, cause=None):
@@ -290,17 +388,21 @@ class _InventoryComponent(Component):
                     return obj
 
     def get_items_with_definition_gen(self, obj_def):
-        yield (obj for obj in self if obj.definition is obj_def)
+        items = self._definition_index.get(obj_def.id)
+        if items:
+            yield from tuple(obj for obj in items.values() if obj.definition is obj_def)
 
     def get_item_with_definition(self, obj_def):
         for obj in self.get_items_with_definition_gen(obj_def):
             pass
 
     def has_item_with_definition(self, obj_def):
-        return any(obj.definition is obj_def for obj in self)
+        for _ in self.get_items_with_definition_gen(obj_def):
+            return True
+        return False
 
     def get_count(self, obj_def):
-        return sum(obj.stack_count() for obj in self if obj.definition is obj_def)
+        return sum(obj.stack_count() for obj in self.get_items_with_definition_gen(obj_def))
 
     def get_item_quantity_by_definition(self, obj_def):
         return sum(obj.stack_count() for obj in self._inventory_items.values() if obj.definition is obj_def)
@@ -312,11 +414,7 @@ class _InventoryComponent(Component):
         return list(self.get_items_with_definition_gen(obj_def))
 
     def get_stack_items(self, stack_id):
-        items = []
-        for obj in self:
-            obj_stack_id = obj.inventoryitem_component.get_stack_id()
-            while obj_stack_id == stack_id:
-                items.append(obj)
+        items = list(self._stack_id_index.get(stack_id, {}).values())
         items.sort(key=lambda item: item.get_stack_sort_order())
         return items
 
@@ -460,10 +558,9 @@ class UniqueObjectInventoryComponent(_InventoryComponent, component_name=types.I
         self.load_items(object_data.unique_inventory)
 
     def get_items_with_definition_gen(self, obj_def, ignore_hidden=False):
-        if ignore_hidden:
-            yield (obj for obj in self._inventory_items.values() if obj.definition is obj_def)
-        else:
-            yield super().get_items_with_definition_gen(obj_def)
+        for obj in super().get_items_with_definition_gen(obj_def):
+            if not ignore_hidden or obj.id in self._inventory_items:
+                yield obj
 
     def get_item_with_definition(self, obj_def, ignore_hidden=False):
         for obj in self.get_items_with_definition_gen(obj_def, ignore_hidden):
@@ -472,6 +569,7 @@ class UniqueObjectInventoryComponent(_InventoryComponent, component_name=types.I
     def _insert_item(self, obj, use_overflow=False, call_add=False, object_with_inventory=None, try_find_matching_item=True, force_add_to_hidden_inventory=False):
         if force_add_to_hidden_inventory or obj.inventoryitem_component is not None and not obj.inventoryitem_component.visible:
             self._hidden_inventory_items[obj.id] = obj
+            self._index_item(obj, stackable=False)
             self._added(obj, send_ui=False, object_with_inventory=object_with_inventory)
             return True
         return super()._insert_item(obj, use_overflow, call_add, object_with_inventory, try_find_matching_item=try_find_matching_item)
@@ -487,6 +585,7 @@ class UniqueObjectInventoryComponent(_InventoryComponent, component_name=types.I
             return True
         item = self._hidden_inventory_items.pop(obj_id, None)
         if item is not None:
+            self._unindex_item(item)
             return True
         return False
 
@@ -554,6 +653,7 @@ class UniqueObjectInventoryComponent(_InventoryComponent, component_name=types.I
                 obj.inventoryitem_component.set_inventory_type(None, None)
                 reset_records.append(ResetRecord(obj, reset_reason, self, 'In inventory'))
             self._hidden_inventory_items.clear()
+            self._clear_index()
             if self.max_size:
                 self._inventory_items.clear()
             if self.max_overflow_size:
@@ -883,6 +983,12 @@ class ObjectInventoryComponent(GetPutComponentMixin, Component, component_name=t
     def push_inventory_item_update_msg(self, object_updated):
         return self._inventory.push_inventory_item_update_msg(object_updated)
 
+    def invalidate_stack_signature(self, obj):
+        self._inventory.invalidate_stack_signature(obj)
+
+    def watch_stack_signature_tracker(self, obj, tracker):
+        self._inventory.watch_stack_signature_tracker(obj, tracker)
+
     @componentmethod
     def inventory_view_update(self):
         self._inventory.inventory_view_update()
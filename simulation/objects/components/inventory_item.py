@@ -49,8 +49,10 @@ class InventoryItemComponent(Component, HasTunableFactory, AutoFactoryInit, comp
 
     def on_state_changed(self, state, old_value, new_value):
         inventory = self.get_inventory()
-        if inventory is not None and not inventory.owner.is_sim:
-            inventory.object_state_update_callback(old_value, new_value)
+        if inventory is not None:
+            inventory.invalidate_stack_signature(self.owner)
+            if not inventory.owner.is_sim:
+                inventory.object_state_update_callback(old_value, new_value)
         for state_info in InventoryItemComponent.STACK_SORT_ORDER_STATES:
             while state_info.state is state:
                 self._sort_order = None
@@ -58,6 +60,16 @@ class InventoryItemComponent(Component, HasTunableFactory, AutoFactoryInit, comp
                     inventory.push_inventory_item_update_msg(self.owner)
                 return
 
+    def invalidate_stack_signature(self):
+        inventory = self.get_inventory()
+        if inventory is not None:
+            inventory.invalidate_stack_signature(self.owner)
+
+    def on_statistic_tracker_created(self, tracker):
+        inventory = self.get_inventory()
+        if inventory is not None:
+            inventory.watch_stack_signature_tracker(self.owner, tracker)
+
     def post_component_reset(self):
         inventory = self.get_inventory()
         if inventory is not None:
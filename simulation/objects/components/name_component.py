@@ -79,6 +79,8 @@ class NameComponent(Component, HasTunableFactory, component_name=types.NAME_COMP
         if self.allow_name:
             self.owner.custom_name = name if name else None
             self._call_name_changed_callback()
+            if self.owner.inventoryitem_component is not None:
+                self.owner.inventoryitem_component.invalidate_stack_signature()
             if self.owner.update_object_tooltip() is None and isinstance(self.owner, ClientObjectMixin):
                 _set_recipe_name(self.owner, LocalizationHelperTuning.get_raw_text(name))
             return True
@@ -89,6 +91,8 @@ class NameComponent(Component, HasTunableFactory, component_name=types.NAME_COMP
         if self.allow_description:
             self.owner.custom_description = description if description else None
             self._call_name_changed_callback()
+            if self.owner.inventoryitem_component is not None:
+                self.owner.inventoryitem_component.invalidate_stack_signature()
             if self.owner.update_object_tooltip() is None and isinstance(self.owner, ClientObjectMixin):
                 _set_recipe_decription(self.owner, LocalizationHelperTuning.get_raw_text(description))
             return True
@@ -98,6 +98,7 @@ class StatisticComponent(Component, component_name=types.STATISTIC_COMPONENT, al
     def get_commodity_tracker(self):
         if self._commodity_tracker is None:
             self._commodity_tracker = statistics.commodity_tracker.CommodityTracker(self.owner)
+            self._on_tracker_created(self._commodity_tracker)
         return self._commodity_tracker
 
     def get_static_commodity_tracker(self):
@@ -105,6 +106,10 @@ class StatisticComponent(Component, component_name=types.STATISTIC_COMPONENT, al
             self._static_commodity_tracker = statistics.base_statistic_tracker.BaseStatisticTracker()
         return self._static_commodity_tracker
 
+    def _on_tracker_created(self, tracker):
+        if self.owner.inventoryitem_component is not None:
+            self.owner.inventoryitem_component.on_statistic_tracker_created(tracker)
+
     @componentmethod_with_fallback(lambda : ())
     def get_all_stats_gen(self):
         if self._statistic_tracker is not None:
@@ -121,6 +126,7 @@ class StatisticComponent(Component, component_name=types.STATISTIC_COMPONENT, al
     @componentmethod
     def create_statistic_tracker(self):
         self._statistic_tracker = statistics.statistic_tracker.StatisticTracker(self.owner)
+        self._on_tracker_created(self._statistic_tracker)
 
     @componentmethod
     def get_tracker(self, stat):
@@ -10,7 +10,17 @@ from sims4.utils import setdefault_callable
 import clock
 import services
 import sims4.log
+import sims4.reload
 logger = sims4.log.Logger('InUse')
+with sims4.reload.protected(globals()):
+    _use_list_version = 0
+
+def get_use_list_version():
+    return _use_list_version
+
+def _on_use_list_changed():
+    global _use_list_version
+    _use_list_version += 1
 
 class _CraftingLockoutData:
     __qualname__ = '_CraftingLockoutData'
@@ -201,6 +211,7 @@ class UseListMixin:
         use_list = self._reservations_multi if multi else self._reservations
         sim_list = setdefault_callable(use_list, sim, WeakSet)
         sim_list.add(owner)
+        _on_use_list_changed()
         self._use_list_changed_callbacks(user=sim, added=True)
 
     def release(self, sim, owner, multi=False):
@@ -209,6 +220,7 @@ class UseListMixin:
         sim_list.remove(owner)
         if not sim_list:
             del use_list[sim]
+        _on_use_list_changed()
         self._use_list_changed_callbacks(user=sim, added=False)
         self._destroy_if_necessary()
 
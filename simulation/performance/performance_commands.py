@@ -1,5 +1,6 @@
 from collections import Counter
 from clock import ClockSpeedMultiplierType, ClockSpeedMode
+from distributor.system import Distributor
 from gsi_handlers.performance_handlers import generate_statistics
 from server_commands.autonomy_commands import show_queue
 from server_commands.cache_commands import cache_status
@@ -141,3 +142,13 @@ def status(_connection=None):
     output('==ACC&BCC==')
     cache_status(_connection=_connection)
 
+
+@sims4.commands.Command('performance.distributor_coalescing', command_type=CommandType.Automation)
+def distributor_coalescing(_connection=None):
+    distributor = Distributor.instance()
+    output = sims4.commands.CheatOutput(_connection)
+    if distributor is None:
+        output('No distributor is running.')
+        return
+    for (name, stats) in (('Last Tick', distributor.last_coalescing_stats), ('Total', distributor.total_coalescing_stats)):
+        output('{:10} Ops Sent: {:8} Ops Coalesced: {:8} Bytes Saved: {:10}'.format(name, stats.ops_sent, stats.ops_coalesced, stats.bytes_saved))
@@ -1072,11 +1072,16 @@ class PostureGraph(dict):
     def __init__(self):
         self._subsets = defaultdict(set)
         self._quadtrees = defaultdict(sims4.geometry.QuadTree)
+        self._geometry_version = 0
 
     @property
     def nodes(self):
         return self.keys()
 
+    @property
+    def geometry_version(self):
+        return self._geometry_version
+
     def get_canonical_node(self, node):
         node_data = self.get(node)
         if node_data is None:
@@ -1088,6 +1093,7 @@ class PostureGraph(dict):
         if target is not None and target != PostureSpecVariable.ANYTHING and target.routing_surface is not None:
             floor = target.routing_surface.secondary_id
             self._quadtrees[floor].remove(node)
+        self._geometry_version += 1
         for key in self._get_subset_keys(node):
             self._subsets[key].remove(node)
             while not self._subsets[key]:
@@ -1101,6 +1107,7 @@ class PostureGraph(dict):
 
     def __missing__(self, node):
         self[node] = node_data = NodeData(node)
+        self._geometry_version += 1
         target = node.body_target or node.surface_target
         if target is not None and target != PostureSpecVariable.ANYTHING and target.routing_surface is not None:
             self.add_to_quadtree(target, (node,))
@@ -1115,6 +1122,7 @@ class PostureGraph(dict):
         quadtree = self._quadtrees[floor]
         for node in nodes:
             quadtree.remove(node)
+        self._geometry_version += 1
 
     def add_to_quadtree(self, obj, nodes=None):
         if nodes is None:
@@ -1125,6 +1133,7 @@ class PostureGraph(dict):
         quadtree = self._quadtrees[floor]
         for node in nodes:
             quadtree.insert(node, bounding_box)
+        self._geometry_version += 1
 
     def add_successor(self, node, successor):
         node = self.get_canonical_node(node)
@@ -1249,6 +1258,7 @@ class PostureGraph(dict):
         super().clear()
         self._subsets.clear()
         self._quadtrees.clear()
+        self._geometry_version += 1
 
     def __bool__(self):
         if self.nodes:
@@ -1294,6 +1304,7 @@ class PostureGraphService(Service):
         self._graph = PostureGraph()
         self._edge_info = {}
         self._goal_costs = {}
+        self._goal_cost_offset = 0
         self._zone_loaded = False
         self._disable_graph_update_count = 0
         self._incremental_update_count = None
@@ -1345,6 +1356,7 @@ class PostureGraphService(Service):
                 _cache_global_sim_default_values()
 
     def stop(self):
+        postures.posture_scoring.clear_scoring_caches()
         if not self._zone_loaded:
             return
         object_manager = services.object_manager()
@@ -1536,6 +1548,10 @@ class PostureGraphService(Service):
     def contains_node(self, node):
         return node in self._graph.nodes
 
+    @property
+    def geometry_version(self):
+        return self._graph.geometry_version
+
     def nodes_matching_constraint_geometry(self, constraint):
         return self._graph.nodes_matching_constraint_geometry(constraint)
 
@@ -1637,6 +1653,25 @@ class PostureGraphService(Service):
     def clear_goal_costs(self):
         self._get_goal_cost.cache.clear()
 
+    def get_goal_costs(self):
+        return (dict(self._goal_costs), self._goal_cost_offset)
+
+    def restore_goal_costs(self, goal_costs, goal_cost_offset):
+        self._goal_costs.clear()
+        self._goal_costs.update(goal_costs)
+        self._goal_cost_offset = goal_cost_offset
+        self.clear_goal_costs()
+
+    def merge_goal_costs(self, goal_costs, goal_cost_offset):
+        all_goal_costs = {goal_node: cost + goal_cost_offset for (goal_node, cost) in goal_costs.items()}
+        for (goal_node, cost) in self._goal_costs.items():
+            all_goal_costs[goal_node] = cost + self._goal_cost_offset
+        if not all_goal_costs:
+            self.restore_goal_costs({}, 0)
+            return
+        lowest_goal_cost = min(all_goal_costs.values())
+        self.restore_goal_costs({goal_node: cost - lowest_goal_cost for (goal_node, cost) in all_goal_costs.items()}, lowest_goal_cost)
+
     @caches.cached
     def _get_goal_cost(self, sim, interaction, constraint, var_map, dest):
         cost = self._goal_costs.get(dest, 0.0)
@@ -1762,6 +1797,41 @@ class PostureGraphService(Service):
             complete = None
         return (incomplete, complete)
 
+    def get_reusable_segmented_paths(self, sim, interaction, segmented_paths, valid_destination_test, valid_edge_test):
+        reusable_paths = []
+        invalid_constraints = set()
+        destination_nodes_by_constraint = {}
+        distance_estimators = {}
+        excluded_objects = interaction.excluded_posture_destination_objects()
+        for segmented_path in segmented_paths:
+            constraint = segmented_path.constraint
+            if constraint in invalid_constraints:
+                continue
+            if not segmented_path.check_validity(sim):
+                invalid_constraints.add(constraint)
+                continue
+            destination_nodes = destination_nodes_by_constraint.get(constraint)
+            if destination_nodes is None:
+                destination_nodes = {}
+                for (node, destination_specs) in segmented_path.destination_specs.items():
+                    if node not in self._graph.nodes:
+                        continue
+                    if node.body_target is not None and node.body_target in excluded_objects:
+                        continue
+                    if not destination_test(sim, node, destination_specs, segmented_path.var_map, valid_destination_test, interaction.affordance):
+                        continue
+                    destination_nodes[node] = destination_specs
+                destination_nodes_by_constraint[constraint] = destination_nodes
+            if not destination_nodes:
+                invalid_constraints.add(constraint)
+                continue
+            distance_estimator = distance_estimators.get(constraint)
+            if distance_estimator is None:
+                distance_estimator = DistanceEstimator(self, sim, interaction, constraint)
+                distance_estimators[constraint] = distance_estimator
+            reusable_paths.append(SegmentedPath(self, sim, segmented_path.source, destination_nodes, segmented_path.var_map, constraint, valid_edge_test, interaction, is_complete=segmented_path.is_complete, distance_estimator=distance_estimator))
+        return [segmented_path for segmented_path in reusable_paths if segmented_path.constraint not in invalid_constraints]
+
     def get_pickup_path(self, surface_target, interaction):
         cost_pickup = 0
         path_pickup = [STAND_AT_NONE]
@@ -1783,6 +1853,7 @@ class PostureGraphService(Service):
         possible_destinations = []
         all_segmented_paths = []
         self._goal_costs.clear()
+        self._goal_cost_offset = 0
         if gsi_handlers.posture_graph_handlers.archiver.enabled:
             gsi_templates = [(ds, vm, c) for (c, value) in posture_dest_list.items() for (ds, vm) in value]
             gsi_handlers.posture_graph_handlers.add_templates_to_gsi(sim, gsi_templates)
@@ -1877,6 +1948,7 @@ class PostureGraphService(Service):
             lowest_goal_cost = min(self._goal_costs.values())
             for (goal_node, cost) in self._goal_costs.items():
                 self._goal_costs[goal_node] = cost - lowest_goal_cost
+            self._goal_cost_offset = lowest_goal_cost
         if not all_segmented_paths:
             if not found_destination_node:
                 set_transition_failure_reason(sim, TransitionFailureReasons.NO_DESTINATION_NODE, transition_controller=interaction.transition)
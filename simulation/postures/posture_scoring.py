@@ -1,8 +1,11 @@
+from objects.mixins import get_use_list_version
 from postures.posture_specs import PostureSpecVariable, BODY_POSTURE_TYPE_INDEX, BODY_INDEX, BODY_TARGET_INDEX, SURFACE_INDEX, SURFACE_TARGET_INDEX
 from sims4.tuning.dynamic_enum import DynamicEnum
 from sims4.tuning.geometric import TunableCurve
 from sims4.tuning.tunable import Tunable, TunableFactory, TunableVariant, TunableTuple, TunableList, TunableEnumEntry
+from singletons import DEFAULT
 import accumulator
+import collections
 import gsi_handlers
 import interactions.constraints
 import postures
@@ -14,9 +17,67 @@ import socials.geometry
 with sims4.reload.protected(globals()):
 
     def final_destinations_gen():
-        pass
+        return ()
 
     on_transition_destinations_changed = sims4.callback_utils.CallableList()
+    _scoring_cache_version = None
+    _object_to_cluster_cache = (None, {})
+    _other_sim_scoring_cache = {}
+    _relationship_bonus_cache = {}
+    _goal_cost_cache = {}
+
+def _get_scoring_cache_version():
+    time_service = services.time_service()
+    if time_service is None:
+        return
+    return time_service.sim_now
+
+def _validate_scoring_caches():
+    global _scoring_cache_version
+    version = _get_scoring_cache_version()
+    if version is None:
+        clear_scoring_caches()
+        return False
+    if version != _scoring_cache_version:
+        clear_scoring_caches()
+        _scoring_cache_version = version
+    return True
+
+def clear_scoring_caches():
+    global _scoring_cache_version, _object_to_cluster_cache
+    _scoring_cache_version = None
+    _object_to_cluster_cache = (None, {})
+    _other_sim_scoring_cache.clear()
+    _relationship_bonus_cache.clear()
+    _goal_cost_cache.clear()
+
+def _get_object_to_cluster():
+    global _object_to_cluster_cache
+    cluster_service = services.social_group_cluster_service()
+    clusters_version = cluster_service.clusters_version
+    (cached_version, obj_to_cluster) = _object_to_cluster_cache
+    if cached_version != clusters_version:
+        obj_to_cluster = {}
+        for cluster in cluster_service.get_clusters_gen():
+            for obj in cluster.objects_gen():
+                obj_to_cluster[obj] = cluster
+        _object_to_cluster_cache = (clusters_version, obj_to_cluster)
+    return (clusters_version, obj_to_cluster)
+
+def _get_affinity_sim_key(other_sim):
+    return (other_sim.id, other_sim.posture_state, other_sim.is_moving, other_sim.si_state.version, other_sim.los_constraint)
+
+def _get_other_sim_scoring_data(other_sim, posture_graph, use_cache):
+    if use_cache:
+        cache_key = (other_sim.id, other_sim.los_constraint, posture_graph.geometry_version)
+        scoring_data = _other_sim_scoring_cache.get(cache_key)
+        if scoring_data is not None:
+            return scoring_data
+    nodes_in_sight = posture_graph.nodes_matching_constraint_geometry(other_sim.los_constraint)
+    scoring_data = (nodes_in_sight or (), {})
+    if use_cache:
+        _other_sim_scoring_cache[cache_key] = scoring_data
+    return scoring_data
 
 def set_final_destinations_gen(new_final_destinations_gen):
     global final_destinations_gen
@@ -113,20 +174,63 @@ class PostureScoring:
 
     @staticmethod
     def build_destination_costs(goal_costs, destination_nodes, sim, interaction, var_map, preferences, included_sis, additional_template_list, relationship_bonuses, spec_constraint, group_constraint):
+        selected_targets = PostureScoring._get_selected_destination_targets()
+        posture_target_preferences = PostureScoring._get_posture_target_preferences(interaction, included_sis)
+        use_cache = not gsi_handlers.posture_graph_handlers.archiver.enabled and _validate_scoring_caches()
+        if use_cache:
+            cache_refs = (interaction, var_map, preferences, additional_template_list, relationship_bonuses, spec_constraint, group_constraint) + tuple(included_sis)
+            context_key = (sim.id, sim.si_state.version, get_use_list_version(), services.current_zone().posture_graph_service.geometry_version, tuple(sorted(selected_targets.items(), key=lambda item: item[0].id)), tuple(id(ref) for ref in cache_refs))
         for dest_node in destination_nodes:
             if dest_node in goal_costs:
-                pass
-            node_cost = PostureScoring.get_goal_node_cost(dest_node, sim, interaction, var_map, preferences, included_sis, additional_template_list, relationship_bonuses, spec_constraint, group_constraint)
+                continue
+            if use_cache:
+                cache_key = (context_key, dest_node)
+                cache_entry = _goal_cost_cache.get(cache_key)
+                if cache_entry is not None:
+                    goal_costs[dest_node] = cache_entry[0]
+                    continue
+            node_cost = PostureScoring.get_goal_node_cost(dest_node, sim, interaction, var_map, preferences, included_sis, additional_template_list, relationship_bonuses, spec_constraint, group_constraint, selected_targets=selected_targets, posture_target_preferences=posture_target_preferences)
             goal_costs[dest_node] = node_cost
+            if use_cache and PostureScoring._is_goal_node_cost_cacheable(dest_node, var_map):
+                _goal_cost_cache[cache_key] = (node_cost, cache_refs)
+
+    @staticmethod
+    def _is_goal_node_cost_cacheable(goal_node, var_map):
+        return goal_node[SURFACE_INDEX][SURFACE_TARGET_INDEX] is None or PostureSpecVariable.SLOT not in var_map
+
+    @staticmethod
+    def _get_selected_destination_targets():
+        selected_targets = collections.Counter()
+        for destination in final_destinations_gen():
+            destination_body_target = destination[BODY_INDEX][BODY_TARGET_INDEX]
+            if destination_body_target is not None:
+                selected_targets[destination_body_target] += 1
+        return selected_targets
+
+    @staticmethod
+    def _get_posture_target_preferences(interaction, included_sis):
+        if interaction.combined_posture_target_preference is None:
+            return
+        posture_target_preferences = interaction.combined_posture_target_preference.copy()
+        for si in included_sis:
+            si_target_preferences = si.combined_posture_target_preference
+            if si_target_preferences is None:
+                continue
+            if si.has_active_cancel_replacement:
+                continue
+            for (posture_tag, weight) in si_target_preferences.items():
+                posture_target_preferences[posture_tag] = weight + posture_target_preferences.get(posture_tag, 0)
+        return posture_target_preferences
 
     @staticmethod
     def get_preferred_object_cost(goal_targets, preferred_objects, cost_str_list=None):
         if not preferred_objects:
             return 0
         for goal_target in goal_targets:
-            while goal_target is not None:
+            if goal_target is not None:
                 break
-        return 0
+        else:
+            return 0
         cost = 0
         goal_ancestry = set()
         for goal_target in goal_targets:
@@ -156,24 +260,25 @@ class PostureScoring:
     def build_relationship_bonuses(sim, sim_affinity_posture_scoring_data, sims_to_consider=None):
         if sim_affinity_posture_scoring_data is None:
             return
-        bonuses = {}
         posture_graph = services.current_zone().posture_graph_service
         if not sims_to_consider:
             sims_to_consider = (other_sim_info.get_sim_instance() for other_sim_info in services.sim_info_manager().objects if other_sim_info.is_instanced())
-        obj_to_cluster = {}
-        clusters = list(services.social_group_cluster_service().get_clusters_gen())
-        for cluster in clusters:
-            for obj in cluster.objects_gen():
-                obj_to_cluster[obj] = cluster
+        sims_to_consider = sorted((other_sim for other_sim in sims_to_consider if other_sim is not sim), key=lambda other_sim: other_sim.id)
+        use_cache = _validate_scoring_caches()
+        (clusters_version, obj_to_cluster) = _get_object_to_cluster()
+        if use_cache:
+            cache_key = (sim.id, id(sim_affinity_posture_scoring_data), clusters_version, posture_graph.geometry_version, sim.relationship_tracker.relationships_version, tuple(_get_affinity_sim_key(other_sim) for other_sim in sims_to_consider))
+            bonuses = _relationship_bonus_cache.get(cache_key)
+            if bonuses is not None:
+                return bonuses
+        bonuses = {}
         for other_sim in sims_to_consider:
-            if other_sim is sim:
-                pass
             if other_sim.posture.unconstrained:
-                pass
+                continue
             if other_sim.is_moving:
-                pass
+                continue
             if not other_sim.posture.allow_affinity:
-                pass
+                continue
             scores = []
             other_sim_cluster = None
             other_sim_body_target = other_sim.posture_state.body_target
@@ -187,69 +292,76 @@ class PostureScoring:
                 else:
                     match = False
                     for si in other_sim.si_state:
-                        while si.sim_affinity_posture_scoring_data is not None and match_tag in si.sim_affinity_posture_scoring_data.my_tags:
+                        if si.sim_affinity_posture_scoring_data is not None and match_tag in si.sim_affinity_posture_scoring_data.my_tags:
                             if not scoring_strategy.negate_tag:
                                 match = True
                             break
-                    if scoring_strategy.negate_tag:
-                        match = True
+                    else:
+                        if scoring_strategy.negate_tag:
+                            match = True
                 if not match:
-                    pass
+                    continue
                 (affinity, message) = scoring_strategy.affinity_strategy(sim, other_sim)
                 if not affinity:
-                    pass
+                    continue
                 scores.append((affinity, message))
             if not (other_sim_body_target is not None and scores):
-                pass
-            other_sim_facing = sims4.math.yaw_quaternion_to_angle(other_sim.transform.orientation)
-            distances = {}
-            nodes_in_sight = posture_graph.nodes_matching_constraint_geometry(other_sim.los_constraint)
+                continue
+            (nodes_in_sight, distances) = _get_other_sim_scoring_data(other_sim, posture_graph, use_cache)
+            other_sim_facing = None
             for goal_node in nodes_in_sight:
                 goal_body = goal_node[BODY_INDEX]
                 goal_body_target = goal_body[BODY_TARGET_INDEX]
                 goal_posture_type = goal_body[BODY_POSTURE_TYPE_INDEX]
-                while not goal_body_target is None:
-                    if goal_posture_type.mobile:
-                        pass
-                    distance = distances.get(goal_body_target)
-                    if distance is None:
-                        sim_facing = sims4.math.yaw_quaternion_to_angle(goal_body_target.transform.orientation)
-                        accum = accumulator.HarmonicMeanAccumulator()
-                        delta = other_sim.transform.translation - goal_body_target.transform.translation
-                        socials.geometry.score_facing(accum, sim_facing, other_sim_facing, delta)
-                        facing_score = accum.value()
-                        if facing_score <= 0:
-                            pass
+                if goal_body_target is None:
+                    continue
+                if goal_posture_type.mobile:
+                    continue
+                if goal_body_target in distances:
+                    distance = distances[goal_body_target]
+                else:
+                    if other_sim_facing is None:
+                        other_sim_facing = sims4.math.yaw_quaternion_to_angle(other_sim.transform.orientation)
+                    sim_facing = sims4.math.yaw_quaternion_to_angle(goal_body_target.transform.orientation)
+                    accum = accumulator.HarmonicMeanAccumulator()
+                    delta = other_sim.transform.translation - goal_body_target.transform.translation
+                    socials.geometry.score_facing(accum, sim_facing, other_sim_facing, delta)
+                    facing_score = accum.value()
+                    if facing_score <= 0:
+                        distance = None
+                    else:
                         distance = (goal_body_target.position - other_sim.position).magnitude_2d()
                         distance = max(distance, 1)
                         distance /= facing_score
-                        distances[goal_body_target] = distance
-                    bonus = 0
-                    all_messages = []
-                    for (affinity, message) in scores:
-                        affinity_weighted = affinity/distance
-                        bonus += affinity_weighted
-                    if not bonus:
-                        pass
-                    if goal_body_target.is_part:
-                        goal_object = goal_body_target.part_owner
-                    else:
-                        goal_object = goal_body_target
-                    if goal_object in obj_to_cluster:
-                        same_cluster = obj_to_cluster[goal_object] is other_sim_cluster
-                    else:
-                        same_cluster = False
-                    if same_cluster:
-                        bonus *= PostureScoring.SAME_CLUSTER_SIM_MULTIPLIER
-                    current_bonus_info = bonuses.get(goal_body_target)
-                    while current_bonus_info is None or bonus < current_bonus_info[0]:
-                        formatted_message = ''
-                        bonuses[goal_body_target] = (bonus, formatted_message)
-        obj_to_cluster.clear()
+                    distances[goal_body_target] = distance
+                if distance is None:
+                    continue
+                bonus = 0
+                for (affinity, message) in scores:
+                    affinity_weighted = affinity/distance
+                    bonus += affinity_weighted
+                if not bonus:
+                    continue
+                if goal_body_target.is_part:
+                    goal_object = goal_body_target.part_owner
+                else:
+                    goal_object = goal_body_target
+                if goal_object in obj_to_cluster:
+                    same_cluster = obj_to_cluster[goal_object] is other_sim_cluster
+                else:
+                    same_cluster = False
+                if same_cluster:
+                    bonus *= PostureScoring.SAME_CLUSTER_SIM_MULTIPLIER
+                current_bonus_info = bonuses.get(goal_body_target)
+                if current_bonus_info is None or bonus < current_bonus_info[0]:
+                    formatted_message = ''
+                    bonuses[goal_body_target] = (bonus, formatted_message)
+        if use_cache:
+            _relationship_bonus_cache[cache_key] = bonuses
         return bonuses
 
     @staticmethod
-    def get_goal_node_cost(goal_node, sim, interaction, var_map, preferences, included_sis, additional_template_dict, relationship_bonuses, spec_constraint, group_constraint):
+    def get_goal_node_cost(goal_node, sim, interaction, var_map, preferences, included_sis, additional_template_dict, relationship_bonuses, spec_constraint, group_constraint, selected_targets=None, posture_target_preferences=DEFAULT):
         cost = 0
         body_index = BODY_INDEX
         body_target_index = BODY_TARGET_INDEX
@@ -272,15 +384,17 @@ class PostureScoring:
                 objects_to_ignore.append(interaction.process.current_ico)
             runtime_slots = slot_manifest_entry.get_runtime_slots_gen()
             for runtime_slot in runtime_slots:
-                while runtime_slot is not None:
-                    if slot_manifest_entry.actor in runtime_slot.children:
-                        break
-                    result = runtime_slot.is_valid_for_placement(obj=slot_manifest_entry.actor, objects_to_ignore=objects_to_ignore)
-                    if result:
-                        break
-            cost += PostureScoring.IN_USE_PENALTY
-            if gsi_handlers.posture_graph_handlers.archiver.enabled:
-                cost_str_list.append('IN_USE_PENALTY: {}(Slot In Use)'.format(PostureScoring.IN_USE_PENALTY))
+                if runtime_slot is None:
+                    continue
+                if slot_manifest_entry.actor in runtime_slot.children:
+                    break
+                result = runtime_slot.is_valid_for_placement(obj=slot_manifest_entry.actor, objects_to_ignore=objects_to_ignore)
+                if result:
+                    break
+            else:
+                cost += PostureScoring.IN_USE_PENALTY
+                if gsi_handlers.posture_graph_handlers.archiver.enabled:
+                    cost_str_list.append('IN_USE_PENALTY: {}(Slot In Use)'.format(PostureScoring.IN_USE_PENALTY))
         if interaction.autonomy_preference is not None and goal_body_target is not None and sim.is_object_use_preferred(interaction.autonomy_preference.preference.tag, goal_body_target):
             cost -= PostureScoring.AUTONOMOUSLY_PREFERRED_BONUS
             if gsi_handlers.posture_graph_handlers.archiver.enabled:
@@ -295,7 +409,7 @@ class PostureScoring:
             cost += body_target_cost
         if group_constraint is not None:
             for sub_constraint in group_constraint:
-                while sub_constraint.geometry is None or goal_body_target is None or sub_constraint.geometry.contains_point(goal_body_target.position):
+                if sub_constraint.geometry is None or goal_body_target is None or sub_constraint.geometry.contains_point(goal_body_target.position):
                     cost -= PostureScoring.IN_PARTY_CONSTRAINT_BONUS
                     if gsi_handlers.posture_graph_handlers.archiver.enabled:
                         cost_str_list.append('IN_PARTY_CONSTRAINT_BONUS: {}'.format(PostureScoring.IN_PARTY_CONSTRAINT_BONUS))
@@ -306,39 +420,31 @@ class PostureScoring:
                 group_sims = tuple(group_sim for group_sim in main_group if group_sim is not sim)
             else:
                 group_sims = ()
-            adjacent_parts = list(goal_body_target.adjacent_parts_gen())
-            while True:
-                for adjacent_part in adjacent_parts:
-                    while any(adjacent_part.in_use_by(group_sim) for group_sim in group_sims):
-                        cost -= PostureScoring.ADJACENT_TO_GROUP_MEMBER_BONUS
-                        if gsi_handlers.posture_graph_handlers.archiver.enabled:
-                            cost_str_list.append('ADJACENT_TO_GROUP_MEMBER_BONUS: {}'.format(PostureScoring.ADJACENT_TO_GROUP_MEMBER_BONUS))
-                        break
-        if goal_body_target is not None:
-            for destination in final_destinations_gen():
-                destination_body_target = destination[body_index][body_target_index]
-                while destination_body_target is not None and destination_body_target is goal_body_target:
-                    cost += PostureScoring.DEST_ALREADY_SELECTED_PENALTY
+            for adjacent_part in goal_body_target.adjacent_parts_gen():
+                if any(adjacent_part.in_use_by(group_sim) for group_sim in group_sims):
+                    cost -= PostureScoring.ADJACENT_TO_GROUP_MEMBER_BONUS
                     if gsi_handlers.posture_graph_handlers.archiver.enabled:
-                        cost_str_list.append('DEST_ALREADY_SELECTED_PENALTY: {}'.format(PostureScoring.DEST_ALREADY_SELECTED_PENALTY))
+                        cost_str_list.append('ADJACENT_TO_GROUP_MEMBER_BONUS: {}'.format(PostureScoring.ADJACENT_TO_GROUP_MEMBER_BONUS))
+                    break
+        if goal_body_target is not None:
+            if selected_targets is None:
+                selected_targets = PostureScoring._get_selected_destination_targets()
+            selected_count = selected_targets.get(goal_body_target, 0)
+            if selected_count:
+                cost += PostureScoring.DEST_ALREADY_SELECTED_PENALTY*selected_count
+                if gsi_handlers.posture_graph_handlers.archiver.enabled:
+                    cost_str_list.append('DEST_ALREADY_SELECTED_PENALTY: {}'.format(PostureScoring.DEST_ALREADY_SELECTED_PENALTY*selected_count))
         if additional_template_dict and not interaction.is_putdown:
             posture_graph = services.current_zone().posture_graph_service
             for (carry_si, additional_templates) in additional_template_dict.items():
                 if posture_graph.any_template_passes_destination_test(additional_templates, carry_si, sim, goal_node):
-                    pass
+                    continue
                 cost += PostureScoring.CANCEL_EXISTING_CARRY_OR_SLOT_COST
-                while gsi_handlers.posture_graph_handlers.archiver.enabled:
+                if gsi_handlers.posture_graph_handlers.archiver.enabled:
                     cost_str_list.append('CANCEL_EXISTING_CARRY_OR_SLOT_COST: {}'.format(PostureScoring.CANCEL_EXISTING_CARRY_OR_SLOT_COST))
-        if goal_body_target is not None and interaction.combined_posture_target_preference is not None:
-            posture_target_preferences = interaction.combined_posture_target_preference.copy()
-            for si in included_sis:
-                si_target_preferences = si.combined_posture_target_preference
-                if si_target_preferences is None:
-                    pass
-                if si.has_active_cancel_replacement:
-                    pass
-                for (posture_tag, weight) in si_target_preferences.items():
-                    posture_target_preferences[posture_tag] = weight + posture_target_preferences.get(posture_tag, 0)
+        if posture_target_preferences is DEFAULT:
+            posture_target_preferences = PostureScoring._get_posture_target_preferences(interaction, included_sis)
+        if goal_body_target is not None and posture_target_preferences is not None:
             if goal_surface_target is not None and goal_surface_target.posture_transition_target_tag != postures.PostureTransitionTargetPreferenceTag.INVALID:
                 preference_score = posture_target_preferences.get(goal_surface_target.posture_transition_target_tag, 0)
             elif goal_body_target is not None and goal_body_target.posture_transition_target_tag != postures.PostureTransitionTargetPreferenceTag.INVALID:
@@ -51,9 +51,23 @@ import services
 import sims4.collections
 import sims4.log
 logger = sims4.log.Logger('TransitionSequence')
+MAX_TRANSITION_PLAN_REUSES = 3
+_TransitionPlan = collections.namedtuple('_TransitionPlan', ('key', 'templates', 'segmented_paths', 'goal_costs', 'reuse_count'))
 with sims4.reload.protected(globals()):
     global_plan_lock = None
     inject_interaction_name_in_callstack = False
+    _transition_plans_reused = 0
+    _transition_plans_repaired = 0
+    _transition_plans_replanned = 0
+
+def get_transition_plan_stats():
+    return (_transition_plans_reused, _transition_plans_repaired, _transition_plans_replanned)
+
+def reset_transition_plan_stats():
+    global _transition_plans_reused, _transition_plans_repaired, _transition_plans_replanned
+    _transition_plans_reused = 0
+    _transition_plans_repaired = 0
+    _transition_plans_replanned = 0
 
 def path_plan_allowed():
     if global_plan_lock is None:
@@ -95,6 +109,9 @@ class TransitionSequenceData:
         self.final_included_sis = None
         self.progress = TransitionSequenceStage.EMPTY
         self.progress_max = TransitionSequenceStage.COMPLETE
+        self.plan_key = None
+        self.plan_goal_costs = None
+        self.plan_reuse_count = 0
 
 class TransitionSequenceController:
     __qualname__ = 'TransitionSequenceController'
@@ -126,6 +143,7 @@ class TransitionSequenceController:
         self._exited_due_to_exception = False
         self._sim_data = {}
         self._tried_destinations = collections.defaultdict(set)
+        self._transition_plans = {}
         self._running = False
         self._privacy_initiation_time = None
         self._processed_on_route_change = False
@@ -574,26 +592,26 @@ class TransitionSequenceController:
     def reset_derailed_transitions(self):
         sims_to_reset = []
         for (sim, derailed_reason) in self._derailed.items():
-            while not derailed_reason is None:
-                if derailed_reason == DerailReason.NOT_DERAILED:
-                    pass
-                if self._derailed[sim] != DerailReason.TRANSITION_FAILED:
-                    for tried_destinations_sim in self._tried_destinations:
-                        self._tried_destinations[tried_destinations_sim].clear()
-                else:
-                    final_destination = self._sim_data[sim].final_destination
-                    if final_destination is not None:
-                        tried_dests = {dest for dest in self._sim_data[sim].valid_dest_nodes if dest.body_target is final_destination.body_target}
-                        self._tried_destinations[sim] |= tried_dests
-                if derailed_reason != DerailReason.PRIVACY_ENGAGED:
-                    sims_to_reset.append(sim)
-                    if self._derailed[sim] == DerailReason.TRANSITION_FAILED and sim is self.interaction.sim and self._original_interaction_target_changed:
-                        self.interaction.set_target(self._original_interaction_target)
-                        self._original_interaction_target = None
-                        self._original_interaction_target_changed = False
-                self._derailed[sim] = DerailReason.NOT_DERAILED
-                sim.validate_current_location_or_fgl()
+            if derailed_reason is None or derailed_reason == DerailReason.NOT_DERAILED:
+                continue
+            if self._derailed[sim] != DerailReason.TRANSITION_FAILED:
+                for tried_destinations_sim in self._tried_destinations:
+                    self._tried_destinations[tried_destinations_sim].clear()
+            else:
+                final_destination = self._sim_data[sim].final_destination
+                if final_destination is not None:
+                    tried_dests = {dest for dest in self._sim_data[sim].valid_dest_nodes if dest.body_target is final_destination.body_target}
+                    self._tried_destinations[sim] |= tried_dests
+            if derailed_reason != DerailReason.PRIVACY_ENGAGED:
+                sims_to_reset.append(sim)
+                if self._derailed[sim] == DerailReason.TRANSITION_FAILED and sim is self.interaction.sim and self._original_interaction_target_changed:
+                    self.interaction.set_target(self._original_interaction_target)
+                    self._original_interaction_target = None
+                    self._original_interaction_target_changed = False
+            self._derailed[sim] = DerailReason.NOT_DERAILED
+            sim.validate_current_location_or_fgl()
         for sim in sims_to_reset:
+            self._store_transition_plan(sim)
             self.set_sim_progress(sim, TransitionSequenceStage.EMPTY)
         if sims_to_reset:
             self.interaction.refresh_constraints()
@@ -621,6 +639,7 @@ class TransitionSequenceController:
 
     def shutdown(self):
         self.clear_relevant_objects()
+        self._transition_plans.clear()
         for sim in self._sim_data:
             self._clear_owned_transition(sim)
             social_group = sim.get_main_group()
@@ -1228,6 +1247,51 @@ class TransitionSequenceController:
             return True
         return False
 
+    def _get_transition_plan_key(self, sim, final_constraint, included_sis, target_sim, target_path_spec):
+        if target_sim is not None or target_path_spec is not None:
+            return
+        if gsi_handlers.posture_graph_handlers.archiver.enabled:
+            return
+        posture_graph = services.current_zone().posture_graph_service
+        return (self.interaction.target, final_constraint, frozenset(included_sis), posture_graph.geometry_version)
+
+    def _store_transition_plan(self, sim):
+        sim_data = self._sim_data.get(sim)
+        if sim_data is None or sim_data.plan_key is None:
+            return
+        if sim_data.progress < TransitionSequenceStage.PATHS or not sim_data.segmented_paths:
+            return
+        if sim_data.plan_reuse_count >= MAX_TRANSITION_PLAN_REUSES:
+            return
+        self._transition_plans[sim] = _TransitionPlan(sim_data.plan_key, sim_data.templates, sim_data.segmented_paths, sim_data.plan_goal_costs, sim_data.plan_reuse_count)
+
+    def _pop_transition_plan(self, sim, plan_key):
+        transition_plan = self._transition_plans.pop(sim, None)
+        if transition_plan is None or plan_key is None:
+            return
+        if transition_plan.key != plan_key:
+            return
+        return transition_plan
+
+    def _repair_transition_plan(self, sim, transition_plan, templates, additional_template_list, participant_type, valid_destination_test, valid_edge_test, preferences, final_constraint, included_sis):
+        global _transition_plans_reused, _transition_plans_repaired
+        interaction = self.interaction
+        posture_graph = services.current_zone().posture_graph_service
+        segmented_paths = posture_graph.get_reusable_segmented_paths(sim, interaction, transition_plan.segmented_paths, valid_destination_test, valid_edge_test)
+        if not segmented_paths:
+            return
+        valid_constraints = {segmented_path.constraint for segmented_path in segmented_paths}
+        invalid_templates = {constraint: constraint_templates for (constraint, constraint_templates) in templates.items() if constraint not in valid_constraints}
+        (goal_costs, goal_cost_offset) = transition_plan.goal_costs
+        if invalid_templates:
+            segmented_paths.extend(posture_graph.get_segmented_paths(sim, invalid_templates, additional_template_list, interaction, participant_type, valid_destination_test, valid_edge_test, preferences, final_constraint, included_sis))
+            posture_graph.merge_goal_costs(goal_costs, goal_cost_offset)
+            _transition_plans_repaired += 1
+        else:
+            posture_graph.restore_goal_costs(goal_costs, goal_cost_offset)
+            _transition_plans_reused += 1
+        return segmented_paths
+
     def _get_transitions_for_sim(self, *args, **kwargs):
         if not inject_interaction_name_in_callstack:
             result = yield self._get_transitions_for_sim_real(*args, **kwargs)
@@ -1239,7 +1303,7 @@ class TransitionSequenceController:
         return result
 
     def _get_transitions_for_sim_real(self, timeline, sim, target_sim=None, target_path_spec=None, ignore_inertial=False, ignore_combinables=False):
-        global global_plan_lock
+        global global_plan_lock, _transition_plans_replanned
         if sim is None:
             return postures.posture_graph.EMPTY_PATH_SPEC
         participant_type = self.interaction.get_participant_type(sim)
@@ -1277,12 +1341,18 @@ class TransitionSequenceController:
                 sim_data.progress = TransitionSequenceStage.ROUTES
                 sim_data.path_spec = path
             return path
+        plan_key = self._get_transition_plan_key(sim, final_constraint, included_sis, target_sim, target_path_spec)
+        transition_plan = None
         if sim_data.progress >= TransitionSequenceStage.TEMPLATES:
             (templates, additional_template_list, carry_target_si) = sim_data.templates
         else:
-            (templates, additional_template_list, carry_target_si) = self.get_templates_including_carry_transference(sim, interaction, final_constraint, included_sis, participant_type)
-            if gsi_handlers.posture_graph_handlers.archiver.enabled:
-                gsi_handlers.posture_graph_handlers.add_possible_constraints(sim, final_constraint, 'Final Constraint')
+            transition_plan = self._pop_transition_plan(sim, plan_key)
+            if transition_plan is not None:
+                (templates, additional_template_list, carry_target_si) = transition_plan.templates
+            else:
+                (templates, additional_template_list, carry_target_si) = self.get_templates_including_carry_transference(sim, interaction, final_constraint, included_sis, participant_type)
+                if gsi_handlers.posture_graph_handlers.archiver.enabled:
+                    gsi_handlers.posture_graph_handlers.add_possible_constraints(sim, final_constraint, 'Final Constraint')
             sim_data.templates = (templates, additional_template_list, carry_target_si)
             sim_data.progress = TransitionSequenceStage.TEMPLATES
         (valid_destination_test, valid_edge_test) = self.get_graph_test_functions(sim, target_sim, target_path_spec)
@@ -1291,7 +1361,19 @@ class TransitionSequenceController:
             segmented_paths = sim_data.segmented_paths
         else:
             preferences = self._combine_preferences(sim, interaction, included_sis)
-            segmented_paths = posture_graph.get_segmented_paths(sim, templates, additional_template_list, interaction, participant_type, valid_destination_test, valid_edge_test, preferences, final_constraint, included_sis)
+            segmented_paths = None
+            if transition_plan is not None:
+                segmented_paths = self._repair_transition_plan(sim, transition_plan, templates, additional_template_list, participant_type, valid_destination_test, valid_edge_test, preferences, final_constraint, included_sis)
+            if segmented_paths is not None:
+                sim_data.plan_reuse_count = transition_plan.reuse_count + 1
+            else:
+                segmented_paths = posture_graph.get_segmented_paths(sim, templates, additional_template_list, interaction, participant_type, valid_destination_test, valid_edge_test, preferences, final_constraint, included_sis)
+                sim_data.plan_reuse_count = 0
+                if plan_key is not None:
+                    _transition_plans_replanned += 1
+            sim_data.plan_key = plan_key
+            if plan_key is not None:
+                sim_data.plan_goal_costs = posture_graph.get_goal_costs()
             sim_data.progress = TransitionSequenceStage.PATHS
             sim_data.segmented_paths = segmented_paths
             sim_data.intended_location = sim.get_intended_location_excluding_transition(self)
@@ -1391,6 +1473,8 @@ class TransitionSequenceController:
             sim_data.valid_dest_nodes = set()
             sim_data.final_destination = None
             sim_data.segmented_paths = None
+            sim_data.plan_key = None
+            sim_data.plan_goal_costs = None
         if progress < TransitionSequenceStage.CONNECTIVITY:
             sim_data.connectivity = (None, None, None, None)
         if progress < TransitionSequenceStage.TEMPLATES:
@@ -1407,6 +1491,7 @@ class TransitionSequenceController:
     def reset_sim_progress(self, sim):
         sim_data = self._sim_data.get(sim)
         if sim_data is not None:
+            self._transition_plans.pop(sim, None)
             self.set_sim_progress(sim, TransitionSequenceStage.EMPTY)
             sim.queue.clear_head_cache()
 
@@ -1584,7 +1669,7 @@ class TransitionSequenceController:
             self.cancel()
             return lambda _: False
         source_interaction = None
-        potential_source_sis = [source_si for source_si in sim.si_state if si is None else itertools.chain((si,), sim.si_state) if source_si.provided_posture_type is not None]
+        potential_source_sis = [source_si for source_si in (sim.si_state if si is None else itertools.chain((si,), sim.si_state)) if source_si.provided_posture_type is not None]
         for aspect in posture_state.aspects:
             for potential_source_si in potential_source_sis:
                 while aspect.posture_type is potential_source_si.provided_posture_type:
@@ -140,6 +140,7 @@ class Relationship:
         self._bit_timeouts = []
         self._bit_track_tracker = RelationshipTrackTracker(self)
         self._level_change_watcher_id = self._bit_track_tracker.add_watcher(self._value_changed)
+        self._bit_track_tracker.add_on_remove_callback(self._track_removed)
         self._knowledge = None
         self._culling_alarm_handle = None
         self.bit_added_buffs = defaultdict(list)
@@ -164,9 +165,17 @@ class Relationship:
         self._knowledge = None
 
     def _value_changed(self, stat_type, old_value, new_value):
+        self._on_relationship_changed()
         if stat_type.causes_delayed_removal_on_convergence:
             self._destroy_culling_alarm()
 
+    def _track_removed(self, track):
+        self._on_relationship_changed()
+
+    def _on_relationship_changed(self):
+        if self._tracker is not None:
+            self._tracker.on_relationships_changed()
+
     @property
     def ID(self):
         return self.relationship_id
@@ -431,6 +440,7 @@ class Relationship:
             bit_instance.bit_added_buffs.extend(bit_added_buffs)
         self._bits[bit] = bit_instance
         self._cached_depth_dirty = True
+        self._on_relationship_changed()
         logger.debug('Added bit {} for {}', bit, self)
         sim_info = self.find_sim_info()
         if sim_info is not None:
@@ -490,6 +500,7 @@ class Relationship:
                 sim_info.update_spouse_sim_id(None)
         del self._bits[bit]
         self._cached_depth_dirty = True
+        self._on_relationship_changed()
         logger.debug('Removed bit {} for {}', bit, self)
         timeout_data = self._find_timeout_data_by_bit(bit)
         if timeout_data is not None:
@@ -21,6 +21,7 @@ logger = sims4.log.Logger('Relationship', default_owner='rez')
 
 class RelationshipTrack(TunedContinuousStatistic, HasTunableReference, metaclass=HashedTunedInstanceMetaclass, manager=services.statistic_manager()):
     __qualname__ = 'RelationshipTrack'
+    __slots__ = ('_per_instance_data', 'visible_to_client', '_decay_alarm_handle', '_convergence_callback_data', '_first_same_sex_relationship_callback_data')
     FRIENDSHIP_TRACK = TunableReference(description='\n        A reference to the friendship track so that the client knows which\n        track is the friendship one.\n        ', manager=services.statistic_manager(), class_restrictions='RelationshipTrack', export_modes=sims4.tuning.tunable_base.ExportModes.All)
     FRIENDSHIP_TRACK_FILTER_THRESHOLD = Tunable(description='\n        Value that the client will use when filtering friendship on the Sim\n        Picker.  Sims that have a track value equal to or above this value will\n        be shown with the friendship filter.\n        ', tunable_type=int, default=0, export_modes=sims4.tuning.tunable_base.ExportModes.All)
     ROMANCE_TRACK = TunableReference(description='\n        A reference to the romance track so that the client knows which\n        track is the romance one.\n        ', manager=services.statistic_manager(), class_restrictions='RelationshipTrack', export_modes=sims4.tuning.tunable_base.ExportModes.All)
@@ -256,6 +257,7 @@ services.get_instance_manager(sims4.resources.Types.STATISTIC).add_on_load_compl
 
 class ShortTermContextRelationshipTrack(RelationshipTrack):
     __qualname__ = 'ShortTermContextRelationshipTrack'
+    __slots__ = ()
     INSTANCE_TUNABLES = {'socialization_decay_modifier': TunableRange(description='\n            A multiplier to apply to the decay rate if the two Sims that this\n            relationship track applies to are socializing.\n            ', tunable_type=float, default=1, minimum=0)}
 
     @classproperty
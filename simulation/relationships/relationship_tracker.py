@@ -27,6 +27,8 @@ class RelationshipTracker:
         self.spouse_sim_id = None
         self._relationship_multipliers = {}
         self._create_relationship_callbacks = CallableList()
+        self._culling_totals = None
+        self._relationships_version = 0
 
     def __iter__(self):
         return self._relationships.values().__iter__()
@@ -34,6 +36,24 @@ class RelationshipTracker:
     def __len__(self):
         return len(self._relationships)
 
+    @property
+    def relationships_version(self):
+        return self._relationships_version
+
+    def on_relationships_changed(self):
+        self._culling_totals = None
+        self._relationships_version += 1
+
+    def get_culling_totals(self):
+        if self._culling_totals is None:
+            depth_total = 0
+            track_total = 0
+            for relationship in self._relationships.values():
+                depth_total += relationship.depth
+                track_total += len(relationship.bit_track_tracker)
+            self._culling_totals = (depth_total, track_total, len(self._relationships))
+        return self._culling_totals
+
     @property
     def suppress_client_updates(self):
         return self._suppress_client_updates
@@ -54,6 +74,7 @@ class RelationshipTracker:
             relationship = self._relationships[target_sim_id]
             relationship.destroy(notify_client=notify_client)
             del self._relationships[target_sim_id]
+            self.on_relationships_changed()
 
     def _clear_relationships(self):
         for sim_id in tuple(self._relationships.keys()):
@@ -368,6 +389,7 @@ class RelationshipTracker:
             logger.debug('Creating relationship for {0} and {1}', self._sim_info, target_sim_id)
             relationship = Relationship(self, self._sim_info.sim_id, target_sim_id)
             self._relationships[target_sim_id] = relationship
+            self.on_relationships_changed()
             relationship.add_neighbor_bit_if_necessary(self._sim_info)
             for multiplier in self._relationship_multipliers.values():
                 self._apply_relationship_multiplier_to_relationship(relationship, multiplier)
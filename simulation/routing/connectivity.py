@@ -1,9 +1,26 @@
+import collections
 from interactions.utils.routing import SlotGoal
 from native.routing.connectivity import Handle, HandleList
 from sims4.collections import frozendict
 import sims4.math
 import placement
 import routing
+import services
+GOAL_CACHE_SIZE = 64
+_GoalCacheEntry = collections.namedtuple('_GoalCacheEntry', ('constraint', 'geometry', 'locations', 'full_costs'))
+_goal_cache = collections.OrderedDict()
+_goal_cache_version = None
+
+def _get_goal_cache_version():
+    time_service = services.time_service()
+    if time_service is None:
+        return
+    return (routing.planner_build_id(), time_service.sim_now)
+
+def clear_goal_cache():
+    global _goal_cache_version
+    _goal_cache.clear()
+    _goal_cache_version = None
 
 class RoutingHandle(Handle):
     __qualname__ = 'RoutingHandle'
@@ -33,6 +50,7 @@ class RoutingHandle(Handle):
         return clone
 
     def get_goals(self, max_goals=None, relative_object=None, single_goal_only=False, for_carryable=False):
+        global _goal_cache_version
         if self.constraint.routing_surface is not None:
             routing_surface = self.constraint.routing_surface
         else:
@@ -56,23 +74,48 @@ class RoutingHandle(Handle):
         if isinstance(self, SlotRoutingHandle) and native_scoring_functions:
             python_scoring_functions = native_scoring_functions
             native_scoring_functions = ()
+        version = _get_goal_cache_version()
+        if version is None:
+            cache_key = None
+        else:
+            if version != _goal_cache_version:
+                _goal_cache.clear()
+                _goal_cache_version = version
+            los_reference_point = self.los_reference_point
+            cache_key = (type(self), id(self.constraint), id(self.geometry), self.sim.id, routing_surface.primary_id, routing_surface.secondary_id, routing_surface.type, frozenset(objects_to_ignore), max_goals, single_goal_only, for_carryable, relative_object.id if relative_object is not None else None, (los_reference_point.x, los_reference_point.y, los_reference_point.z) if los_reference_point is not None else None, self.weight_route_factor)
+            entry = _goal_cache.get(cache_key)
+            if entry is not None and entry.constraint is self.constraint and entry.geometry is self.geometry:
+                _goal_cache.move_to_end(cache_key)
+                return self._create_goals(entry.locations, entry.full_costs)
+        (locations, full_costs) = self._generate_scored_locations(routing_surface, max_goals, relative_object, single_goal_only, for_carryable, native_scoring_functions, python_scoring_functions, orientation_restrictions, objects_to_ignore)
+        if cache_key is not None:
+            _goal_cache[cache_key] = _GoalCacheEntry(self.constraint, self.geometry, locations, full_costs)
+            if len(_goal_cache) > GOAL_CACHE_SIZE:
+                _goal_cache.popitem(last=False)
+        return self._create_goals(locations, full_costs)
+
+    def _generate_scored_locations(self, routing_surface, max_goals, relative_object, single_goal_only, for_carryable, native_scoring_functions, python_scoring_functions, orientation_restrictions, objects_to_ignore):
         c_native_scoring_functions = [w._c_scoring_function for w in native_scoring_functions] if native_scoring_functions else None
         generated_goals = placement.generate_routing_goals_for_polygon(self.sim, self.geometry.polygon, routing_surface, c_native_scoring_functions, orientation_restrictions, objects_to_ignore, flush_planner=self.constraint._flush_planner, los_reference_pt=self.los_reference_point, max_points=max_goals, score_density=self.constraint._weight_route_factor, min_score_to_ignore_outer_penalty=self.constraint._ignore_outer_penalty_threshold, single_goal_only=single_goal_only, los_routing_context=relative_object.raycast_context(for_carryable=for_carryable) if relative_object is not None else None, all_blocking_edges_block_los=self.los_reference_point is not None and single_goal_only)
         if not generated_goals:
-            return []
-        goal_list = []
-        group_id = id(self.constraint)
+            return ((), ())
         if len(self.geometry.polygon) == 1 and len(self.geometry.polygon[0]) == 1 and isinstance(self, SlotRoutingHandle):
             cost_override = 1
         else:
             cost_override = None
-        for (tag, (location, cost, _)) in enumerate(generated_goals):
+        locations = []
+        router_costs = []
+        for (location, cost, _) in generated_goals:
             if cost_override is not None and cost > sims4.math.EPSILON:
                 cost = max(cost, cost_override)
-            full_cost = self.get_location_score(location.position, location.orientation, location.routing_surface, cost, python_scoring_functions)
-            goal = self.create_goal(location, full_cost, tag, group_id)
-            goal_list.append(goal)
-        return goal_list
+            locations.append(location)
+            router_costs.append(cost)
+        full_costs = self.get_location_scores(locations, router_costs, python_scoring_functions)
+        return (tuple(locations), tuple(full_costs))
+
+    def _create_goals(self, locations, full_costs):
+        group_id = id(self.constraint)
+        return [self.create_goal(location, full_cost, tag, group_id) for (tag, (location, full_cost)) in enumerate(zip(locations, full_costs))]
 
     def create_goal(self, location, full_cost, tag, group_id):
         return routing.Goal(location, cost=full_cost, tag=tag, group=group_id, requires_los_check=self.los_reference_point is not None, connectivity_handle=self)
@@ -88,6 +131,31 @@ class RoutingHandle(Handle):
             full_cost *= self.weight_route_factor
         return full_cost
 
+    def get_location_scores(self, locations, router_costs, scoring_functions):
+        positions = [location.position for location in locations]
+        orientations = [location.orientation for location in locations]
+        routing_surfaces = [location.routing_surface for location in locations]
+        return self._get_location_scores(positions, orientations, routing_surfaces, router_costs, scoring_functions)
+
+    def _get_location_scores(self, positions, orientations, routing_surfaces, router_costs, scoring_functions):
+        full_costs = list(router_costs)
+        scored_indices = [index for (index, router_cost) in enumerate(router_costs) if router_cost > 0]
+        if not scored_indices:
+            return full_costs
+        if len(scored_indices) < len(full_costs):
+            positions = [positions[index] for index in scored_indices]
+            orientations = [orientations[index] for index in scored_indices]
+            routing_surfaces = [routing_surfaces[index] for index in scored_indices]
+        all_scores = [scoring_function.get_combined_scores(positions, orientations, routing_surfaces) for scoring_function in scoring_functions]
+        for (score_index, index) in enumerate(scored_indices):
+            full_cost = full_costs[index]
+            for scores in all_scores:
+                full_cost *= scores[score_index][0]
+            for scores in all_scores:
+                full_cost += scores[score_index][1]
+            full_costs[index] = full_cost*self.weight_route_factor
+        return full_costs
+
 class SlotRoutingHandle(RoutingHandle):
     __qualname__ = 'SlotRoutingHandle'
 
@@ -98,3 +166,10 @@ class SlotRoutingHandle(RoutingHandle):
         transform = self.constraint.containment_transform
         return super().get_location_score(transform.translation, transform.orientation, routing_surface, router_cost, scoring_functions)
 
+    def get_location_scores(self, locations, router_costs, scoring_functions):
+        transform = self.constraint.containment_transform
+        positions = [transform.translation]*len(locations)
+        orientations = [transform.orientation]*len(locations)
+        routing_surfaces = [location.routing_surface for location in locations]
+        return self._get_location_scores(positions, orientations, routing_surfaces, router_costs, scoring_functions)
+
@@ -1,3 +1,4 @@
+import bisect
 import collections
 import random
 from date_and_time import TimeSpan
@@ -60,7 +61,7 @@ class ScheduleEntry(AutoFactoryInit):
         super().__init__(**kwargs)
         self._start_and_end_times = set()
         for (day, day_enabled) in self.days_available.items():
-            while day_enabled:
+            if day_enabled:
                 days_as_time_span = date_and_time.create_time_span(days=day)
                 start_time = self.start_time + days_as_time_span
                 end_time = start_time + date_and_time.create_time_span(
@@ -102,6 +103,7 @@ class WeeklySchedule:
                 is_random = entry.random_start
                 self._schedule_entires.add(AlarmData(start_time, end_time,
                                                      entry, is_random))
+        self._build_schedule_index()
         self._start_callback = start_callback
         self._alarm_handle = None
         self._random_alarm_handles = []
@@ -117,6 +119,26 @@ class WeeklySchedule:
                 schedule_immediate=schedule_immediate,
                 min_duration_remaining=min_duration_remaining)
 
+    def _build_schedule_index(self):
+        alarm_datas_by_start = collections.defaultdict(list)
+        max_duration_ticks = 0
+        for alarm_data in self._schedule_entires:
+            start_ticks = alarm_data.start_time.absolute_ticks()
+            alarm_datas_by_start[start_ticks].append(alarm_data)
+            max_duration_ticks = max(max_duration_ticks,
+                                     alarm_data.end_time.absolute_ticks() - start_ticks)
+        self._start_ticks = sorted(alarm_datas_by_start)
+        self._start_alarm_datas = [alarm_datas_by_start[start_ticks] for start_ticks in self._start_ticks]
+        self._max_end_ticks = []
+        max_end_ticks = None
+        for alarm_datas in self._start_alarm_datas:
+            for alarm_data in alarm_datas:
+                end_ticks = alarm_data.end_time.absolute_ticks()
+                if max_end_ticks is None or end_ticks > max_end_ticks:
+                    max_end_ticks = end_ticks
+            self._max_end_ticks.append(max_end_ticks)
+        self._max_duration_ticks = max_duration_ticks
+
     def _schedule_next_alarm(self,
                              schedule_immediate=False,
                              min_duration_remaining=None):
@@ -179,23 +201,29 @@ class WeeklySchedule:
                                         current_date_and_time,
                                         schedule_immediate=False,
                                         min_duration_remaining=None):
-        best_time = None
-        best_work_data = []
-        for alarm_data in self._schedule_entires:
-            start_time = alarm_data.start_time
-            end_time = alarm_data.end_time
-            cur_time = current_date_and_time.time_till_timespan_of_week(
-                start_time,
-                optional_end_time=end_time if schedule_immediate else None,
-                min_duration_remaining=min_duration_remaining)
-            if best_time is None or cur_time < best_time:
-                best_time = cur_time
-                best_work_data = []
-                best_work_data.append(alarm_data)
-            else:
-                while cur_time == best_time:
-                    best_work_data.append(alarm_data)
-        return (best_time, best_work_data)
+        if not self._start_ticks:
+            return (None, [])
+        ticks_in_week = current_date_and_time._ticks_in_week()
+        if schedule_immediate:
+            min_ticks_remaining = min_duration_remaining.in_ticks() if min_duration_remaining is not None else None
+            first_index = bisect.bisect_right(self._start_ticks,
+                                              ticks_in_week - self._max_duration_ticks)
+            last_index = bisect.bisect_right(self._start_ticks, ticks_in_week)
+            best_work_data = []
+            for alarm_datas in self._start_alarm_datas[first_index:last_index]:
+                for alarm_data in alarm_datas:
+                    tick_diff_before_end = alarm_data.end_time.absolute_ticks() - ticks_in_week
+                    if tick_diff_before_end > 0 and (min_ticks_remaining is None or tick_diff_before_end >= min_ticks_remaining):
+                        best_work_data.append(alarm_data)
+            if best_work_data:
+                return (TimeSpan.ZERO, best_work_data)
+        index = bisect.bisect_right(self._start_ticks, ticks_in_week)
+        if index < len(self._start_ticks):
+            best_time = TimeSpan(self._start_ticks[index] - ticks_in_week)
+        else:
+            index = 0
+            best_time = TimeSpan(date_and_time.sim_ticks_per_week() - ticks_in_week + self._start_ticks[0])
+        return (best_time, list(self._start_alarm_datas[index]))
 
     def add_cooldown(self, time_span):
         if self._cooldown_time is None:
@@ -220,21 +248,14 @@ class WeeklySchedule:
                                end_time.absolute_ticks()))
         return busy_times
 
+    def _overlaps_schedule_time(self, start_ticks, end_ticks):
+        index = bisect.bisect_right(self._start_ticks, end_ticks)
+        return index > 0 and self._max_end_ticks[index - 1] >= start_ticks
+
     def check_for_conflict(self, other_schedule):
-        START = 0
-        END = 1
-        busy_times = self.get_schedule_times()
-        other_busy_times = other_schedule.get_schedule_times()
-        for this_time in busy_times:
-            for other_time in other_busy_times:
-                starting_time_delta = this_time[START] - other_time[START]
-                if starting_time_delta >= 0:
-                    earlier_career_duration = other_time[END] - other_time[
-                        START]
-                else:
-                    earlier_career_duration = this_time[END] - this_time[START]
-                while earlier_career_duration >= abs(starting_time_delta):
-                    return True
+        for (start_ticks, end_ticks) in other_schedule.get_schedule_times():
+            if self._overlaps_schedule_time(start_ticks, end_ticks):
+                return True
         return False
 
     def merge_schedule(self, other_schedule):
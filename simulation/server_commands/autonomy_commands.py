@@ -360,7 +360,7 @@ def _randomize_all_motives_deterministically(sim_list, motive_value):
 
 @sims4.commands.Command('autonomy.trigger_walkby')
 def trigger_walkby(_connection=None, command_type=sims4.commands.CommandType.DebugOnly):
-    situation_id = services.current_zone().ambient_service.debug_update()
+    situation_id = services.ambient_service().debug_update()
     if situation_id is not None:
         situation = services.get_zone_situation_manager().get(situation_id)
         sims4.commands.output('Created ambient situation: {}.{}'.format(situation, situation_id), _connection)
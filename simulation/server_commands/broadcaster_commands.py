@@ -9,6 +9,6 @@ def broadcasters_add(broadcaster_type, broadcasting_object:OptionalTargetParam=N
     if broadcasting_object is None:
         return False
     broadcaster = broadcaster_type(broadcasting_object=broadcasting_object)
-    services.current_zone().broadcaster_service.add_broadcaster(broadcaster)
+    services.broadcaster_service().add_broadcaster(broadcaster)
     return True
 
@@ -196,13 +196,20 @@ def gsi_set_logging_size(num_entries:int=None, _connection=None):
     sims4.gsi.archive.set_max_archive_records(num_entries)
 
 @sims4.commands.Command('gsi.dump', command_type=sims4.commands.CommandType.Automation)
-def gsi_dump(compress:bool=True, location=None, error_str='From Command: |gsi.dump', _connection=None):
+def gsi_dump(compress:bool=True, location=None, error_str='From Command: |gsi.dump', incremental:bool=False, _connection=None):
     output = sims4.commands.Output(_connection)
     if not location:
         location = paths.APP_ROOT
     if not os.path.isdir(location):
         output('Output location specified ({}) does not exist. Please try a different location.')
         return False
+    if incremental:
+        full_path = gsi_handlers.dump.start_incremental_dump(location, console_output=output, compress_file=compress, error_str=error_str)
+        if full_path is None:
+            output('A GSI dump is already in progress.')
+            return False
+        output('Writing dump to {}'.format(full_path))
+        return True
     full_path = gsi_handlers.dump.save_dump_to_location(location, console_output=output, compress_file=compress, error_str=error_str)
     try:
         output('Dump successfully written to {}'.format(full_path))
@@ -212,7 +219,7 @@ def gsi_dump(compress:bool=True, location=None, error_str='From Command: |gsi.du
 
 def force_gsi_dump_on_error_or_exception(_connection=None):
     if sims4.log.callback_on_error_or_exception is not None:
-        gsi_dump(_connection, error_str='force_gsi_dump_on_error_or_exception')
+        gsi_dump(error_str='force_gsi_dump_on_error_or_exception', incremental=False, _connection=_connection)
 
 @sims4.commands.Command('gsi.gsi_dump_on_error_or_exception', command_type=sims4.commands.CommandType.Automation)
 def gsi_dump_on_error_or_exception(_connection=None):
@@ -223,7 +230,7 @@ def gsi_dump_on_error_or_exception(_connection=None):
             _num_gsi_dumps_on_error_or_exception += 1
             if _num_gsi_dumps_on_error_or_exception >= MAX_NUM_GSI_DUMPS_ON_ERROR_OR_EXCEPTION:
                 sims4.log.callback_on_error_or_exception = None
-            gsi_dump(_connection=_connection, error_str=error_str)
+            gsi_dump(error_str=error_str, incremental=False, _connection=_connection)
 
         sims4.log.callback_on_error_or_exception = create_gsi_dump
 
@@ -431,7 +438,7 @@ def toggle_initial_story_progression(enable:bool=None, _connection=None):
     current_zone = services.current_zone()
     if current_zone is None:
         return False
-    story_progression_service = current_zone.story_progression_service
+    story_progression_service = current_zone.get_service('story_progression_service')
     if story_progression_service is None:
         return False
     if enable is None:
@@ -1,9 +1,12 @@
 import collections
 import gc
+import itertools
 import os
 import sys
 import time
 from sims4.commands import CommandType
+from sims4.utils import create_csv
+from zone_tick_scheduler import TickService
 import alarms
 import clock
 import services
@@ -13,6 +16,10 @@ import sims4.reload
 import sizeof
 with sims4.reload.protected(globals()):
     g_log_python_memory_alarm = None
+    g_heap_census = None
+    g_heap_census_alarm = None
+    g_heap_census_snapshots = {}
+HEAP_CENSUS_STEP_SECONDS = 0.1
 
 def _get_objects():
     gc.collect()
@@ -192,14 +199,12 @@ def garbage_collector_dump(_connection):
                     break
     sims4.commands.output('Memory Output Complete', _connection)
 
-def generate_summary_report(skip_atomic, reverse_entries):
-    labeled_roots = []
+def _get_service_labeled_roots(direction_iter=iter):
     from objects.definition_manager import DefinitionManager
     from sims4.tuning.instance_manager import InstanceManager
     from indexed_manager import IndexedManager
     from postures.posture_graph import PostureGraphService
     SERVICE_GROUPS = [(DefinitionManager, 'DefinitionManager'), (InstanceManager, 'TuningManager'), (IndexedManager, 'IndexedManager'), (PostureGraphService, 'PostureGraph'), (object, 'Other')]
-    direction_iter = reversed if reverse_entries else iter
     zone = services.current_zone()
     service_sources = []
     zone_services = [source for service in zone.service_manager.services for source in service.get_buckets_for_memory_tracking()]
@@ -209,7 +214,12 @@ def generate_summary_report(skip_atomic, reverse_entries):
     for (source, source_name) in service_sources:
         for service in direction_iter(source):
             group = source_name + _first_applicable_match(service, SERVICE_GROUPS)
-            labeled_roots.append(('{1}/{0}'.format(service, group), [service]))
+            yield ('{1}/{0}'.format(service, group), [service])
+
+def generate_summary_report(skip_atomic, reverse_entries):
+    labeled_roots = []
+    direction_iter = reversed if reverse_entries else iter
+    labeled_roots.extend(_get_service_labeled_roots(direction_iter))
     for (name, module) in direction_iter(sorted(sys.modules.items())):
         path_root = 'Other'
         if hasattr(module, '__file__'):
@@ -324,6 +334,41 @@ def analyze_slots(verbose:bool=False, _connection=None):
         slot_size = slot_inst_size*len(objects)
         output('{},{},{},{:0.2f},{},{},{}'.format(type_name, len(objects), size, inst_size, slot_size, slot_inst_size, len(attribs)))
 
+def _get_sim_statistics_gen(sim_info):
+    for tracker in sim_info.get_all_stats_gen():
+        yield from tracker
+    for relationship in sim_info.relationship_tracker:
+        bit_track_tracker = relationship.bit_track_tracker
+        if bit_track_tracker is not None:
+            yield from bit_track_tracker
+
+@sims4.commands.Command('mem.statistics_report', command_type=sims4.commands.CommandType.Automation)
+def statistics_report(_connection=None):
+    output = sims4.commands.CheatOutput(_connection)
+    sim_infos = list(services.sim_info_manager().values())
+    if not sim_infos:
+        output('No Sims to report on.')
+        return
+    type_counts = collections.Counter()
+    type_sizes = collections.Counter()
+    type_dict_sizes = collections.Counter()
+    for sim_info in sim_infos:
+        for stat in _get_sim_statistics_gen(sim_info):
+            for obj in itertools.chain((stat,), getattr(stat, '_callbacks', ())):
+                type_name = type(obj).__mro__[1].__name__ if obj is stat else type(obj).__name__
+                type_counts[type_name] += 1
+                type_sizes[type_name] += sizeof.instance_sizeof(obj)
+                type_dict_sizes[type_name] += sizeof.dict_layout_sizeof(obj)
+    output('Type,Count,Size,DictLayoutSize')
+    for type_name in sorted(type_counts):
+        output('{},{},{},{}'.format(type_name, type_counts[type_name], type_sizes[type_name], type_dict_sizes[type_name]))
+    num_sims = len(sim_infos)
+    stat_count = sum(type_counts.values())
+    total_size = sum(type_sizes.values())
+    total_dict_size = sum(type_dict_sizes.values())
+    output('Sims: {}, Objects per Sim: {:0.1f}'.format(num_sims, stat_count/num_sims))
+    output('Bytes per Sim: {:0.0f} (dict layout estimate: {:0.0f}, saved: {:0.1f}%)'.format(total_size/num_sims, total_dict_size/num_sims, 100*(total_dict_size - total_size)/max(total_dict_size, 1)))
+
 @sims4.commands.Command('mem.record_python_memory.start', command_type=CommandType.Automation)
 def record_python_memory_start(start_time:int=150, frequency:int=120, _connection=None):
     global g_log_python_memory_alarm
@@ -347,3 +392,103 @@ def record_python_memory_stop(_connection=None):
         alarms.cancel_alarm(g_log_python_memory_alarm)
         g_log_python_memory_alarm = None
 
+
+def _get_heap_census_labeled_roots():
+    labeled_roots = []
+    components = collections.defaultdict(list)
+    for manager in services.client_object_managers():
+        objects = list(manager.values())
+        labeled_roots.append(('Object/{}'.format(type(manager).__name__), objects))
+        for obj in objects:
+            for component in getattr(obj, 'components', ()):
+                components[type(component).__name__].append(component)
+    for (component_name, component_list) in sorted(components.items()):
+        labeled_roots.append(('Component/{}'.format(component_name), component_list))
+    labeled_roots.extend(_get_service_labeled_roots())
+    for (module_name, module) in sorted(sys.modules.items()):
+        if module is None:
+            continue
+        for (name, value) in sorted(vars(module).items()):
+            if not sizeof.is_imported_global(module_name, value):
+                labeled_roots.append(('Global/{}.{}'.format(module_name, name), [value]))
+    return labeled_roots
+
+def _get_heap_census_referents_fn(labeled_roots):
+    component_dict_ids = set()
+    for (label, roots) in labeled_roots:
+        if label.startswith('Component/'):
+            component_dict_ids.update(id(component.__dict__) for component in roots if hasattr(component, '__dict__'))
+
+    def get_referents(obj):
+        referents = gc.get_referents(obj)
+        if id(obj) in component_dict_ids:
+            owner = obj.get('owner')
+            return [referent for referent in referents if referent is not owner]
+        return referents
+
+    return get_referents
+
+def _heap_census_step(_):
+    global g_heap_census
+    (name, census, output) = g_heap_census
+    if not services.current_zone().tick_scheduler.run_gen(TickService.HEAP_CENSUS, census.walk_gen):
+        _stop_heap_census()
+        output('Heap census {} failed.'.format(name))
+        return
+    if census.complete:
+        g_heap_census_snapshots[name] = census.sizes
+        _stop_heap_census()
+        output('Heap census {} complete: {} labels, {} bytes.'.format(name, len(census.sizes), sum(census.sizes.values())))
+
+def _stop_heap_census():
+    global g_heap_census, g_heap_census_alarm
+    if g_heap_census_alarm is not None:
+        alarms.cancel_alarm(g_heap_census_alarm)
+        g_heap_census_alarm = None
+    if g_heap_census is not None:
+        services.current_zone().tick_scheduler.cancel(TickService.HEAP_CENSUS)
+        g_heap_census = None
+
+@sims4.commands.Command('mem.heap_census.start', command_type=CommandType.Automation)
+def heap_census_start(name, skip_atomic:bool=False, _connection=None):
+    global g_heap_census, g_heap_census_alarm
+    _stop_heap_census()
+    output = sims4.commands.CheatOutput(_connection)
+    gc.collect()
+    labeled_roots = _get_heap_census_labeled_roots()
+    census = sizeof.HeapCensus(labeled_roots, skip_atomic=skip_atomic, ignore=(g_heap_census_snapshots,), get_referents=_get_heap_census_referents_fn(labeled_roots))
+    g_heap_census = (name, census, output)
+    g_heap_census_alarm = alarms.add_alarm_real_time(heap_census_start, clock.interval_in_real_seconds(HEAP_CENSUS_STEP_SECONDS), _heap_census_step, repeating=True, use_sleep_time=False)
+    output('Heap census {} started.'.format(name))
+
+@sims4.commands.Command('mem.heap_census.stop', command_type=CommandType.Automation)
+def heap_census_stop(_connection=None):
+    _stop_heap_census()
+
+@sims4.commands.Command('mem.heap_census.dump', command_type=CommandType.Automation)
+def heap_census_dump(name, _connection=None):
+    output = sims4.commands.CheatOutput(_connection)
+    sizes = g_heap_census_snapshots.get(name)
+    if sizes is None:
+        output('No heap census named {}.'.format(name))
+        return
+
+    def callback(file):
+        file.write('LABEL,SIZE\n')
+        for (label, size) in sizes.most_common():
+            file.write('{},{}\n'.format(label, size))
+
+    create_csv('heap_census_{}'.format(name), callback=callback, connection=_connection)
+
+@sims4.commands.Command('mem.heap_census.diff', command_type=CommandType.Automation)
+def heap_census_diff(before, after, limit:int=50, _connection=None):
+    output = sims4.commands.CheatOutput(_connection)
+    for name in (before, after):
+        if name not in g_heap_census_snapshots:
+            output('No heap census named {}.'.format(name))
+            return
+    growth = sizeof.diff_census(g_heap_census_snapshots[before], g_heap_census_snapshots[after])
+    output('Label,Before,After,Growth')
+    for (label, before_size, after_size, delta) in growth[:limit]:
+        output('{},{},{},{}'.format(label, before_size, after_size, delta))
+    output('Total growth: {}'.format(sum(entry[3] for entry in growth)))
@@ -1,7 +1,34 @@
+from distributor.ops import Op
+from distributor.system import Distributor, Journal
+from event_testing.resolver import DoubleSimResolver
+from event_testing.results import TestResult
+from event_testing.tests import CompoundTestList
+from interactions import ParticipantType
+from interactions.priority import Priority
+from objects.components.line_of_sight_component import LineOfSight
+from objects.object_enums import ResetReason
+from postures.posture_scoring import PostureScoring
+from protocolbuffers import Distributor_pb2, DistributorOps_pb2
+from protocolbuffers.Consts_pb2 import MGR_OBJECT, MSG_OBJECTS_VIEW_UPDATE
+from server_commands.argument_helpers import OptionalTargetParam, get_optional_target
+from services.reset_and_delete_service import ResetAndDeleteService, ResetRecord
+from sims.master_controller import MasterController, WorkRequest
+from sims4.callback_utils import CallableList
+from socials.clustering import SocialGroupClusterService
 import sims4.commands
 import profile_utils
 import sims4.geometry
+import sims4.math
+import sims4.random
 import math
+import elements
+import interactions.si_state
+import objects.system
+import postures.posture_scoring
+import postures.transition_sequence
+import random
+import routing
+import services
 import timeit
 from sims4.math import Vector2
 try:
@@ -186,3 +213,466 @@ def bool_conversion_test(num_loops=1000000):
         while results:
             profile_utils.add_string('>>> # Average: {1:.4}\n', 1, sum(results)/len(results))
 
+
+@sims4.commands.Command('profile_util.inventory_stacking')
+@profile_utils.profile_function(show_enter=True, output_to_file=True)
+def inventory_stacking_test(definition_id:int, num_items:int=1000, num_inserts:int=100, opt_target:OptionalTargetParam=None, _connection=None):
+    target = get_optional_target(opt_target, _connection)
+    if target is None or target.inventory_component is None:
+        sims4.commands.output('No target with an inventory component.', _connection)
+        return False
+    inventory = target.inventory_component
+    profile_utils.add_string('----- Inventory Stacking Test -----')
+    for _ in range(num_items):
+        obj = objects.system.create_object(definition_id)
+        if obj is None:
+            sims4.commands.output('Failed to create object with definition {}.'.format(definition_id), _connection)
+            return False
+        inventory._insert_item(obj, call_add=True, object_with_inventory=target, try_find_matching_item=False)
+    profile_utils.sub_time_start()
+    for _ in range(num_inserts):
+        inventory.player_try_add_object(objects.system.create_object(definition_id))
+    profile_utils.sub_time_end('Python: {} stacking inserts into a {}-item inventory'.format(num_inserts, num_items))
+    definition = services.definition_manager().get(definition_id)
+    profile_utils.sub_time_start()
+    for _ in range(num_inserts):
+        inventory.get_count(definition)
+    profile_utils.sub_time_end('Python: {} get_count calls on a {}-item inventory'.format(num_inserts, num_items))
+    inventory.purge_inventory()
+    return True
+
+class _MasterControllerBenchmarkQueue:
+    __qualname__ = '_MasterControllerBenchmarkQueue'
+
+    def __init__(self):
+        self.on_head_changed = CallableList()
+
+class _MasterControllerBenchmarkSim:
+    __qualname__ = '_MasterControllerBenchmarkSim'
+    is_sim = True
+
+    def __init__(self, sim_id):
+        self.id = sim_id
+        self.full_name = 'BenchmarkSim{}'.format(sim_id)
+        self.queue = _MasterControllerBenchmarkQueue()
+        self.head_priority = None
+        self.partner = None
+        self.resource = None
+        self.work_accepted = 0
+
+    def push_work(self, priority, partner=None, resource=None):
+        self.head_priority = priority
+        self.partner = partner
+        self.resource = resource
+        self.queue.on_head_changed()
+
+    def _on_accept(self):
+        self.head_priority = None
+        self.work_accepted += 1
+
+    def get_next_work_priority(self):
+        if self.head_priority is None:
+            return Priority.Low
+        return self.head_priority
+
+    def get_next_work(self):
+        if self.head_priority is None:
+            return WorkRequest()
+        required_sims = (self,) if self.partner is None or self.partner is self else (self, self.partner)
+        additional_resources = (self.resource,) if self.resource is not None else ()
+        return WorkRequest(work_element=elements.FunctionElement(no_op_function), required_sims=required_sims, additional_resources=additional_resources, on_accept=self._on_accept)
+
+    def get_idle_element(self):
+        return (elements.FunctionElement(no_op_function), no_op_function)
+
+    def schedule_element(self, timeline, element):
+        pass
+
+@sims4.commands.Command('profile_util.master_controller')
+@profile_utils.profile_function(show_enter=True, output_to_file=True)
+def master_controller_test(num_sims:int=30, num_bursts:int=1000, burst_size:int=5, num_resources:int=10, seed:int=0, _connection=None):
+    rng = random.Random(seed)
+    master_controller = MasterController()
+    sims = [_MasterControllerBenchmarkSim(sim_id) for sim_id in range(1, num_sims + 1)]
+    resources = ['BenchmarkResource{}'.format(index) for index in range(num_resources)]
+    priorities = (Priority.Low, Priority.High, Priority.Critical)
+    profile_utils.add_string('----- Master Controller Test -----')
+    for sim in sims:
+        master_controller.add_sim(sim)
+    profile_utils.sub_time_start()
+    for _ in range(num_bursts):
+        for sim in rng.sample(sims, min(burst_size, num_sims)):
+            partner = rng.choice(sims) if rng.random() < 0.25 else None
+            resource = rng.choice(resources) if resources and rng.random() < 0.25 else None
+            sim.push_work(rng.choice(priorities), partner=partner, resource=resource)
+        finished_work = {work_entry for work_entry in master_controller._active_work.values() if not work_entry.cancelable}
+        for work_entry in tuple(finished_work)[:burst_size]:
+            finished_sims = work_entry.resources
+            work_entry.remove_from_master_controller()
+            master_controller._process(*finished_sims)
+    profile_utils.sub_time_end('Python: {} bursts of {} queue changes across {} Sims'.format(num_bursts, burst_size, num_sims))
+    for work_entry in set(master_controller._active_work.values()):
+        work_entry.remove_from_master_controller()
+    master_controller.stop()
+    work_accepted = sum(sim.work_accepted for sim in sims)
+    profile_utils.add_string('Work accepted: {}'.format(work_accepted))
+    sims4.commands.output('Master controller test: {} work entries accepted over {} bursts.'.format(work_accepted, num_bursts), _connection)
+    return True
+
+class _DistributorBenchmarkCreateOp(Op):
+    __qualname__ = '_DistributorBenchmarkCreateOp'
+
+    def __init__(self, operation):
+        super().__init__()
+        self.operation = operation
+
+    def write(self, msg):
+        msg.MergeFrom(self.operation)
+
+class _DistributorBenchmarkObject:
+    __qualname__ = '_DistributorBenchmarkObject'
+
+    def __init__(self, obj_id, manager, operation):
+        self.id = obj_id
+        self.manager = manager
+        self._operation = operation
+
+    def get_create_op(self):
+        return _DistributorBenchmarkCreateOp(self._operation)
+
+    def get_create_after_objs(self):
+        return ()
+
+class _DistributorBenchmarkManager:
+    __qualname__ = '_DistributorBenchmarkManager'
+    id = MGR_OBJECT
+
+class _DistributorBenchmarkClient:
+    __qualname__ = '_DistributorBenchmarkClient'
+
+    def __init__(self, objects_in_view=()):
+        self.messages_sent = 0
+        self.bytes_sent = 0
+        self._objects_in_view = objects_in_view
+
+    def get_objects_in_view_gen(self):
+        yield from self._objects_in_view
+
+    def send_message(self, msg_id, msg):
+        self.send_serialized_message(msg_id, msg.SerializeToString())
+
+    def send_serialized_message(self, msg_id, msg):
+        self.messages_sent += 1
+        self.bytes_sent += len(msg)
+
+def _send_view_update_per_client(client, all_ops):
+    view_update = Distributor_pb2.ViewUpdate()
+    last_obj_id = None
+    for (obj_id, operation, manager_id, _) in all_ops:
+        if obj_id != last_obj_id:
+            entry = view_update.entries.add()
+            entry.primary_channel.id.manager_id = manager_id
+            entry.primary_channel.id.object_id = obj_id
+            last_obj_id = obj_id
+        entry.operation_list.operations.append(operation)
+    client.send_message(MSG_OBJECTS_VIEW_UPDATE, view_update)
+
+@sims4.commands.Command('profile_util.distributor_fanout')
+@profile_utils.profile_function(show_enter=True, output_to_file=True)
+def distributor_fanout_test(max_clients:int=8, num_objects:int=200, ops_per_object:int=5, num_ticks:int=100, _connection=None):
+    all_ops = []
+    objects_in_view = []
+    manager = _DistributorBenchmarkManager()
+    for obj_id in range(1, num_objects + 1):
+        for op_index in range(ops_per_object):
+            operation = DistributorOps_pb2.Operation()
+            operation.data = bytes((obj_id + op_index + offset) % 256 for offset in range(32))
+            all_ops.append(Journal.JournalEntry(obj_id, operation, MGR_OBJECT, None))
+        objects_in_view.append(_DistributorBenchmarkObject(obj_id, manager, operation))
+    profile_utils.add_string('----- Distributor Fan-out Test -----')
+    num_clients = 1
+    while num_clients <= max_clients:
+        clients = [_DistributorBenchmarkClient() for _ in range(num_clients)]
+        profile_utils.sub_time_start()
+        for _ in range(num_ticks):
+            for client in clients:
+                _send_view_update_per_client(client, all_ops)
+        profile_utils.sub_time_end('Python: {} ticks of {} ops encoded per client for {} clients'.format(num_ticks, len(all_ops), num_clients))
+        distributor = Distributor()
+        distributor.client = _DistributorBenchmarkClient()
+        profile_utils.sub_time_start()
+        for _ in range(num_clients - 1):
+            distributor.add_observer_client(_DistributorBenchmarkClient(objects_in_view))
+        profile_utils.sub_time_end('Python: {} observers added with {} objects in view'.format(num_clients - 1, len(objects_in_view)))
+        profile_utils.sub_time_start()
+        for _ in range(num_ticks):
+            distributor._send_view_updates_to_clients(all_ops)
+        profile_utils.sub_time_end('Python: {} ticks of {} ops encoded once and shared by {} clients'.format(num_ticks, len(all_ops), num_clients))
+        if distributor._pending_archive:
+            distributor._archive_sent_ops()
+        num_clients *= 2
+    return True
+
+class _ClusterBenchmarkObject:
+    __qualname__ = '_ClusterBenchmarkObject'
+    parts = None
+    FACING_OFFSET = 0.5
+
+    def __init__(self, obj_id, position, forward, routing_surface, line_of_sight_data):
+        self.id = obj_id
+        self.routing_surface = routing_surface
+        self._line_of_sight_data = line_of_sight_data
+        self.move_to(position, forward)
+
+    @property
+    def lineofsight_component(self):
+        return self
+
+    def move_to(self, position, forward):
+        self.position = position
+        self.forward = forward
+        self.default_position = position + forward*self.FACING_OFFSET
+        line_of_sight_data = self._line_of_sight_data
+        los = LineOfSight(line_of_sight_data.max_line_of_sight_radius, line_of_sight_data.map_divisions, line_of_sight_data.simplification_ratio, line_of_sight_data.boundary_epsilon)
+        los.generate(self.default_position, self.routing_surface)
+        self.constraint = los.constraint
+
+def _get_cluster_benchmark_layout(num_groups, group_size, origin):
+    columns = max(1, math.ceil(math.sqrt(num_groups)))
+    spacing = 5.0
+    layout = []
+    for group_index in range(num_groups):
+        center = origin + sims4.math.Vector3((group_index % columns)*spacing, 0, (group_index//columns)*spacing)
+        for seat_index in range(group_size):
+            angle = 2*math.pi*seat_index/group_size
+            offset = sims4.math.Vector3(math.sin(angle), 0, math.cos(angle))
+            layout.append((center + offset, -offset))
+    return layout
+
+@sims4.commands.Command('profile_util.social_clustering')
+@profile_utils.profile_function(show_enter=True, output_to_file=True)
+def social_clustering_test(num_groups:int=25, group_size:int=4, num_moves:int=50, seed:int=0, _connection=None):
+    zone = services.current_zone()
+    routing_surface = routing.SurfaceIdentifier(zone.id, 0, routing.SURFACETYPE_WORLD)
+    cluster_objects = []
+    cluster_request = SocialGroupClusterService.CLUSTER_REQUEST(lambda : iter(cluster_objects))
+    layout = _get_cluster_benchmark_layout(num_groups, group_size, services.active_lot().position)
+    for (obj_id, (position, forward)) in enumerate(layout, 1):
+        cluster_objects.append(_ClusterBenchmarkObject(obj_id, position, forward, routing_surface, cluster_request.line_of_sight_constraint))
+    rng = random.Random(seed)
+    moves = [(rng.randrange(len(cluster_objects)), rng.uniform(-0.25, 0.25), rng.uniform(-0.25, 0.25)) for _ in range(num_moves)]
+    profile_utils.add_string('----- Social Clustering Test -----')
+    for incremental in (False, True):
+        for (obj, (position, forward)) in zip(cluster_objects, layout):
+            obj.move_to(position, forward)
+        num_clusters = sum(1 for _ in cluster_request.get_clusters_gen(regenerate=True))
+        profile_utils.sub_time_start()
+        for (index, delta_x, delta_z) in moves:
+            obj = cluster_objects[index]
+            obj.move_to(obj.position + sims4.math.Vector3(delta_x, 0, delta_z), obj.forward)
+            if incremental:
+                cluster_request.set_object_dirty(obj)
+                num_clusters = sum(1 for _ in cluster_request.get_clusters_gen())
+            else:
+                num_clusters = sum(1 for _ in cluster_request.get_clusters_gen(regenerate=True))
+        profile_utils.sub_time_end('Python: {} {} reclusters of {} objects'.format(num_moves, 'incremental' if incremental else 'full', len(cluster_objects)))
+        profile_utils.add_string('Clusters after moves: {}'.format(num_clusters))
+    sims4.commands.output('Social clustering test: {} objects, {} moves, {} clusters.'.format(len(cluster_objects), num_moves, num_clusters), _connection)
+    return True
+
+class _ResolverBenchmarkTest:
+    __qualname__ = '_ResolverBenchmarkTest'
+    PARTICIPANT_TYPES = (ParticipantType.Actor, ParticipantType.TargetSim, ParticipantType.SignificantOtherTargetSim, ParticipantType.Lot, ParticipantType.LotOwners)
+    safe_to_skip = False
+
+    def __init__(self, index):
+        participant_types = self.PARTICIPANT_TYPES
+        self._expected_args = {'subjects': participant_types[index % len(participant_types)], 'targets': participant_types[(index + 1) % len(participant_types)]}
+
+    def get_expected_args(self):
+        return self._expected_args
+
+    def __call__(self, subjects=None, targets=None):
+        return TestResult.TRUE
+
+class _UnmemoizedDoubleSimResolver(DoubleSimResolver):
+    __qualname__ = '_UnmemoizedDoubleSimResolver'
+
+    def begin_participant_memo(self):
+        pass
+
+    def end_participant_memo(self):
+        pass
+
+@sims4.commands.Command('profile_util.resolver_participant_memo')
+@profile_utils.profile_function(show_enter=True, output_to_file=True)
+def resolver_participant_memo_test(num_tests:int=50, num_passes:int=1000, opt_sim:OptionalTargetParam=None, _connection=None):
+    sim = get_optional_target(opt_sim, _connection)
+    if sim is None:
+        sims4.commands.output('No Sim to test with.', _connection)
+        return False
+    target_sim_info = next((sim_info for sim_info in services.sim_info_manager().values() if sim_info is not sim.sim_info), None)
+    if target_sim_info is None:
+        sims4.commands.output('Need a second Sim to test with.', _connection)
+        return False
+    unmemoized_resolver = _UnmemoizedDoubleSimResolver(sim.sim_info, target_sim_info)
+    resolver = DoubleSimResolver(sim.sim_info, target_sim_info)
+    test_group = [_ResolverBenchmarkTest(index) for index in range(num_tests)]
+    test_list = CompoundTestList((test_group,))
+    profile_utils.add_string('----- Resolver Participant Memo Test -----')
+    profile_utils.sub_time_start()
+    for _ in range(num_passes):
+        test_list.run_tests(unmemoized_resolver)
+    profile_utils.sub_time_end('Python: {} passes of {} tests without the participant memo'.format(num_passes, num_tests))
+    profile_utils.sub_time_start()
+    for _ in range(num_passes):
+        test_list.run_tests(resolver)
+    profile_utils.sub_time_end('Python: {} passes of {} tests with the participant memo'.format(num_passes, num_tests))
+    return True
+
+@sims4.commands.Command('profile_util.weighted_sampling')
+@profile_utils.profile_function(show_enter=True, output_to_file=True)
+def weighted_sampling_test(num_items:int=2000, num_draws:int=100000, seed:int=0, _connection=None):
+    rng = random.Random(seed)
+    pairs = [(rng.uniform(0, 10), index) for index in range(num_items)]
+    profile_utils.add_string('----- Weighted Sampling Test -----')
+    draw_rng = random.Random(seed)
+    remaining_pairs = list(pairs)
+    profile_utils.sub_time_start()
+    popped = [sims4.random.pop_weighted(remaining_pairs, random=draw_rng) for _ in range(num_items)]
+    profile_utils.sub_time_end('Python: pop_weighted of all {} items'.format(num_items))
+    draw_rng = random.Random(seed)
+    profile_utils.sub_time_start()
+    sampler_popped = sims4.random.WeightedSampler(pairs, random=draw_rng).pop_many(num_items)
+    profile_utils.sub_time_end('Python: WeightedSampler.pop of all {} items'.format(num_items))
+    profile_utils.add_string('Same pop order: {}'.format(popped == sampler_popped))
+    profile_utils.sub_time_start()
+    for _ in range(num_draws):
+        sims4.random.weighted_random_item(pairs, random=draw_rng)
+    profile_utils.sub_time_end('Python: {} weighted_random_item draws from {} items'.format(num_draws, num_items))
+    profile_utils.sub_time_start()
+    sims4.random.AliasSampler(pairs, random=draw_rng).sample_many(num_draws)
+    profile_utils.sub_time_end('Python: {} AliasSampler draws from {} items'.format(num_draws, num_items))
+    sims4.commands.output('Weighted sampling test: {} items, same pop order: {}.'.format(num_items, popped == sampler_popped), _connection)
+    return True
+
+class _ResetBenchmarkElement:
+    __qualname__ = '_ResetBenchmarkElement'
+
+    def __init__(self, index):
+        self.index = index
+        self.hard_stopped = False
+
+    def tracing_repr(self):
+        return '<ResetBenchmarkElement {}>'.format(self.index)
+
+    def trigger_hard_stop(self):
+        self.hard_stopped = True
+
+class _ResetBenchmarkObject:
+    __qualname__ = '_ResetBenchmarkObject'
+    is_part = False
+
+    def __init__(self, obj_id, manager, elements):
+        self.id = obj_id
+        self.manager = manager
+        self.elements = elements
+        self.dependents = ()
+        self.stages_run = 0
+
+    def on_reset_notification(self, reset_reason):
+        pass
+
+    def on_reset_get_elements_to_hard_stop(self, reset_reason):
+        return list(self.elements)
+
+    def on_reset_get_interdependent_reset_records(self, reset_reason, reset_records):
+        for obj in self.dependents:
+            reset_records.append(ResetRecord(obj, reset_reason, self, 'Benchmark dependent'))
+
+    def on_reset_early_detachment(self, reset_reason):
+        self.stages_run += 1
+
+    def on_reset_send_op(self, reset_reason):
+        self.stages_run += 1
+
+    def on_reset_internal_state(self, reset_reason):
+        self.stages_run += 1
+
+    def on_reset_destroy(self):
+        self.stages_run += 1
+        self.manager.discard(self.id)
+
+    def on_reset_restart(self):
+        self.stages_run += 1
+        return True
+
+@sims4.commands.Command('profile_util.reset_pipeline')
+@profile_utils.profile_function(show_enter=True, output_to_file=True)
+def reset_pipeline_test(num_objects:int=1000, elements_per_object:int=3, dependents_per_object:int=2, seed:int=0, _connection=None):
+    rng = random.Random(seed)
+    profile_utils.add_string('----- Reset Pipeline Test -----')
+    for reset_reason in (ResetReason.RESET_EXPECTED, ResetReason.BEING_DESTROYED):
+        manager = set(range(num_objects))
+        shared_elements = [_ResetBenchmarkElement(index) for index in range(elements_per_object)]
+        reset_objects = []
+        for obj_id in range(num_objects):
+            elements = [_ResetBenchmarkElement(obj_id*elements_per_object + index) for index in range(elements_per_object)]
+            reset_objects.append(_ResetBenchmarkObject(obj_id, manager, elements + shared_elements))
+        for obj in reset_objects:
+            obj.dependents = rng.sample(reset_objects, min(dependents_per_object, num_objects))
+        reset_service = ResetAndDeleteService()
+        profile_utils.sub_time_start()
+        reset_service.trigger_batch_reset(reset_objects, reset_reason)
+        profile_utils.sub_time_end('Python: {} of {} objects with {} elements each'.format(reset_reason.name, num_objects, elements_per_object))
+        stages_run = sum(obj.stages_run for obj in reset_objects)
+        profile_utils.add_string('Object stages run: {}'.format(stages_run))
+    sims4.commands.output('Reset pipeline test: {} objects, {} object stages run.'.format(num_objects, stages_run), _connection)
+    return True
+
+@sims4.commands.Command('profile_util.posture_scoring')
+@profile_utils.profile_function(show_enter=True, output_to_file=True)
+def posture_scoring_test(num_passes:int=10, _connection=None):
+    sims = [sim_info.get_sim_instance() for sim_info in services.sim_info_manager().objects if sim_info.is_instanced()]
+    planning_sims = []
+    for sim in sims:
+        for si in sim.si_state:
+            if si.sim_affinity_posture_scoring_data is not None:
+                planning_sims.append((sim, si.sim_affinity_posture_scoring_data))
+                break
+    if not planning_sims:
+        sims4.commands.output('No instanced Sims are running interactions with Sim affinity scoring.', _connection)
+        return False
+    profile_utils.add_string('----- Posture Scoring Test -----')
+    profile_utils.sub_time_start()
+    for _ in range(num_passes):
+        for (sim, scoring_data) in planning_sims:
+            postures.posture_scoring.clear_scoring_caches()
+            PostureScoring.build_relationship_bonuses(sim, scoring_data)
+    profile_utils.sub_time_end('Python: {} passes of {} relationship bonus builds without the scoring caches'.format(num_passes, len(planning_sims)))
+    postures.posture_scoring.clear_scoring_caches()
+    profile_utils.sub_time_start()
+    for _ in range(num_passes):
+        for (sim, scoring_data) in planning_sims:
+            PostureScoring.build_relationship_bonuses(sim, scoring_data)
+    profile_utils.sub_time_end('Python: {} passes of {} relationship bonus builds with the scoring caches'.format(num_passes, len(planning_sims)))
+    sims4.commands.output('Posture scoring test: {} planning Sims, {} instanced Sims.'.format(len(planning_sims), len(sims)), _connection)
+    return True
+
+@sims4.commands.Command('profile_util.combined_constraint_cache')
+def combined_constraint_cache_stats(reset:bool=False, _connection=None):
+    (hits, misses, hit_rate) = interactions.si_state.get_combined_constraint_cache_stats()
+    sims4.commands.output('Combined constraint cache: {} hits, {} misses, {:.1%} hit rate.'.format(hits, misses, hit_rate), _connection)
+    if reset:
+        interactions.si_state.reset_combined_constraint_cache_stats()
+    return True
+
+@sims4.commands.Command('profile_util.transition_plan_cache')
+def transition_plan_cache_stats(reset:bool=False, _connection=None):
+    (reused, repaired, replanned) = postures.transition_sequence.get_transition_plan_stats()
+    total = reused + repaired + replanned
+    reuse_rate = (reused + repaired)/total if total else 0
+    sims4.commands.output('Transition plans: {} reused, {} repaired, {} replanned, {:.1%} reuse rate.'.format(reused, repaired, replanned, reuse_rate), _connection)
+    if reset:
+        postures.transition_sequence.reset_transition_plan_stats()
+    return True
@@ -708,7 +708,7 @@ def set_npc_repopulation(disabled, _connection=None):
     current_zone = services.current_zone()
     if current_zone is None:
         return False
-    story_progression_service = current_zone.story_progression_service
+    story_progression_service = current_zone.get_service('story_progression_service')
     if story_progression_service is None:
         return False
     if disabled is None:
@@ -7,7 +7,7 @@ import sims4.commands
 @sims4.commands.Command('ui.dialog.respond', command_type=sims4.commands.CommandType.Live)
 def ui_dialog_respond(dialog_id, response, _connection=None):
     zone = services.current_zone()
-    if not zone.ui_dialog_service.dialog_respond(dialog_id, response):
+    if not zone.get_service('ui_dialog_service').dialog_respond(dialog_id, response):
         sims4.commands.output('That is not a valid response.', _connection)
         return False
     return True
@@ -15,7 +15,7 @@ def ui_dialog_respond(dialog_id, response, _connection=None):
 @sims4.commands.Command('ui.dialog.pick_result', command_type=sims4.commands.CommandType.Live)
 def ui_dialog_pick_result(dialog_id, ingredient_check, *choices, _connection=None):
     zone = services.current_zone()
-    if not zone.ui_dialog_service.dialog_pick_result(dialog_id, choices, ingredient_check=ingredient_check):
+    if not zone.get_service('ui_dialog_service').dialog_pick_result(dialog_id, choices, ingredient_check=ingredient_check):
         sims4.commands.output('That is not a valid pick result.', _connection)
         return False
     return True
@@ -23,7 +23,7 @@ def ui_dialog_pick_result(dialog_id, ingredient_check, *choices, _connection=Non
 @sims4.commands.Command('ui.dialog.text_input', command_type=sims4.commands.CommandType.Live)
 def ui_dialog_text_input(dialog_id, text_input_name, text_input_value, _connection=None):
     zone = services.current_zone()
-    if not zone.ui_dialog_service.dialog_text_input(dialog_id, text_input_name, text_input_value):
+    if not zone.get_service('ui_dialog_service').dialog_text_input(dialog_id, text_input_name, text_input_value):
         sims4.commands.output('Unable to set dialog text input for {0} to {1}'.format(text_input_name, text_input_value), _connection)
         return False
     return True
@@ -31,14 +31,14 @@ def ui_dialog_text_input(dialog_id, text_input_name, text_input_value, _connecti
 @sims4.commands.Command('ui.dialog.auto_respond', command_type=sims4.commands.CommandType.Automation)
 def ui_dialog_auto_respond(enable:bool=None, _connection=None):
     zone = services.current_zone()
-    auto_respond = enable if enable is not None else not zone.ui_dialog_service.auto_respond
-    zone.ui_dialog_service.auto_respond = auto_respond
+    auto_respond = enable if enable is not None else not zone.get_service('ui_dialog_service').auto_respond
+    zone.get_service('ui_dialog_service').auto_respond = auto_respond
     sims4.commands.output('UI Dialog auto_respond set to {}'.format(auto_respond), _connection)
 
 @sims4.commands.Command('ui.toggle_silence_phone', command_type=sims4.commands.CommandType.Live)
 def toggle_silence_phone(sim_id:OptionalTargetParam=None, _connection=None):
     zone = services.current_zone()
-    zone.ui_dialog_service.toggle_is_phone_silenced()
+    zone.get_service('ui_dialog_service').toggle_is_phone_silenced()
     return True
 
 @sims4.commands.Command('ui.dialog.notification_test')
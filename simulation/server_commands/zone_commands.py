@@ -1,6 +1,7 @@
 from event_testing.test_events import TestEvent
 from server_commands.argument_helpers import OptionalTargetParam, get_optional_target
 from sims4.utils import create_csv
+from zone_tick_scheduler import HISTOGRAM_BUCKETS_MILLISECONDS
 import services
 import sims4.commands
 
@@ -26,9 +27,40 @@ def gather_tick_metrics_stop(_connection=None):
         zone = services.current_zone()
         tick_data = zone.tick_data
         zone.stop_gathering_tick_metrics()
-        file.write('ABSOLUTE TICKS,SIM NOW READABLE, SIM NOW TICKS,CLOCK SPEED ENUM,CLOCK SPEED MULTIPLIER,GAME TIME READABLE,GAME TIME TICKS,MULTIPLIER TYPE\n')
+        file.write('ABSOLUTE TICKS,SIM NOW READABLE, SIM NOW TICKS,CLOCK SPEED ENUM,CLOCK SPEED MULTIPLIER,GAME TIME READABLE,GAME TIME TICKS,MULTIPLIER TYPE,SERVICE TIMES (MS)\n')
         for data in tick_data:
-            file.write('{},{},{},{},{},{},{},{}\n'.format(data.absolute_ticks, data.sim_now, data.sim_now.absolute_ticks(), data.clock_speed, data.clock_speed_multiplier, data.game_time, data.game_time.absolute_ticks(), data.multiplier_type))
+            service_times = ' '.join('{}:{:.3f}'.format(tick_service.name, time_ms) for (tick_service, time_ms) in data.service_times)
+            file.write('{},{},{},{},{},{},{},{},{}\n'.format(data.absolute_ticks, data.sim_now, data.sim_now.absolute_ticks(), data.clock_speed, data.clock_speed_multiplier, data.game_time, data.game_time.absolute_ticks(), data.multiplier_type, service_times))
 
     create_csv('tick_metrics', callback=callback, connection=_connection)
 
+@sims4.commands.Command('zone.tick_scheduler.dump', command_type=sims4.commands.CommandType.Automation)
+def tick_scheduler_dump(_connection=None):
+
+    def callback(file):
+        scheduler = services.current_zone().tick_scheduler
+        bucket_names = ['<{}ms'.format(bucket_ms) for bucket_ms in HISTOGRAM_BUCKETS_MILLISECONDS]
+        bucket_names.append('>={}ms'.format(HISTOGRAM_BUCKETS_MILLISECONDS[-1]))
+        file.write('SERVICE,BUDGET (MS),UPDATES,OVER BUDGET,TOTAL (MS),MAX TICK (MS),{}\n'.format(','.join(bucket_names)))
+        for scheduled_service in scheduler.get_service_metrics_gen():
+            file.write('{},{},{},{},{:.3f},{:.3f},{}\n'.format(scheduled_service.tick_service.name, scheduled_service.budget_ms, scheduled_service.update_count, scheduled_service.over_budget_count, scheduled_service.total_time_ms, scheduled_service.max_time_ms, ','.join(str(count) for count in scheduled_service.histogram)))
+
+    create_csv('tick_scheduler', callback=callback, connection=_connection)
+
+@sims4.commands.Command('zone.tick_scheduler.clear', command_type=sims4.commands.CommandType.Automation)
+def tick_scheduler_clear(_connection=None):
+    services.current_zone().tick_scheduler.clear_metrics()
+
+
+@sims4.commands.Command('zone.service_start_times.dump', command_type=sims4.commands.CommandType.Automation)
+def service_start_times_dump(_connection=None):
+
+    def callback(file):
+        service_manager = services.current_zone().service_manager
+        file.write('SERVICE,START (MS),DEFERRED\n')
+        for (service, start_time) in service_manager.service_start_times.items():
+            file.write('{},{:.3f},{}\n'.format(service, start_time.milliseconds, start_time.deferred))
+        for service in service_manager.get_deferred_services_gen():
+            file.write('{},,PENDING\n'.format(service))
+
+    create_csv('service_start_times', callback=callback, connection=_connection)
@@ -287,7 +287,7 @@ def household_manager(zone_id=None):
     return _zone_manager.get(zone_id).household_manager
 
 def ui_dialog_service():
-    return current_zone().ui_dialog_service
+    return current_zone().get_service('ui_dialog_service')
 
 def config_service():
     return current_zone().config_service
@@ -322,6 +322,12 @@ def sim_filter_service(zone_id=None):
         return current_zone().sim_filter_service
     return _zone_manager.get(zone_id).sim_filter_service
 
+def broadcaster_service():
+    return current_zone().get_service('broadcaster_service')
+
+def ambient_service():
+    return current_zone().get_service('ambient_service')
+
 def social_group_cluster_service():
     return current_zone().social_group_cluster_service
 
@@ -372,11 +378,11 @@ def get_distributor_service():
     return _distributor_service
 
 def get_fire_service():
-    return current_zone().fire_service
+    return current_zone().get_service('fire_service')
 
 def get_super_speed_three_service():
     return current_zone().super_speed_three_service
 
 def get_career_service():
-    return current_zone().career_service
+    return current_zone().get_service('career_service')
 
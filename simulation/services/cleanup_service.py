@@ -14,6 +14,14 @@ class CleanupService(Service):
         super().__init__(*args, **kwargs)
         self._alarm_handle = None
 
+    @property
+    def service_dependencies(self):
+        return ('time_service',)
+
+    @property
+    def can_defer_start(self):
+        return True
+
     def start(self):
         current_time = services.time_service().sim_now
         initial_time_span = current_time.time_till_next_day_time(self.OPEN_STREET_CLEANUP_TIME)
@@ -0,0 +1,113 @@
+import collections
+import math
+import build_buy
+import sims4.zone_utils
+FLOOR_CACHE_RESOLUTION = 0.25
+_GridEntry = collections.namedtuple('_GridEntry', ('level', 'min_x', 'min_z', 'max_x', 'max_z', 'radius', 'cells', 'fire_retardant'))
+
+def _overlaps_circle(entry, x, z, radius):
+    if entry.radius is not None:
+        center_x = (entry.min_x + entry.max_x)/2
+        center_z = (entry.min_z + entry.max_z)/2
+        reach = entry.radius + radius
+        return (center_x - x)**2 + (center_z - z)**2 < reach*reach
+    closest_x = min(max(x, entry.min_x), entry.max_x)
+    closest_z = min(max(z, entry.min_z), entry.max_z)
+    return (closest_x - x)**2 + (closest_z - z)**2 < radius*radius
+
+class FireOccupancyGrid:
+    __qualname__ = 'FireOccupancyGrid'
+
+    def __init__(self, cell_size):
+        self._cell_size = cell_size
+        self._fire_cells = collections.defaultdict(set)
+        self._fires = {}
+        self._flammable_cells = collections.defaultdict(set)
+        self._flammables = {}
+        self._floor_cache = {}
+
+    def _get_cell(self, x, z):
+        return (math.floor(x/self._cell_size), math.floor(z/self._cell_size))
+
+    def _get_cells(self, min_x, min_z, max_x, max_z):
+        (min_cell_x, min_cell_z) = self._get_cell(min_x, min_z)
+        (max_cell_x, max_cell_z) = self._get_cell(max_x, max_z)
+        return tuple((cell_x, cell_z) for cell_x in range(min_cell_x, max_cell_x + 1) for cell_z in range(min_cell_z, max_cell_z + 1))
+
+    def _insert(self, cells, entries, obj, entry):
+        self._remove(cells, entries, obj)
+        entries[obj] = entry
+        for cell in entry.cells:
+            cells[cell].add(obj)
+
+    def _remove(self, cells, entries, obj):
+        entry = entries.pop(obj, None)
+        if entry is None:
+            return
+        for cell in entry.cells:
+            objects = cells[cell]
+            objects.discard(obj)
+            if not objects:
+                del cells[cell]
+
+    def _query(self, cells, entries, x, z, radius, level):
+        found = set()
+        for cell in self._get_cells(x - radius, z - radius, x + radius, z + radius):
+            objects = cells.get(cell)
+            if objects:
+                found.update(objects)
+        results = []
+        for obj in found:
+            entry = entries[obj]
+            if level is not None and entry.level != level:
+                continue
+            if _overlaps_circle(entry, x, z, radius):
+                results.append(obj)
+        return results
+
+    def add_fire(self, fire_object, x, z, radius, level):
+        cells = self._get_cells(x - radius, z - radius, x + radius, z + radius)
+        self._insert(self._fire_cells, self._fires, fire_object, _GridEntry(level, x - radius, z - radius, x + radius, z + radius, radius, cells, False))
+
+    def remove_fire(self, fire_object):
+        self._remove(self._fire_cells, self._fires, fire_object)
+
+    def get_fires(self, x, z, radius, level=None):
+        return self._query(self._fire_cells, self._fires, x, z, radius, level)
+
+    def clear_fires(self):
+        self._fire_cells.clear()
+        self._fires.clear()
+        self._floor_cache.clear()
+
+    def add_flammable_circle(self, obj, x, z, radius, level, fire_retardant):
+        cells = self._get_cells(x - radius, z - radius, x + radius, z + radius)
+        self._insert(self._flammable_cells, self._flammables, obj, _GridEntry(level, x - radius, z - radius, x + radius, z + radius, radius, cells, fire_retardant))
+
+    def add_flammable_rect(self, obj, min_x, min_z, max_x, max_z, level, fire_retardant):
+        cells = self._get_cells(min_x, min_z, max_x, max_z)
+        self._insert(self._flammable_cells, self._flammables, obj, _GridEntry(level, min_x, min_z, max_x, max_z, None, cells, fire_retardant))
+
+    def remove_flammable(self, obj):
+        self._remove(self._flammable_cells, self._flammables, obj)
+
+    def get_flammable_objects(self, x, z, radius, level=None):
+        return self._query(self._flammable_cells, self._flammables, x, z, radius, level)
+
+    def has_fire_retardant(self, x, z, radius, level=None):
+        return any(self._flammables[obj].fire_retardant for obj in self._query(self._flammable_cells, self._flammables, x, z, radius, level))
+
+    def has_floor(self, position, level):
+        key = (level, math.floor(position.x/FLOOR_CACHE_RESOLUTION), math.floor(position.z/FLOOR_CACHE_RESOLUTION))
+        has_floor = self._floor_cache.get(key)
+        if has_floor is None:
+            has_floor = bool(build_buy.has_floor_at_location(sims4.zone_utils.get_zone_id(), position, level))
+            self._floor_cache[key] = has_floor
+        return has_floor
+
+    def clear(self):
+        self._fire_cells.clear()
+        self._fires.clear()
+        self._flammable_cells.clear()
+        self._flammables.clear()
+        self._floor_cache.clear()
@@ -14,6 +14,7 @@ from objects import system
 from objects.components.state import TunableStateValueReference, ObjectState, ObjectStateValue
 from objects.fire.fire import Fire
 from postures.transition_sequence import DerailReason
+from services.fire_occupancy_grid import FireOccupancyGrid
 from sims import household_manager
 from sims4.callback_utils import CallableList
 from sims4.localization import TunableLocalizedStringFactory
@@ -98,6 +99,7 @@ class FireService(Service):
         self._fire_spread_alarm = None
         self._fire_quadtree = None
         self._flammable_objects_quadtree = None
+        self._occupancy_grid = FireOccupancyGrid(self.FIRE_QUADTREE_RADIUS*2)
         self._burning_objects = None
         self._scorch_cleanup_alarm = None
         self._sprinkler_system_objects = weakref.WeakSet()
@@ -139,49 +141,37 @@ class FireService(Service):
             return
         self.spread_fire()
 
-    def _add_fire_to_quadtree(self, fire_object, location=DEFAULT):
+    @staticmethod
+    def _get_location_level(location):
+        if location.world_routing_surface is None:
+            return
+        return location.level
+
+    def _add_fire_to_quadtree(self, fire_object, location=DEFAULT, level=DEFAULT):
         if self._fire_quadtree is None:
             self._fire_quadtree = sims4.geometry.QuadTree()
         if location is DEFAULT:
             location = sims4.math.Vector2(fire_object.position.x, fire_object.position.z)
+        if level is DEFAULT:
+            level = self._get_location_level(fire_object.location)
         fire_bounds = sims4.geometry.QtCircle(location, self.FIRE_QUADTREE_RADIUS)
         self._fire_quadtree.insert(fire_object, fire_bounds)
+        self._occupancy_grid.add_fire(fire_object, location.x, location.y, self.FIRE_QUADTREE_RADIUS, level)
 
     def _remove_fire_from_quadtree(self, fire_object):
+        self._occupancy_grid.remove_fire(fire_object)
         if self._fire_quadtree is None:
             return
         self._fire_quadtree.remove(fire_object)
 
     def query_quadtree_for_fire_object(self, position, radius=DEFAULT, level=None):
-        if self._fire_quadtree is None:
-            return []
         if radius is DEFAULT:
             radius = self.FIRE_QUADTREE_RADIUS
-        query = sims4.geometry.SpatialQuery(sims4.geometry.QtCircle(position, radius), [self._fire_quadtree])
-        found_fires = query.run()
-        if level is not None:
-            fires_to_remove = set()
-            for fire in found_fires:
-                while fire.location.level is not level:
-                    fires_to_remove.add(fire)
-            if fires_to_remove:
-                found_fires = [fire for fire in found_fires if fire not in fires_to_remove]
-        return found_fires
+        return self._occupancy_grid.get_fires(position.x, position.y, radius, level=level)
 
     def _query_quadtree_for_flammable_object(self, position, radius=DEFAULT, level=None):
-        if self._flammable_objects_quadtree is None:
-            return []
         radius = self.FIRE_QUADTREE_RADIUS if radius is DEFAULT else radius
-        query = sims4.geometry.SpatialQuery(sims4.geometry.QtCircle(position, radius), [self._flammable_objects_quadtree])
-        found_objs = query.run()
-        if level is not None:
-            obj_to_remove = set()
-            for fire in found_objs:
-                while fire.location.level is not level:
-                    obj_to_remove.add(fire)
-            if obj_to_remove:
-                found_objs = [fire for fire in found_objs if fire not in obj_to_remove]
-        return found_objs
+        return self._occupancy_grid.get_flammable_objects(position.x, position.y, radius, level=level)
 
     def _query_quadtree_for_sim(self, position, level, filter_type, radius=DEFAULT):
         sim_quadtree = services.sim_quadtree()
@@ -251,39 +241,45 @@ class FireService(Service):
             return
         logger.debug('Starting to attempt to spread fire.')
         fire_object_list = list(self._fire_objects)
-        for attempt in range(self.MAX_NUM_ATTEMPTS_TO_PLACE_FIRE):
+        candidates = [(random.choice(fire_object_list), self.FIRE_PLACEMENT_RANGE.random_float()*self.FIRE_QUADTREE_RADIUS) for _ in range(self.MAX_NUM_ATTEMPTS_TO_PLACE_FIRE)]
+        sim_test_results = {}
+        for (attempt, (fire_object, distance_in_radii)) in enumerate(candidates):
             logger.debug('Attempt {} to spread fire.', attempt)
-            fire_object = random.choice(fire_object_list)
-            distance_in_radii = self.FIRE_PLACEMENT_RANGE.random_float()*self.FIRE_QUADTREE_RADIUS
             new_position = fire_object.position + fire_object.forward*distance_in_radii
             new_position.y = terrain.get_terrain_height(new_position.x, new_position.z, fire_object.routing_surface)
             fire_object.move_to(transform=fire_object.transform, orientation=sims4.random.random_orientation())
-            if not self._placement_tests(new_position, level=fire_object.location.level, fire_object=fire_object):
-                pass
+            if not self._placement_tests(new_position, level=fire_object.location.level, fire_object=fire_object, sim_test_results=sim_test_results):
+                continue
             transform = sims4.math.Transform(new_position, sims4.random.random_orientation())
             self._spawn_fire(transform, fire_object.routing_surface, run_placement_tests=False)
             logger.debug('Successfully placed fire object on attempt {}', attempt)
+            break
 
-    def _placement_tests(self, new_position, level=None, fire_object=None):
-        zone_id = sims4.zone_utils.get_zone_id()
-        if level is not None and not build_buy.has_floor_at_location(zone_id, new_position, level):
+    def _placement_tests(self, new_position, level=None, fire_object=None, sim_test_results=None):
+        if level is not None and not self._occupancy_grid.has_floor(new_position, level):
             logger.debug('failed to place fire at a location because there is no floor.')
             return False
         if fire_object is not None and abs(fire_object.position.y - new_position.y) > self.FIRE_SPREAD_HEIGHT_THRESHOLD:
             return False
-        location = sims4.math.Vector2(new_position.x, new_position.z)
-        result = self.query_quadtree_for_fire_object(location, level=level)
-        if result:
+        if self._occupancy_grid.get_fires(new_position.x, new_position.z, self.FIRE_QUADTREE_RADIUS, level=level):
             logger.debug('failed to place fire at a location because it overlaps with another fire object.')
             return False
+        location = sims4.math.Vector2(new_position.x, new_position.z)
         result = self._query_quadtree_for_sim(location, level, int(placement.ItemType.SIM_POSITION))
-        if any(not self.FIRE_CAN_SPREAD_TO_SIM_TESTS.run_tests(SingleSimResolver(entry[0].sim_info)) for entry in result):
+        if any(not self._can_spread_to_sim(entry[0], sim_test_results) for entry in result):
             return False
-        result = self._query_quadtree_for_flammable_object(location, level=level)
-        if any(x.fire_retardant for x in result):
+        if self._occupancy_grid.has_fire_retardant(new_position.x, new_position.z, self.FIRE_QUADTREE_RADIUS, level=level):
             return False
         return True
 
+    def _can_spread_to_sim(self, sim, sim_test_results=None):
+        if sim_test_results is not None and sim in sim_test_results:
+            return sim_test_results[sim]
+        result = bool(self.FIRE_CAN_SPREAD_TO_SIM_TESTS.run_tests(SingleSimResolver(sim.sim_info)))
+        if sim_test_results is not None:
+            sim_test_results[sim] = result
+        return result
+
     def is_object_flammable(self, obj):
         tracker = obj.get_tracker(self.FLAMMABLE_COMMODITY)
         if tracker is None or not tracker.has_statistic(self.FLAMMABLE_COMMODITY):
@@ -299,7 +295,7 @@ class FireService(Service):
         stat.set_value(value)
         stat.add_decay_rate_modifier(self.FLAMMABLE_COMMODITY_DECAY_PER_FIRE)
 
-    def add_to_flammable_quadtree(self, obj, location=DEFAULT):
+    def add_to_flammable_quadtree(self, obj, location=DEFAULT, level=DEFAULT):
         if obj.is_sim:
             return
         if not self.is_object_flammable(obj) and not obj.fire_retardant:
@@ -308,8 +304,17 @@ class FireService(Service):
             self._flammable_objects_quadtree = sims4.geometry.QuadTree()
         if location is DEFAULT:
             location = sims4.math.Vector2(obj.position.x, obj.position.z)
+        if level is DEFAULT:
+            level = self._get_location_level(obj.location)
         object_bounds = obj.object_bounds_for_flammable_object(location=location, fire_retardant_bonus=self.FIRE_RETARDANT_EXTRA_OBJECT_RADIUS)
         self._flammable_objects_quadtree.insert(obj, object_bounds)
+        if isinstance(object_bounds, sims4.geometry.QtRect):
+            self._occupancy_grid.add_flammable_rect(obj, object_bounds.a.x, object_bounds.a.y, object_bounds.b.x, object_bounds.b.y, level, obj.fire_retardant)
+        else:
+            radius = obj.object_radius
+            if obj.fire_retardant:
+                radius += self.FIRE_RETARDANT_EXTRA_OBJECT_RADIUS
+            self._occupancy_grid.add_flammable_circle(obj, location.x, location.y, radius, level, obj.fire_retardant)
 
     @staticmethod
     def flammable_object_location_changed(obj, old_loc, new_loc):
@@ -317,14 +322,16 @@ class FireService(Service):
         if fire_service is not None:
             translation = new_loc.world_transform.translation
             location = sims4.math.Vector2(translation.x, translation.z)
+            level = fire_service._get_location_level(new_loc)
             if isinstance(obj, Fire):
                 fire_service._remove_fire_from_quadtree(obj)
-                fire_service._add_fire_to_quadtree(obj, location)
+                fire_service._add_fire_to_quadtree(obj, location, level)
             else:
                 fire_service.remove_from_flammable_quadtree(obj)
-                fire_service.add_to_flammable_quadtree(obj, location)
+                fire_service.add_to_flammable_quadtree(obj, location, level)
 
     def remove_from_flammable_quadtree(self, obj):
+        self._occupancy_grid.remove_flammable(obj)
         if self._flammable_objects_quadtree is None:
             return
         self._flammable_objects_quadtree.remove(obj)
@@ -404,6 +411,7 @@ class FireService(Service):
                 self._remove_fire_from_quadtree(fire_object)
         if not self._fire_objects:
             self._fire_quadtree = None
+            self._occupancy_grid.clear_fires()
             self._advance_situations_to_postfire()
             self._award_insurance_money()
             services.get_persistence_service().unlock_save(self)
@@ -543,6 +551,14 @@ class FireService(Service):
                 return True
         return False
 
+    @property
+    def service_dependencies(self):
+        return ('object_manager',)
+
+    @property
+    def can_defer_start(self):
+        return True
+
     def start(self):
         object_manager = services.object_manager()
         object_manager.register_callback(CallbackTypes.ON_OBJECT_REMOVE, self.remove_from_flammable_quadtree)
@@ -565,6 +581,7 @@ class FireService(Service):
         self._sprinkler_has_been_activated = False
         object_manager = services.object_manager()
         object_manager.unregister_callback(CallbackTypes.ON_OBJECT_REMOVE, self.remove_from_flammable_quadtree)
+        self._occupancy_grid.clear()
         self.unregister_for_panic_callback()
 
     def on_client_disconnect(self, client):
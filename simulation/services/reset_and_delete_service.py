@@ -1,5 +1,6 @@
 from objects.object_enums import ResetReason
 from scheduling import HardStopError
+import collections
 import enum
 import gsi_handlers
 import services
@@ -39,7 +40,7 @@ class ResetRecord:
         self.reset_reason = reset_reason
         self.stage = _Stage.PENDING
         self.is_being_processed = False
-        self.elements = []
+        self.elements = collections.deque()
         self.source = source
         self.cause = cause
 
@@ -51,10 +52,10 @@ class ResetAndDeleteService(sims4.service_manager.Service):
 
     def __init__(self):
         self._all_reset_records = {}
-        self._staged_records = []
-        for stage in range(_Stage.PROCESSING_COUNT):
-            self._staged_records.insert(stage, [])
+        self._staged_records = [collections.deque() for _ in range(_Stage.PROCESSING_COUNT)]
         self._is_processing = False
+        self._processing_stage = None
+        self._lower_stage_staged = False
         self._master_controller_sims = set()
 
     def _get_reset_record(self, obj):
@@ -63,18 +64,20 @@ class ResetAndDeleteService(sims4.service_manager.Service):
     def _add_new_record(self, record):
         logger.assert_log(self._get_reset_record(record.obj) is None, 'Attempting to create duplicate ResetRecord for {}'.format(record.obj), owner='sscholl')
         self._all_reset_records[record.obj] = record
-        self._staged_records[record.stage].append(record)
+        self._restage_record(record)
 
     def _restage_record(self, record, append=True):
         if append:
             self._staged_records[record.stage].append(record)
         else:
-            self._staged_records[record.stage].insert(0, record)
+            self._staged_records[record.stage].appendleft(record)
+        if self._processing_stage is not None and record.stage < self._processing_stage:
+            self._lower_stage_staged = True
 
     def _change_record_stage(self, record, new_stage):
         self._staged_records[record.stage].remove(record)
         record.stage = new_stage
-        self._staged_records[new_stage].append(record)
+        self._restage_record(record)
 
     def trigger_destroy(self, obj, source=None, cause=None):
         self.trigger_reset(obj, ResetReason.BEING_DESTROYED, source=source, cause=cause)
@@ -93,7 +96,7 @@ class ResetAndDeleteService(sims4.service_manager.Service):
         for obj in objs:
             new_record = ResetRecord(obj, reset_reason, source, cause)
             is_new = self._add_or_update_record(new_record)
-            while is_new:
+            if is_new:
                 new_records.append(new_record)
         for record in new_records:
             self._collect_dependencies(record)
@@ -143,14 +146,16 @@ class ResetAndDeleteService(sims4.service_manager.Service):
         while to_collect:
             record = to_collect.pop()
             try:
+                collected_elements = set(record.elements)
                 for element in record.obj.on_reset_get_elements_to_hard_stop(record.reset_reason):
-                    while element not in record.elements:
+                    if element not in collected_elements:
+                        collected_elements.add(element)
                         record.elements.append(element)
                 reset_records = []
                 record.obj.on_reset_get_interdependent_reset_records(record.reset_reason, reset_records)
                 for dependent_record in reset_records:
                     is_new = self._add_or_update_record(dependent_record)
-                    while is_new:
+                    if is_new:
                         to_collect.append(dependent_record)
             except BaseException:
                 logger.exception('Unexpected exception while collecting reset dependencies for record:{}', record, owner='sscholl')
@@ -171,8 +176,8 @@ class ResetAndDeleteService(sims4.service_manager.Service):
         try:
             while self._all_reset_records:
                 for stage in range(_Stage.PROCESSING_COUNT):
-                    while self._staged_records[stage]:
-                        self._process_one_record(stage)
+                    if self._staged_records[stage]:
+                        self._process_stage(stage)
                         break
         except HardStopError:
             hard_stop_error = True
@@ -198,9 +203,18 @@ class ResetAndDeleteService(sims4.service_manager.Service):
         except BaseException:
             logger.exception('Unexpected exception in master_controller.on_reset_end.')
 
-    def _process_one_record(self, stage):
+    def _process_stage(self, stage):
+        records = self._staged_records[stage]
+        self._processing_stage = stage
+        self._lower_stage_staged = False
+        try:
+            while records and not self._lower_stage_staged:
+                self._process_one_record(records.popleft())
+        finally:
+            self._processing_stage = None
+
+    def _process_one_record(self, record):
         try:
-            record = self._staged_records[stage].pop(0)
             record.is_being_processed = True
             append_record = True
             update_stage = record.stage
@@ -234,7 +248,7 @@ class ResetAndDeleteService(sims4.service_manager.Service):
                     gsi_handlers.reset_handlers.archive_reset_log_record('Early Detach', record)
                 record.obj.on_reset_early_detachment(record.reset_reason)
             elif record.stage == _Stage.HARD_STOP_ELEMENTS:
-                element = record.elements.pop(0)
+                element = record.elements.popleft()
                 logger.debug('trigger_hard_stop:{} for record:{}', element.tracing_repr(), record)
                 if gsi_handlers.reset_handlers.reset_log_archiver.enabled:
                     gsi_handlers.reset_handlers.archive_reset_log_entry('Hard Stop', element.tracing_repr(), record.reset_reason, record.obj)
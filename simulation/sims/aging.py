@@ -52,6 +52,7 @@ class AgingLiability(Liability):
 
 class AgeProgressContinuousStatistic(ContinuousStatistic):
     __qualname__ = 'AgeProgressContinuousStatistic'
+    __slots__ = ()
     _default_convergence_value = sims4.math.POS_INFINITY
     decay_modifier = 1
 
@@ -1,5 +1,7 @@
 #ERROR: jaddr is None
 from collections import OrderedDict
+import bisect
+import functools
 import itertools
 from objects.object_enums import ResetReason
 from services.reset_and_delete_service import ResetRecord
@@ -87,10 +89,7 @@ class WorkEntry:
         return self.cancel_callable is not None
 
     def remove_from_master_controller(self):
-        for sim in self.resources:
-            active_work = self.master_controller._active_work.get(sim)
-            while active_work is not None and active_work is self:
-                del self.master_controller._active_work[sim]
+        self.master_controller._release_work_entry(self)
         self._work_element = None
         self._work_entry_element = None
         self._run_work_gen_element = None
@@ -142,6 +141,46 @@ class WorkRequest:
     def set_work_timestamp(self):
         return self._set_work_timestamp
 
+class _WorkPriorityIndex:
+    __qualname__ = '_WorkPriorityIndex'
+    __slots__ = ('_keys', '_order')
+
+    def __init__(self):
+        self._keys = {}
+        self._order = []
+
+    def __contains__(self, sim):
+        return sim in self._keys
+
+    def __len__(self):
+        return len(self._order)
+
+    def update(self, sim, priority=None, timestamp=None):
+        old_key = self._keys.get(sim)
+        if old_key is None:
+            new_key = (-priority, timestamp, sim.id)
+        else:
+            new_key = (old_key[0] if priority is None else -priority, old_key[1] if timestamp is None else timestamp, old_key[2])
+            if new_key == old_key:
+                return
+            del self._order[bisect.bisect_left(self._order, old_key)]
+        self._keys[sim] = new_key
+        bisect.insort(self._order, new_key + (sim,))
+
+    def discard(self, sim):
+        key = self._keys.pop(sim, None)
+        if key is not None:
+            del self._order[bisect.bisect_left(self._order, key)]
+
+    def clear(self):
+        self._keys.clear()
+        del self._order[:]
+
+    def sorted(self, sims):
+        if len(sims)*8 < len(self._order):
+            return sorted(sims, key=self._keys.__getitem__)
+        return [entry[3] for entry in self._order if entry[3] in sims]
+
 class MasterController(sims4.service_manager.Service):
     __qualname__ = 'MasterController'
     get_next_id = UniqueIdGenerator()
@@ -155,6 +194,13 @@ class MasterController(sims4.service_manager.Service):
         self._sims = set()
         self._active_work = {}
         self._denied_sims = OrderedDict()
+        self._priority_index = _WorkPriorityIndex()
+        self._resource_owners = {}
+        self._resource_waiters = {}
+        self._head_changed_callbacks = {}
+        self._sims_without_work = set()
+        self._dirty_sims = set()
+        self._released_resources = set()
         self._gsi_entry = None
         self._gsi_log_entries = None
 
@@ -169,6 +215,13 @@ class MasterController(sims4.service_manager.Service):
         if self._denied_sims:
             logger.error('Denied Sims {} should be empty.  MC logic error.', self._denied_sims, owner='mduke')
             self._denied_sims.clear()
+        self._priority_index.clear()
+        self._resource_owners.clear()
+        self._resource_waiters.clear()
+        self._head_changed_callbacks.clear()
+        self._sims_without_work.clear()
+        self._dirty_sims.clear()
+        self._released_resources.clear()
 
     @property
     def timeline(self):
@@ -185,7 +238,10 @@ class MasterController(sims4.service_manager.Service):
     def add_sim(self, sim):
         logger.assert_raise(self._enabled == True, 'Attempting to add a sim to the master controller when it is not enabled.', owner='sscholl')
         self._sims.add(sim)
-        self.set_timestamp_for_sim_to_now(sim)
+        if sim not in self._active_work:
+            self._sims_without_work.add(sim)
+        self._last_work_timestamps[sim] = self.get_next_id()
+        self._priority_index.update(sim, priority=sim.get_next_work_priority(), timestamp=self._last_work_timestamps[sim])
         self._process(sim)
 
     def added_sims(self):
@@ -194,15 +250,21 @@ class MasterController(sims4.service_manager.Service):
     def remove_sim(self, sim):
         self._last_work_timestamps.pop(sim, None)
         self._sims.discard(sim)
-        if sim in self._denied_sims:
-            del self._denied_sims[sim]
-            sim.queue.on_head_changed.remove(self._process)
+        self._priority_index.discard(sim)
+        self._sims_without_work.discard(sim)
+        self._dirty_sims.discard(sim)
+        self._remove_denied_sim(sim)
 
     def reset_timestamp_for_sim(self, sim):
-        self._last_work_timestamps[sim] = 0
+        self._set_timestamp(sim, 0)
 
     def set_timestamp_for_sim_to_now(self, sim):
-        self._last_work_timestamps[sim] = self.get_next_id()
+        self._set_timestamp(sim, self.get_next_id())
+
+    def _set_timestamp(self, sim, timestamp):
+        self._last_work_timestamps[sim] = timestamp
+        if sim in self._priority_index:
+            self._priority_index.update(sim, timestamp=timestamp)
 
     def is_sim_free(self, sim):
         if sim not in self._active_work:
@@ -213,7 +275,8 @@ class MasterController(sims4.service_manager.Service):
         return work_entry.cancelable
 
     def on_reset_sim(self, sim, reset_reason):
-        self._active_work.pop(sim, None)
+        if sim in self._active_work:
+            self._clear_active_work(sim)
 
     def on_reset_begin(self):
         self._reset_in_progress = True
@@ -230,13 +293,83 @@ class MasterController(sims4.service_manager.Service):
             while other_sim is not sim:
                 records.append(ResetRecord(other_sim, ResetReason.RESET_EXPECTED, sim, 'Work entry resource:{}'.format(work_entry)))
 
+    def _set_active_work(self, sim, work_entry):
+        self._active_work[sim] = work_entry
+        self._sims_without_work.discard(sim)
+
+    def _clear_active_work(self, sim):
+        work_entry = self._active_work.pop(sim)
+        self._released_resources.add(sim)
+        if sim in self._sims:
+            self._sims_without_work.add(sim)
+        if work_entry is not None:
+            self._release_resource_owners(work_entry)
+
+    def _release_work_entry(self, work_entry):
+        for sim in work_entry.resources:
+            if self._active_work.get(sim) is work_entry:
+                self._clear_active_work(sim)
+        self._release_resource_owners(work_entry)
+
+    def _release_resource_owners(self, work_entry):
+        for resource in work_entry.additional_resources:
+            if self._resource_owners.get(resource) is work_entry:
+                del self._resource_owners[resource]
+                self._released_resources.add(resource)
+
+    def _on_sim_head_changed(self, sim):
+        self._dirty_sims.add(sim)
+        self._process()
+
+    def _add_denied_sim(self, sim, work_entry):
+        if sim in self._denied_sims:
+            self._remove_resource_waiter(sim, self._denied_sims[sim])
+        else:
+            callback = self._head_changed_callbacks[sim] = functools.partial(self._on_sim_head_changed, sim)
+            sim.queue.on_head_changed.append(callback)
+        self._denied_sims[sim] = work_entry
+        for resource in itertools.chain(work_entry.resources, work_entry.additional_resources):
+            waiters = self._resource_waiters.get(resource)
+            if waiters is None:
+                waiters = self._resource_waiters[resource] = set()
+            waiters.add(sim)
+
+    def _remove_denied_sim(self, sim):
+        work_entry = self._denied_sims.pop(sim, None)
+        if work_entry is None:
+            return
+        self._remove_resource_waiter(sim, work_entry)
+        sim.queue.on_head_changed.remove(self._head_changed_callbacks.pop(sim))
+
+    def _remove_resource_waiter(self, sim, work_entry):
+        for resource in itertools.chain(work_entry.resources, work_entry.additional_resources):
+            waiters = self._resource_waiters.get(resource)
+            if waiters is not None:
+                waiters.discard(sim)
+                if not waiters:
+                    del self._resource_waiters[resource]
+
+    def _get_sims_to_process(self, sims):
+        sims_to_process = set(sims)
+        for resource in itertools.chain(sims, self._released_resources):
+            waiters = self._resource_waiters.get(resource)
+            if waiters is not None:
+                sims_to_process.update(waiters)
+        sims_to_process.update(self._dirty_sims)
+        sims_to_process &= self._sims
+        for sim in sims_to_process:
+            self._priority_index.update(sim, priority=sim.get_next_work_priority())
+        self._dirty_sims.clear()
+        self._released_resources.clear()
+        return sims_to_process
+
     def _process_work_entry(self, sim, work_entry, requested_sims, requested_resources):
         all_free = True
         must_run = not work_entry.cancelable
         immediate_cancels = []
         if work_entry.additional_resources:
             for additional_resource in work_entry.additional_resources:
-                while additional_resource in requested_resources:
+                if additional_resource in requested_resources or additional_resource in self._resource_owners:
                     all_free = False
                     break
             requested_resources.update(work_entry.additional_resources)
@@ -249,41 +382,46 @@ class MasterController(sims4.service_manager.Service):
             if required_sim in requested_sims:
                 all_free = False
                 self._gsi_add_log_entry(sim, 'PROCESS_WORK_ENTRY', 'Already Requested')
+                continue
             if required_sim in self._active_work:
                 self._gsi_add_log_entry(sim, 'PROCESS_WORK_ENTRY', 'Sim Resource has Active Work: {} - ', str(self._active_work[required_sim]))
                 if not must_run:
                     all_free = False
                     self._gsi_add_log_entry(sim, 'PROCESS_WORK_ENTRY', 'Work Entry is not must run')
+                    continue
                 required_work_entry = self._active_work[required_sim]
                 if not required_work_entry.cancelable:
                     all_free = False
                     requested_sims.add(required_sim)
                     self._gsi_add_log_entry(sim, 'PROCESS_WORK_ENTRY', 'Sim Resource has work entry and cannot be canceled immediately')
+                    continue
                 self._gsi_add_log_entry(sim, 'PROCESS_WORK_ENTRY', 'Sim Resource has work entry that can be canceled added to immedeiate_cancels')
                 immediate_cancels.append((required_sim, required_work_entry))
+                continue
             self._gsi_add_log_entry(sim, 'PROCESS_WORK_ENTRY', 'Sim Resource is free')
         if all_free:
             for (required_sim, required_work_entry) in immediate_cancels:
                 self._gsi_add_log_entry(sim, 'PROCESS_WORK_ENTRY', '{} work entry canceled called.', required_sim)
                 required_work_entry.cancel()
-                while required_sim in self._active_work:
-                    del self._active_work[required_sim]
+                if required_sim in self._active_work:
+                    self._clear_active_work(required_sim)
             for required_sim in work_entry.resources:
                 self._gsi_add_log_entry(sim, 'PROCESS_WORK_ENTRY', 'work entry added to sim{}.', required_sim)
-                self._active_work[required_sim] = work_entry
+                self._set_active_work(required_sim, work_entry)
                 requested_sims.add(required_sim)
+            for additional_resource in work_entry.additional_resources:
+                self._resource_owners[additional_resource] = work_entry
             return True
         if sim not in self._denied_sims:
             self._gsi_add_log_entry(sim, 'PROCESS_WORK_ENTRY', 'Entry added to denied sims.')
-            sim.queue.on_head_changed.append(self._process)
-            self._denied_sims[sim] = work_entry
+        self._add_denied_sim(sim, work_entry)
         if must_run:
             requested_sims.update(work_entry.resources)
         self._gsi_add_log_entry(sim, 'PROCESS_WORK_ENTRY', 'work entry NOT added to sim.')
         return False
 
     def _sorted_sims(self, sims):
-        return sorted(sims, key=lambda sim: (-sim.get_next_work_priority(), self._last_work_timestamps[sim]))
+        return self._priority_index.sorted(sims)
 
     def _process(self, *sims):
         if not self._enabled or self._processing or self._reset_in_progress:
@@ -293,38 +431,33 @@ class MasterController(sims4.service_manager.Service):
         try:
             requested_sims = set()
             requested_resources = set()
-            for work_entry in self._active_work.values():
-                while work_entry.additional_resources:
-                    requested_resources.update(work_entry.additional_resources)
             new_work_accepted = []
             self._gsi_entry_initialize(*sims)
             self._gsi_add_sim_time_line_for_sims(sims, 'Start', 'Begin processing')
             sims_filtered = [sim for sim in sims if sim in self._sims]
-            for sim in self._sorted_sims(itertools.chain(self._denied_sims, sims_filtered)):
+            for sim in self._sorted_sims(self._get_sims_to_process(sims)):
                 self._gsi_add_log_entry(sim, 'PROCESS', '----- START -----')
-                if sim not in self._sims:
-                    pass
                 if sim in requested_sims:
-                    pass
+                    continue
                 existing_entry = self._active_work.get(sim)
                 if existing_entry is not None and not existing_entry.cancelable:
-                    pass
-                if sim in self._denied_sims:
-                    sim.queue.on_head_changed.remove(self._process)
+                    continue
+                callback = self._head_changed_callbacks.get(sim)
+                if callback is not None:
+                    sim.queue.on_head_changed.remove(callback)
                 try:
                     work_request = sim.get_next_work()
                 finally:
-                    if sim in self._denied_sims:
-                        sim.queue.on_head_changed.append(self._process)
+                    if callback is not None:
+                        sim.queue.on_head_changed.append(callback)
                 if work_request.work_element is None:
                     self._gsi_add_log_entry(sim, 'PROCESS', 'No Work Element')
+                    continue
                 work_entry = WorkEntry(work_element=work_request.work_element, resources=work_request.required_sims, additional_resources=work_request.additional_resources, owner=sim, master_controller=self, on_accept=work_request.on_accept, debug_name=work_request._debug_name)
                 self._gsi_add_sim_time_line_for_sim(sim, 'Create', 'Work Entry Created')
                 self._gsi_add_log_entry(sim, 'PROCESS', 'Work Entry Created: required_sims:{}', str(work_request.required_sims))
-                while self._process_work_entry(sim, work_entry, requested_sims, requested_resources):
-                    if sim in self._denied_sims:
-                        sim.queue.on_head_changed.remove(self._process)
-                        del self._denied_sims[sim]
+                if self._process_work_entry(sim, work_entry, requested_sims, requested_resources):
+                    self._remove_denied_sim(sim)
                     new_work_accepted.append((sim, work_entry))
                     if work_request.set_work_timestamp:
                         self.set_timestamp_for_sim_to_now(sim)
@@ -332,17 +465,14 @@ class MasterController(sims4.service_manager.Service):
                 self._gsi_add_log_entry(sim, 'PROCESS', 'Work Entry Start Called: {}', work_entry)
                 self._gsi_add_sim_time_line_for_sim(sim, 'Start', 'Work Entry Started')
                 work_entry.start()
-            for sim in self._sims:
-                while sim not in self._active_work:
-                    (work_element_idle, cancel_callable) = sim.get_idle_element()
-                    if work_element_idle is not None:
-                        work_entry = WorkEntry(work_element=work_element_idle, cancel_callable=cancel_callable, resources=(sim,), owner=sim, master_controller=self)
-                        self._active_work[sim] = work_entry
-                        self._gsi_add_log_entry(sim, 'PROCESS', 'No active work - run idle behavior')
-                        if sim not in self._denied_sims:
-                            sim.queue.on_head_changed.append(self._process)
-                        self._denied_sims[sim] = work_entry
-                        work_entry.start()
+            for sim in tuple(self._sims_without_work):
+                (work_element_idle, cancel_callable) = sim.get_idle_element()
+                if work_element_idle is not None:
+                    work_entry = WorkEntry(work_element=work_element_idle, cancel_callable=cancel_callable, resources=(sim,), owner=sim, master_controller=self)
+                    self._set_active_work(sim, work_entry)
+                    self._gsi_add_log_entry(sim, 'PROCESS', 'No active work - run idle behavior')
+                    self._add_denied_sim(sim, work_entry)
+                    work_entry.start()
             self._gsi_entry_finalize()
             self._processing = False
         finally:
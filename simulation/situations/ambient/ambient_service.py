@@ -128,7 +128,7 @@ class _AmbientSourceActiveLotVenueType(_AmbientSource):
         return 0
 
     def start_appropriate_situation(self, time_of_day=None):
-        ambient_service = services.current_zone().ambient_service
+        ambient_service = services.ambient_service()
         situation_type = ambient_service.TEST_WALKBY_SITUATION
         if situation_type is None:
             return
@@ -152,6 +152,10 @@ class AmbientService(sims4.service_manager.Service):
         self._flavor_alarm_handle = None
         self._sources = []
 
+    @property
+    def can_defer_start(self):
+        return True
+
     def stop(self):
         if self._update_alarm_handle is not None:
             alarms.cancel_alarm(self._update_alarm_handle)
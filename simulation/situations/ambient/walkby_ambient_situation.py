@@ -107,7 +107,7 @@ class WalkbyAmbientSituation(SituationComplexCommon):
     def _on_social_finished(self):
         self._other_social_situation = None
         self._social_interaction = None
-        self._social_cooldown_until = services.time_service().sim_now + clock.interval_in_sim_minutes(services.current_zone().ambient_service.SOCIAL_COOLDOWN)
+        self._social_cooldown_until = services.time_service().sim_now + clock.interval_in_sim_minutes(services.ambient_service().SOCIAL_COOLDOWN)
         self._change_state(_LeaveState())
 
     @classproperty
@@ -184,7 +184,7 @@ class _SocialState(SituationState):
         super().on_activate(reader)
         self._other_situation = self.owner._other_social_situation
         self._interaction = self.owner._social_interaction
-        self._timeout_handle = alarms.add_alarm(self, clock.interval_in_sim_minutes(services.current_zone().ambient_service.SOCIAL_MAX_DURATION), self.timer_expired)
+        self._timeout_handle = alarms.add_alarm(self, clock.interval_in_sim_minutes(services.ambient_service().SOCIAL_MAX_DURATION), self.timer_expired)
         self.owner._set_job_role_state(self.owner.walker_job.situation_job, self.owner.walker_job.flavor_interaction_state)
 
     def _on_set_sim_role_state(self, sim, *args, **kwargs):
@@ -214,7 +214,7 @@ class _SocialState(SituationState):
         super().on_deactivate()
 
     def _push_social(self, sim, target_sim):
-        affordances = services.current_zone().ambient_service.SOCIAL_AFFORDANCES
+        affordances = services.ambient_service().SOCIAL_AFFORDANCES
         if not affordances:
             return
         affordance = affordances[random.randint(0, len(affordances) - 1)]
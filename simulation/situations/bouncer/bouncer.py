@@ -374,13 +374,31 @@ class Bouncer:
             cls._exclusivity_rules[key] = rule
 
     def _update(self):
+        with situations.situation_manager.DelayedSituationDestruction():
+            for _ in self._update_gen():
+                pass
+
+    def _update_gen(self):
+        if self._started == False:
+            return
+        with situations.situation_manager.DelayedSituationDestruction():
+            self._update_number_of_npcs_on_lot()
+        yield from self._assign_instanced_sims_to_unfulfilled_requests_gen()
+        yield
         if self._started == False:
             return
         with situations.situation_manager.DelayedSituationDestruction():
             self._update_number_of_npcs_on_lot()
-            self._assign_instanced_sims_to_unfulfilled_requests()
             self._consider_spawn()
+        yield
+        if self._started == False:
+            return
+        with situations.situation_manager.DelayedSituationDestruction():
             self._monitor_npc_soft_cap()
+        yield
+        if self._started == False:
+            return
+        with situations.situation_manager.DelayedSituationDestruction():
             self._check_for_tardy_requests()
 
     def _update_number_of_npcs_on_lot(self):
@@ -393,49 +411,63 @@ class Bouncer:
 
     def _assign_instanced_sims_to_unfulfilled_requests(self):
         with situations.situation_manager.DelayedSituationDestruction():
-            all_candidate_sim_ids = set()
-            for sim in services.sim_info_manager().instanced_sims_gen():
-                if not sim.is_simulating:
-                    pass
-                if not sim.visible_to_client:
-                    pass
-                all_candidate_sim_ids.add(sim.id)
-            if len(all_candidate_sim_ids) == 0:
-                return
-            sim_filter_service = services.sim_filter_service()
-            for unfulfilled_index in range(Bouncer.MAX_UNFULFILLED_INDEX):
-                candidate_requests = list(self._unfulfilled_requests[unfulfilled_index])
-                sim_request_score_heap = []
-                for request in candidate_requests:
-                    if request._requires_spawning:
-                        pass
-                    candidate_sim_ids = {sim_id for sim_id in all_candidate_sim_ids if self._can_assign_sim_id_to_request(sim_id, request)}
-                    if request._constrained_sim_ids:
-                        candidate_sim_ids = candidate_sim_ids & request._constrained_sim_ids
-                    if not candidate_sim_ids:
-                        pass
-                    filter_results = sim_filter_service.submit_filter(request._sim_filter, callback=None, sim_constraints=list(candidate_sim_ids), blacklist_sim_ids=request._get_blacklist(), requesting_sim_info=request._requesting_sim_info, allow_yielding=False)
-                    for filter_result in filter_results:
-                        heapq.heappush(sim_request_score_heap, SimRequestScore(sim_id=filter_result.sim_info.id, request=request, score=filter_result.score))
-                while sim_request_score_heap:
-                    sim_request_score = heapq.heappop(sim_request_score_heap)
-                    request = sim_request_score.request
-                    if request._is_fulfilled:
-                        continue
-                    sim = services.object_manager().get(sim_request_score.sim_id)
-                    if sim is None:
-                        continue
-                    while self._can_assign_sim_to_request(sim, request):
-                        if request._is_factory:
-                            request = request._create_request(sim)
-                            self.submit_request(request)
-                        self._assign_sim_to_request(sim, request)
-                        continue
-            for (situation, situation_data) in self._situation_to_bouncer_situation_data.items():
-                while not situation_data.first_assignment_pass_completed:
+            for _ in self._assign_instanced_sims_to_unfulfilled_requests_gen():
+                pass
+
+    def _assign_instanced_sims_to_unfulfilled_requests_gen(self):
+        all_candidate_sim_ids = set()
+        for sim in services.sim_info_manager().instanced_sims_gen():
+            if not sim.is_simulating:
+                continue
+            if not sim.visible_to_client:
+                continue
+            all_candidate_sim_ids.add(sim.id)
+        if len(all_candidate_sim_ids) == 0:
+            return
+        sim_filter_service = services.sim_filter_service()
+        object_manager = services.object_manager()
+        for unfulfilled_index in range(Bouncer.MAX_UNFULFILLED_INDEX):
+            if unfulfilled_index:
+                yield
+                if self._started == False:
+                    return
+                all_candidate_sim_ids = {sim_id for sim_id in all_candidate_sim_ids if object_manager.get(sim_id) is not None}
+            with situations.situation_manager.DelayedSituationDestruction():
+                self._assign_sims_to_unfulfilled_requests(unfulfilled_index, all_candidate_sim_ids, sim_filter_service, object_manager)
+        with situations.situation_manager.DelayedSituationDestruction():
+            for (situation, situation_data) in tuple(self._situation_to_bouncer_situation_data.items()):
+                if not situation_data.first_assignment_pass_completed:
                     situation.on_first_assignment_pass_completed()
                     situation_data.on_first_assignment_pass_completed()
 
+    def _assign_sims_to_unfulfilled_requests(self, unfulfilled_index, all_candidate_sim_ids, sim_filter_service, object_manager):
+        candidate_requests = list(self._unfulfilled_requests[unfulfilled_index])
+        sim_request_score_heap = []
+        for request in candidate_requests:
+            if request._requires_spawning:
+                continue
+            candidate_sim_ids = {sim_id for sim_id in all_candidate_sim_ids if self._can_assign_sim_id_to_request(sim_id, request)}
+            if request._constrained_sim_ids:
+                candidate_sim_ids = candidate_sim_ids & request._constrained_sim_ids
+            if not candidate_sim_ids:
+                continue
+            filter_results = sim_filter_service.submit_filter(request._sim_filter, callback=None, sim_constraints=list(candidate_sim_ids), blacklist_sim_ids=request._get_blacklist(), requesting_sim_info=request._requesting_sim_info, allow_yielding=False)
+            for filter_result in filter_results:
+                heapq.heappush(sim_request_score_heap, SimRequestScore(sim_id=filter_result.sim_info.id, request=request, score=filter_result.score))
+        while sim_request_score_heap:
+            sim_request_score = heapq.heappop(sim_request_score_heap)
+            request = sim_request_score.request
+            if request._is_fulfilled:
+                continue
+            sim = object_manager.get(sim_request_score.sim_id)
+            if sim is None:
+                continue
+            if self._can_assign_sim_to_request(sim, request):
+                if request._is_factory:
+                    request = request._create_request(sim)
+                    self.submit_request(request)
+                self._assign_sim_to_request(sim, request)
+
     def _assign_sim_to_request(self, sim, request):
         with situations.situation_manager.DelayedSituationDestruction():
             data = self._sim_to_bouncer_sim_data.setdefault(sim, BouncerSimData(self, sim))
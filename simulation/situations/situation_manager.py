@@ -136,6 +136,10 @@ class SituationManager(DistributableObjectManager):
         self._pre_bouncer_update.append(situation)
 
     def update(self):
+        for _ in self.update_gen():
+            pass
+
+    def update_gen(self):
         if self._bouncer is not None:
             try:
                 situations = tuple(self._pre_bouncer_update)
@@ -143,7 +147,7 @@ class SituationManager(DistributableObjectManager):
                     self._pre_bouncer_update = []
                     for situation in situations:
                         situation.on_pre_bouncer_update()
-                self._bouncer._update()
+                yield from self._bouncer._update_gen()
             except Exception:
                 logger.exception('Exception while updating the Bouncer.')
 
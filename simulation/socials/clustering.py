@@ -1,4 +1,4 @@
-from contextlib import contextmanager
+import collections
 import itertools
 import math
 import weakref
@@ -83,23 +83,35 @@ class ObjectClusterRequest(HasTunableFactory, AutoFactoryInit):
     def __init__(self, get_objects_gen, quadtree=None, **kwargs):
         super().__init__(**kwargs)
         self._clusters = []
+        self._clusters_version = 0
         self._get_objects_gen = get_objects_gen
-        self._cache = None
         self._dirty = True
+        self._full_update = True
         self._quadtree = quadtree
         self._reachable_cache = {}
+        self._reachable_cache_keys = collections.defaultdict(set)
+        self._object_stamps = {}
+        self._neighbors = {}
+        self._object_to_component = {}
+        self._component_clusters = {}
         services.current_zone().object_cluster_service.register_cluster_request(self)
 
+    @property
+    def clusters_version(self):
+        if self._dirty:
+            self._generate_clusters()
+        return self._clusters_version
+
     def get_clusters_gen(self, regenerate=False):
         if self._dirty or regenerate:
-            self._generate_clusters()
+            self._generate_clusters(full_update=regenerate)
         for cluster in self._clusters:
             yield cluster
 
     @staticmethod
     def _is_in_sight(cluster, position):
         for los_poly in cluster.polygon:
-            while los_poly.contains(position):
+            if los_poly.contains(position):
                 return True
         return False
 
@@ -112,14 +124,14 @@ class ObjectClusterRequest(HasTunableFactory, AutoFactoryInit):
         for cluster in self.get_clusters_gen():
             for sub_constraint in constraint:
                 if sub_constraint.routing_surface != cluster.routing_surface:
-                    pass
+                    continue
                 constraint_position = sub_constraint.average_position
                 if radius is not None and (constraint_position - cluster.position).magnitude_2d() > radius:
-                    pass
+                    continue
                 if not sub_constraint.intersect(cluster.constraint).valid:
-                    pass
+                    continue
                 score = self._get_score(cluster, constraint_position)
-                while best_score is None or score < best_score:
+                if best_score is None or score < best_score:
                     best_score = score
                     best_cluster = cluster
         return best_cluster
@@ -127,25 +139,49 @@ class ObjectClusterRequest(HasTunableFactory, AutoFactoryInit):
     def set_dirty(self, full_update=False):
         self._dirty = True
         if full_update:
+            self._full_update = True
             self._reachable_cache.clear()
+            self._reachable_cache_keys.clear()
 
     def set_object_dirty(self, obj):
-        invalid_keys = tuple(cache_key for cache_key in self._reachable_cache if obj.id in cache_key)
-        for cache_key in invalid_keys:
-            del self._reachable_cache[cache_key]
         self.set_dirty()
 
     def is_dirty(self):
         return self._dirty
 
-    @contextmanager
-    def _caching(self):
-        self._cache = {}
-        try:
-            yield None
-        finally:
-            self._cache = None
-            self._dirty = False
+    def _get_object_stamp(self, obj):
+        position = obj.position
+        routing_surface = obj.routing_surface
+        stamp = (obj.id, position.x, position.y, position.z, routing_surface.primary_id, routing_surface.secondary_id, routing_surface.type)
+        if self.facing_angle is not None:
+            forward = obj.forward
+            stamp += (forward.x, forward.z)
+        return stamp
+
+    def _remove_reachable_cache_entries(self, obj_id):
+        for cache_key in self._reachable_cache_keys.pop(obj_id, ()):
+            self._reachable_cache.pop(cache_key, None)
+            other_id = cache_key[1][0] if cache_key[0][0] == obj_id else cache_key[0][0]
+            other_cache_keys = self._reachable_cache_keys.get(other_id)
+            if other_cache_keys is not None:
+                other_cache_keys.discard(cache_key)
+
+    def _update_object_stamps(self, objects):
+        changed_objects = set()
+        for obj in objects:
+            stamp = self._get_object_stamp(obj)
+            old_stamp = self._object_stamps.get(obj)
+            if stamp != old_stamp:
+                if old_stamp is not None:
+                    self._remove_reachable_cache_entries(obj.id)
+                self._object_stamps[obj] = stamp
+                changed_objects.add(obj)
+        removed_objects = [obj for obj in self._object_stamps if obj not in objects]
+        for obj in removed_objects:
+            self._remove_reachable_cache_entries(obj.id)
+            del self._object_stamps[obj]
+            changed_objects.add(obj)
+        return changed_objects
 
     def _is_facing(self, a, b):
         interval = interval_from_facing_angle(vector3_angle(a.position - b.position), self.facing_angle + self.FACING_EPSILON)
@@ -153,14 +189,18 @@ class ObjectClusterRequest(HasTunableFactory, AutoFactoryInit):
         return facing in interval
 
     def _is_reachable(self, a, b):
+        a_stamp = self._object_stamps[a]
+        b_stamp = self._object_stamps[b]
         if b.id > a.id:
-            cache_key = (a.id, b.id)
+            cache_key = (a_stamp, b_stamp)
         else:
-            cache_key = (b.id, a.id)
-        if cache_key in self._reachable_cache:
-            return self._reachable_cache[cache_key]
-        result = self._is_reachable_no_cache(a, b)
-        self._reachable_cache[cache_key] = result
+            cache_key = (b_stamp, a_stamp)
+        result = self._reachable_cache.get(cache_key)
+        if result is None:
+            result = self._is_reachable_no_cache(a, b)
+            self._reachable_cache[cache_key] = result
+            self._reachable_cache_keys[a.id].add(cache_key)
+            self._reachable_cache_keys[b.id].add(cache_key)
         return result
 
     def _is_reachable_no_cache(self, a, b):
@@ -175,16 +215,7 @@ class ObjectClusterRequest(HasTunableFactory, AutoFactoryInit):
         return False
 
     def _get_reachable_objects(self, obj, objects):
-        reachable_objects = self._cache.get(obj, None)
-        if reachable_objects is not None:
-            reachable_objects = [reachable_obj for reachable_obj in reachable_objects if reachable_obj in objects]
-        else:
-            reachable_objects = []
-            for other_obj in self._get_reachable_objects_candidates(obj, objects):
-                while other_obj is not obj and self._is_reachable(obj, other_obj):
-                    reachable_objects.append(other_obj)
-        self._cache[obj] = reachable_objects
-        return reachable_objects
+        return [reachable_obj for reachable_obj in self._neighbors[obj] if reachable_obj in objects]
 
     def _get_reachable_objects_candidates(self, obj, objects):
         if self._quadtree is not None:
@@ -196,18 +227,9 @@ class ObjectClusterRequest(HasTunableFactory, AutoFactoryInit):
         max_obj_dist_sq = 0
         for obj in objects:
             if obj.parts:
-                while True:
-                    for part in obj.parts:
-                        dist_sq = (part.position - position).magnitude_2d_squared()
-                        while dist_sq > max_obj_dist_sq:
-                            max_obj_dist_sq = dist_sq
-                    dist_sq = (obj.position - position).magnitude_2d_squared()
-                    while dist_sq > max_obj_dist_sq:
-                        max_obj_dist_sq = dist_sq
-            else:
-                dist_sq = (obj.position - position).magnitude_2d_squared()
-                while dist_sq > max_obj_dist_sq:
-                    max_obj_dist_sq = dist_sq
+                for part in obj.parts:
+                    max_obj_dist_sq = max(max_obj_dist_sq, (part.position - position).magnitude_2d_squared())
+            max_obj_dist_sq = max(max_obj_dist_sq, (obj.position - position).magnitude_2d_squared())
         obj_dist = sims4.math.sqrt(max_obj_dist_sq) + self.radius_buffer
         return min(obj_dist, self.line_of_sight_constraint.max_line_of_sight_radius)
 
@@ -234,7 +256,7 @@ class ObjectClusterRequest(HasTunableFactory, AutoFactoryInit):
         compound_polygon = sims4.geometry.CompoundPolygon([polygon])
         return compound_polygon
 
-    def _generate_cluster(self, position, objects):
+    def _generate_cluster(self, position, objects, clusters):
         radius = self._get_cluster_radius(position, objects)
         los = LineOfSight(radius, self.line_of_sight_constraint.map_divisions, self.line_of_sight_constraint.simplification_ratio, self.line_of_sight_constraint.boundary_epsilon)
         routing_surface = next(iter(objects)).routing_surface
@@ -244,10 +266,11 @@ class ObjectClusterRequest(HasTunableFactory, AutoFactoryInit):
         if los.constraint_convex.geometry is not None:
             for obj in objects:
                 for polygon in los.constraint_convex.geometry.polygon:
-                    while test_point_in_polygon(obj.lineofsight_component.default_position, polygon):
+                    if test_point_in_polygon(obj.lineofsight_component.default_position, polygon):
                         valid_objects.append(obj)
                         break
-                rejects.append(obj)
+                else:
+                    rejects.append(obj)
         else:
             rejects = objects
         if not valid_objects:
@@ -268,64 +291,134 @@ class ObjectClusterRequest(HasTunableFactory, AutoFactoryInit):
         cluster_constraint = los.constraint_convex.intersect(convex_hull_constraint)
         if cluster_constraint.valid:
             cluster = ObjectCluster(position, cluster_constraint, valid_objects, routing_surface)
-            self._clusters.append(cluster)
+            clusters.append(cluster)
         return [rejects]
 
-    def _get_clusters(self, objects):
+    def _get_clusters(self, objects, generated_clusters):
         closed = set()
         clusters = []
         for obj in objects:
-            while obj not in closed:
-                closed.add(obj)
-                neighbors = self._get_reachable_objects(obj, objects)
-                if len(neighbors) >= self.minimum_size - 1:
-                    cluster = set()
-                    cluster.add(obj)
-                    for neighbor in neighbors:
-                        if neighbor not in closed:
-                            closed.add(neighbor)
-                            connected_neighbors = self._get_reachable_objects(neighbor, objects)
-                            if len(connected_neighbors) >= self.minimum_size - 1:
-                                neighbors.extend([cn for cn in connected_neighbors if cn not in neighbors])
-                        while not any(neighbor in c for c in itertools.chain(self._clusters, clusters)):
-                            cluster.add(neighbor)
-                    clusters.append(cluster)
+            if obj in closed:
+                continue
+            closed.add(obj)
+            neighbors = self._get_reachable_objects(obj, objects)
+            if len(neighbors) >= self.minimum_size - 1:
+                cluster = set()
+                cluster.add(obj)
+                for neighbor in neighbors:
+                    if neighbor not in closed:
+                        closed.add(neighbor)
+                        connected_neighbors = self._get_reachable_objects(neighbor, objects)
+                        if len(connected_neighbors) >= self.minimum_size - 1:
+                            neighbors.extend([cn for cn in connected_neighbors if cn not in neighbors])
+                    if not any(neighbor in c for c in itertools.chain(generated_clusters, clusters)):
+                        cluster.add(neighbor)
+                clusters.append(cluster)
         return clusters
 
-    def _generate_clusters(self):
-        with self._caching():
-            del self._clusters[:]
-            objects = [set(self._get_objects_gen())]
-            all_rejects = set()
-            while objects:
-                clusters = self._get_clusters(objects.pop())
-                for cluster in clusters:
-                    polygon = Polygon([obj.position for obj in cluster])
-                    centroid = polygon.centroid()
-                    facing_rejects = []
-                    for obj in list(cluster):
-                        if self.facing_angle is not None:
-                            interval = interval_from_facing_angle(vector3_angle(centroid - obj.position), self.facing_angle + self.FACING_EPSILON)
-                            facing = vector3_angle(obj.forward)
-                            is_facing = facing in interval
-                        else:
-                            is_facing = True
-                        while not is_facing and not vector3_almost_equal_2d(centroid, obj.position, epsilon=0.01):
-                            cluster.remove(obj)
-                            facing_rejects.append(obj)
-                    while len(cluster) >= self.minimum_size:
-                        rejected_sets = self._generate_cluster(centroid, cluster)
-                        while True:
-                            for rejected_set in itertools.chain((facing_rejects,), rejected_sets):
-                                unused_rejects = set(obj for obj in rejected_set if obj not in all_rejects)
-                                all_rejects.update(unused_rejects)
-                                while len(unused_rejects) >= self.minimum_size:
-                                    objects.append(unused_rejects)
+    def _generate_component_clusters(self, component):
+        component_clusters = []
+        objects = [set(component)]
+        all_rejects = set()
+        while objects:
+            clusters = self._get_clusters(objects.pop(), component_clusters)
+            for cluster in clusters:
+                polygon = Polygon([obj.position for obj in cluster])
+                centroid = polygon.centroid()
+                facing_rejects = []
+                for obj in list(cluster):
+                    if self.facing_angle is not None:
+                        interval = interval_from_facing_angle(vector3_angle(centroid - obj.position), self.facing_angle + self.FACING_EPSILON)
+                        facing = vector3_angle(obj.forward)
+                        is_facing = facing in interval
+                    else:
+                        is_facing = True
+                    if not is_facing and not vector3_almost_equal_2d(centroid, obj.position, epsilon=0.01):
+                        cluster.remove(obj)
+                        facing_rejects.append(obj)
+                if len(cluster) >= self.minimum_size:
+                    rejected_sets = self._generate_cluster(centroid, cluster, component_clusters)
+                    for rejected_set in itertools.chain((facing_rejects,), rejected_sets):
+                        unused_rejects = set(obj for obj in rejected_set if obj not in all_rejects)
+                        all_rejects.update(unused_rejects)
+                        if len(unused_rejects) >= self.minimum_size:
+                            objects.append(unused_rejects)
+        return component_clusters
+
+    def _update_neighbors(self, objects, changed_objects):
+        for obj in changed_objects:
+            for neighbor in self._neighbors.pop(obj, ()):
+                neighbor_set = self._neighbors.get(neighbor)
+                if neighbor_set is not None:
+                    neighbor_set.discard(obj)
+        for obj in changed_objects:
+            if obj not in objects:
+                continue
+            neighbors = self._neighbors.setdefault(obj, set())
+            for other_obj in self._get_reachable_objects_candidates(obj, objects):
+                if other_obj is not obj and self._is_reachable(obj, other_obj):
+                    neighbors.add(other_obj)
+                    self._neighbors.setdefault(other_obj, set()).add(obj)
+
+    def _update_components(self, objects, changed_objects):
+        seeds = set()
+        for obj in changed_objects:
+            component = self._object_to_component.get(obj)
+            if component is not None:
+                seeds.update(component)
+            seeds.add(obj)
+        self._update_neighbors(objects, changed_objects)
+        for obj in changed_objects:
+            component = self._object_to_component.pop(obj, None)
+            if component is not None:
+                self._component_clusters.pop(component, None)
+        visited = set()
+        for seed in seeds:
+            if seed in visited or seed not in objects:
+                continue
+            visited.add(seed)
+            component_objects = [seed]
+            for obj in component_objects:
+                old_component = self._object_to_component.get(obj)
+                if old_component is not None:
+                    self._component_clusters.pop(old_component, None)
+                for neighbor in self._neighbors[obj]:
+                    if neighbor not in visited:
+                        visited.add(neighbor)
+                        component_objects.append(neighbor)
+            component = frozenset(component_objects)
+            for obj in component:
+                self._object_to_component[obj] = component
+            if len(component) >= self.minimum_size:
+                self._component_clusters[component] = self._generate_component_clusters(component)
+            else:
+                self._component_clusters[component] = []
+        self._clusters = list(itertools.chain.from_iterable(self._component_clusters.values()))
+        self._clusters_version += 1
+
+    def _generate_clusters(self, full_update=False):
+        try:
+            objects = set(self._get_objects_gen())
+            changed_objects = self._update_object_stamps(objects)
+            if full_update or self._full_update:
+                self._neighbors.clear()
+                self._object_to_component.clear()
+                self._component_clusters.clear()
+                changed_objects = objects
+            if changed_objects:
+                self._update_components(objects, changed_objects)
+        finally:
+            self._dirty = False
+            self._full_update = False
 
 class SocialGroupClusterService(Service):
     __qualname__ = 'SocialGroupClusterService'
     CLUSTER_REQUEST = ObjectClusterRequest.TunableFactory(description='\n        Specify how social clusters are generated.\n        ')
 
+    @property
+    def service_dependencies(self):
+        return ('object_manager',)
+
     def start(self, *args, **kwargs):
         super().start(*args, **kwargs)
         self._cluster_request = self.CLUSTER_REQUEST(self._get_objects_gen)
@@ -353,9 +446,13 @@ class SocialGroupClusterService(Service):
 
     def _get_objects_gen(self):
         for obj in services.object_manager().valid_objects():
-            while self._is_datapoint(obj):
+            if self._is_datapoint(obj):
                 yield obj
 
+    @property
+    def clusters_version(self):
+        return self._cluster_request.clusters_version
+
     def get_clusters_gen(self, *args, **kwargs):
         return self._cluster_request.get_clusters_gen(*args, **kwargs)
 
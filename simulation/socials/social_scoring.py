@@ -21,6 +21,21 @@ class SocialJoinScoringFunction(ScoringFunctionBase):
         socials.geometry.score_facing(accum, candidate_facing, other_facing, delta)
         return accum.value()
 
+    def get_combined_scores(self, positions, orientations, routing_surfaces):
+        target_sim = self._target_sim_ref() if self._target_sim_ref is not None else None
+        if target_sim is None:
+            return [(1, 0.0)]*len(positions)
+        target_transform = target_sim.intended_transform
+        other_facing = sims4.math.yaw_quaternion_to_angle(target_transform.orientation)
+        target_position = target_transform.translation
+        scores = []
+        for (position, orientation) in zip(positions, orientations):
+            accum = accumulator.HarmonicMeanAccumulator()
+            candidate_facing = sims4.math.yaw_quaternion_to_angle(orientation)
+            socials.geometry.score_facing(accum, candidate_facing, other_facing, target_position - position)
+            scores.append((accum.value(), 0.0))
+        return scores
+
 class SocialGroupScoringFunction(ScoringFunctionBase):
     __qualname__ = 'SocialGroupScoringFunction'
 
@@ -49,6 +64,27 @@ class SocialGroupScoringFunction(ScoringFunctionBase):
             offset += socials.geometry.SocialGeometry.SCORE_OFFSET_FOR_CURRENT_POSITION
         return (multiplier, offset)
 
+    def get_combined_scores(self, positions, orientations, routing_surfaces):
+        group = self._group_ref()
+        if group is None:
+            return [(1.0, 0.0)]*len(positions)
+        geometry = group.geometry
+        if not geometry or len(geometry) == 1 and self._sim in geometry:
+            ideal_position = group.position
+            return [(socials.geometry.SocialGeometry.GROUP_DISTANCE_CURVE.get((position - ideal_position).magnitude_2d()*2.0), 0.0) for position in positions]
+        (base_focus, base_field) = socials.geometry._get_social_geometry_for_sim(self._sim)
+        group_radius = group.group_radius
+        sim_position = self._sim.position if self._sim in geometry else None
+        scores = []
+        for (position, orientation) in zip(positions, orientations):
+            transform = sims4.math.Transform(position, orientation)
+            multiplier = socials.geometry.score_transform(transform, self._sim, geometry, group_radius, base_focus, base_field)
+            offset = multiplier*socials.geometry.SocialGeometry.SCORE_STRENGTH_MULTIPLIER
+            if sim_position is not None and sims4.math.vector3_almost_equal_2d(position, sim_position, epsilon=0.01):
+                offset += socials.geometry.SocialGeometry.SCORE_OFFSET_FOR_CURRENT_POSITION
+            scores.append((multiplier, offset))
+        return scores
+
     def get_posture_cost_attenuation(self, body_target):
         (multiplier, _) = self.get_combined_score(body_target.position, body_target.orientation, body_target.routing_surface)
         return multiplier
@@ -16,6 +16,7 @@ class StatisticChangeDirection(enum.Int):
 
 class BaseStatistic:
     __qualname__ = 'BaseStatistic'
+    __slots__ = ('_tracker', '_value', '_locked', '_statistic_modifier', '_statistic_modifiers', '_statistic_multiplier_increase', '_statistic_multiplier_decrease', '_statistic_multipliers', '__weakref__')
     decay_rate = 0.0
     _utility_curve = None
     SkillBasedMultiplier = namedtuple('SkillBasedMultiplier', ['curve', 'use_effective_skill'])
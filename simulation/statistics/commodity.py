@@ -116,6 +116,7 @@ class TunableArrowData(TunableTuple):
 
 class Commodity(HasTunableReference, TunedContinuousStatistic, metaclass=HashedTunedInstanceMetaclass, manager=services.get_instance_manager(sims4.resources.Types.STATISTIC)):
     __qualname__ = 'Commodity'
+    __slots__ = ('_allow_convergence_callback_to_activate', '_buff_handle', '_core', '_buff_threshold_callback', '_current_state_index', '_current_state_ge_callback_data', '_current_state_lt_callback_data', '_off_lot_callback_data', '_distress_buff_handle', '_exit_distress_callback_data', '_distress_callback_data', '_failure_callback_data', '_convergence_callback_data', '_suppress_client_updates', 'force_apply_buff_on_start_up', 'force_buff_reason')
     REMOVE_INSTANCE_TUNABLES = ('initial_value',)
     INSTANCE_TUNABLES = {'stat_name': TunableLocalizedString(description='\n                Localized name of this commodity.\n                ', export_modes=ExportModes.All), 'min_value_tuning': Tunable(description='\n                The minimum value for this stat.\n                ', tunable_type=float, default=-100, export_modes=ExportModes.All), 'max_value_tuning': Tunable(description='\n                The maximum value for this stat.', tunable_type=float, default=100, export_modes=ExportModes.All), 'ui_sort_order': TunableRange(description='\n                Order in which the commodity will appear in the motive panel.\n                Commodities sort from lowest to highest.\n                ', tunable_type=int, default=0, minimum=0, export_modes=ExportModes.All), 'ui_visible_distress_threshold': Tunable(description='\n                When current value of commodity goes below this value, commodity\n                will appear in the motive panel tab.\n                ', tunable_type=float, default=0, export_modes=ExportModes.All), 'ad_data': TunableList(description='\n                A list of Vector2 points that define the desire curve for this\n                commodity.\n                ', tunable=TunableVector2(description='\n                    Point on a Curve\n                    ', default=sims4.math.Vector2(0, 0), export_modes=ExportModes.All)), 'auto_satisfy_curve_tuning': TunableList(description='\n                A list of Vector2 points that define the auto-satisfy curve for\n                this commodity.\n                ', tunable=TunableVector2(description='\n                    Point on a Curve\n                    ', default=sims4.math.Vector2(0, 0))), 'auto_satisfy_curve_random_time_offset': TunableSimMinute(description='\n                An amount of time that when auto satisfy curves are being used\n                will modify the time current time being used to plus or minus\n                a random number between this value.\n                ', default=120), 'maximum_auto_satisfy_time': TunableSimMinute(description='\n                The maximum amount of time that the auto satisfy curves will\n                interpolate the values based on the current one before just\n                setting to the maximum value.\n                ', default=1440), 'initial_tuning': TunableTuple(description=' \n                The Initial value for this commodity. Can either be a single\n                value, range, or use auto satisfy curve to determine initial\n                value.  Use auto satisfy curve will take precedence over range\n                value and range value will take precedence over single value\n                range.\n                ', _use_auto_satisfy_curve_as_initial_value=Tunable(description="\n                    If checked, when we first add this commodity to a sim (sims only),\n                    the initial value of the commodity will be set according to\n                    the auto-satisfy curves defined by this commodity's tuning as\n                    opposed to the tuned initial value.    \n                    ", tunable_type=bool, needs_tuning=True, default=False), _value_range=OptionalTunable(description='\n                    If enabled then when we first add this commodity to a Sim the\n                    initial value of the commodity will be set to a random value\n                    within this interval.\n                    ', tunable=TunableInterval(description='\n                        An interval that will be used for the initial value of this\n                        commodity.\n                        ', tunable_type=int, default_lower=0, default_upper=100)), _value=Tunable(description='\n                    The initial value for this stat.', tunable_type=float, default=0.0)), 'weight': Tunable(description="\n                The weight of the Skill with regards to autonomy.  It's ignored \n                for the purposes of sorting stats, but it's applied when scoring \n                the actual statistic operation for the SI.\n                ", tunable_type=float, default=0.5), 'states': TunableList(description='\n                Commodity states based on thresholds.  This should be ordered\n                from worst state to best state.\n                ', tunable=TunableCommodityState()), 'commodity_distress': OptionalTunable(TunableCommodityDistress()), 'commodity_failure': OptionalTunable(TunableCommodityFailure()), 'remove_on_convergence': Tunable(description='\n                Commodity will be removed when convergence is met only if not\n                a core commodity.\n                ', tunable_type=bool, default=True), 'visible': Tunable(description='\n                Whether or not commodity should be sent to client.\n                ', tunable_type=bool, default=False, export_modes=ExportModes.All), '_add_if_not_in_tracker': Tunable(description="\n                If True, when we try to add or set the commodity, we will add\n                the commodity to the tracker if the tracker doesn't already have\n                it.\n                \n                e.g If a sim uses the toilet and we update bladder when that sim\n                doesn't have the bladder commodity in his/her tracker, we will\n                add the bladder commodity to that sim. \n                \n                Set this to false for the case of NPC behavior commodities like\n                Being a Maid or Being a Burglar.\n                ", tunable_type=bool, default=True), 'initial_as_default': Tunable(description='\n                Setting this to true will cause the default value returned during testing to be the \n                initial value tuned. This happens when a test is run on this commodity on a Sim that\n                does not have the commodity. Leaving this as false will instead return the convergence\n                value.\n                ', tunable_type=bool, default=False), 'arrow_data': TunableArrowData(description='\n                Used to determine when positive or negative arrows should show\n                up depending on the delta rate of the commodity.\n                ', export_modes=(ExportModes.ClientBinary,)), '_categories': TunableSet(description='\n                List of categories that this statistic is part of.\n                ', tunable=StatisticCategory), '_off_lot_simulation': OptionalTunable(TunableTuple(threshold=TunableThreshold(description='\n                    The threshold that will activate the increase in value\n                    when the commodity hits it.\n                    ', value=Tunable(description='\n                        The value that this threshold will trigger on.\n                        ', tunable_type=int, default=-50)), value=Tunable(description='\n                    The value that this commodity will increase by once it hits\n                    the tuned threshold while the sim is offlot.\n                    ', tunable_type=int, default=100), description='\n                Offlot simulation for this commodity.  The commodity will be\n                allowed to decay at a normal rate until it hits the tuned\n                threshold.  Once there it will then have its value added by the\n                tuned value.\n                ')), '_max_simulate_time_on_load': OptionalTunable(description="\n                If enabled, this commodity will only simulate for a max amount\n                of time when the player loads back into the lot with a new world\n                game time.\n                \n                By default, this is disabled. When disabled, the commodity will\n                simulate for however long between the lot's previous saved time\n                and the current world time. (Note: this is capped by PersistenceTuning.MAX_LOT_SIMULATE_ELAPSED_TIME)\n                ", tunable=TunableSimMinute(description="\n                    If set to > 0, on load, this object commodity will update its value to\n                    world time. And the commodity will simulate for the max amount of time\n                    specified in the tunable.\n                    EX: If tuned for the water commodity on plants to 6 hours --\n                    if the player leaves the lot for 4 hours and then comes back,\n                    the water commodity will update to what it should be 4 hours later.\n                    If the player leaves the lot for 8 hours and comes back, the water\n                    commodity will only update to what it should be 6 hours later.\n                    \n                    If set to 0, no matter how much time has elapsed since the\n                    player last visited the lot, this commodity's value will load\n                    to its last saved value.\n                    ", default=1440, minimum=0)), '_time_passage_fixup_type': TunableEnumEntry(description="\n            This is for commodities on SIMS only.\n            This option what we do with the commodity when the sim\n            gets instanced after time has elapsed since the last time the sim\n            was spawned.\n            \n            do not fixup: Means the commodity will stay the same value as it was\n                when the sim was last instantiated\n                \n            fixup using autosatisfy curve: The commodity's value will be set\n                based on its autosatisfy curve and the time between when the sim was\n                last saved. Note, this fixup will not occur for active household sims\n                if offlot simulation is enabled for this commodity.\n                \n            fixup using time elapsed: The commodity will decay linearly based on\n                when the sim was last saved. Use this for things like commodities\n                that control buff timers to make sure that the time remaining on\n                a buff remains consistent.\n            ", tunable_type=CommodityTimePassageFixupType, default=CommodityTimePassageFixupType.DO_NOT_FIXUP), 'use_stat_value_on_init': Tunable(description='\n            When set the initial value for the commodity will be set from the\n            commodity tuning.\n            If unchecked, the initial stat value will not be set on \n            initialization, but instead will use other systems (like the state)\n            to set its initial value.\n            ', tunable_type=bool, default=True), 'stat_asm_param': TunableStatAsmParam.TunableFactory(locked_args={'use_effective_skill_level': True})}
     initial_value = 0
@@ -655,11 +656,12 @@ class Commodity(HasTunableReference, TunedContinuousStatistic, metaclass=HashedT
 
 class RuntimeCommodity(Commodity):
     __qualname__ = 'RuntimeCommodity'
+    __slots__ = ()
     INSTANCE_SUBCLASSES_ONLY = True
 
     @classmethod
     def generate(cls, name):
-        ProxyClass = type(cls)(name, (cls,), {'INSTANCE_SUBCLASSES_ONLY': True})
+        ProxyClass = type(cls)(name, (cls,), {'INSTANCE_SUBCLASSES_ONLY': True, '__slots__': ()})
         ProxyClass.reloadable = False
         key = sims4.resources.get_resource_key(name, ProxyClass.tuning_manager.TYPE)
         ProxyClass.tuning_manager.register_tuned_class(ProxyClass, key)
@@ -18,6 +18,7 @@ logger = sims4.log.Logger('SimStatistics')
 
 class _ContinuousStatisticCallbackData:
     __qualname__ = '_ContinuousStatisticCallbackData'
+    __slots__ = ('_stat', '_callback', '_threshold', '_trigger_time', '_repeating', '_interval', '_on_callback_alarm_reset')
 
     def __init__(self, stat, callback, threshold, repeating, interval, on_callback_alarm_reset=None):
         self._stat = stat
@@ -125,6 +126,7 @@ class _ContinuousStatisticCallbackData:
 
 class ContinuousStatistic(BaseStatistic):
     __qualname__ = 'ContinuousStatistic'
+    __slots__ = ('_decay_enabled', '_decay_rate_override', '_callbacks', '_suppress_update_active_callbacks', '_alarm_handle', '_active_callback', '_last_update', '_decay_rate_modifier', '_decay_rate_modifiers', '_convergence_value')
     SAVE_VALUE_MULTIPLE = TunableRange(description='\n        When saving the value of a continuous statistic, we force stats to the \n        nearest multiple of this tunable for save of inventory \n        items to increase the chance of stacking success.-Mike Duke\n        \n        EX: 95+ = 100, 85 to 94.9 = 90, ..., -5 to 5 = 0, ..., -95 to -100 = -100\n        ', tunable_type=int, minimum=1, default=10)
     decay_rate = 0
     _default_convergence_value = 0
@@ -19,6 +19,7 @@ class _DecayOverrideNode:
 
 class TunedContinuousStatistic(statistics.continuous_statistic.ContinuousStatistic):
     __qualname__ = 'TunedContinuousStatistic'
+    __slots__ = ()
     INSTANCE_SUBCLASSES_ONLY = True
     INSTANCE_TUNABLES = {'decay_rate': sims4.tuning.tunable.TunableRange(description='\n            The decay rate for this stat (per sim minute).\n            ', tunable_type=float, default=0.001, minimum=0.0), '_decay_rate_overrides': sims4.tuning.tunable.TunableList(description='\n            A list of decay rate overrides.  Whenever the value of the stat falls\n            into this range, the decay rate is overridden with the value specified.\n            This overrides the base decay, so all decay modifiers will still apply.\n            The ranges are inclusive on the lower bound and exclusive on the upper \n            bound.  Overlapping values are not allowed and will behave in an undefined\n            manner.\n            ', tunable=sims4.tuning.tunable.TunableTuple(description='\n                The interval/decay_override pair.\n                ', interval=sims4.tuning.tunable.TunableInterval(description='\n                    The range at which this override will apply.  It is inclusive\n                    on the lower bound and exclusive on the upper bound.\n                    ', tunable_type=float, default_lower=-100, default_upper=100), decay_override=sims4.tuning.tunable.Tunable(description='\n                    The value that the base decay will be overridden with.\n                    ', tunable_type=float, default=0.0))), '_default_convergence_value': sims4.tuning.tunable.Tunable(description='\n            The value toward which the stat decays"\n            ', tunable_type=float, default=0.0), 'stat_asm_param': statistics.tunable.TunableStatAsmParam.TunableFactory(), 'min_value_tuning': sims4.tuning.tunable.Tunable(description='\n            The minimum value for this stat.\n            ', tunable_type=float, default=-100), 'max_value_tuning': sims4.tuning.tunable.Tunable(description='\n            The maximum value for this stat.', tunable_type=float, default=100), 'initial_value': sims4.tuning.tunable.Tunable(description='\n            The initial value for this stat.', tunable_type=float, default=0.0), 'persisted_tuning': sims4.tuning.tunable.Tunable(description="\n            Whether this statistic will persist when saving a Sim or an object.\n            For example, a Sims's SI score statistic should never persist.\n            ", tunable_type=bool, default=True)}
 
@@ -59,6 +59,7 @@ class TunableSkillMultiplier(TunableTuple):
 
 class Skill(HasTunableReference, statistics.continuous_statistic_tuning.TunedContinuousStatistic, metaclass=HashedTunedInstanceMetaclass, manager=services.get_instance_manager(sims4.resources.Types.STATISTIC)):
     __qualname__ = 'Skill'
+    __slots__ = ('_delta_enabled', '_callback_handle', '_max_level_update_sent')
     SKILL_LEVEL_LIST = TunableMapping(key_type=TunableEnumEntry(SkillLevelType, SkillLevelType.MAJOR), value_type=TunableList(Tunable(int, 0), description='The level boundaries for skill type, specified as a delta from the previous value'), export_modes=ExportModes.All)
     SKILL_EFFECTIVENESS_GAIN = TunableMapping(key_type=TunableEnumEntry(SkillEffectiveness, SkillEffectiveness.STANDARD), value_type=TunableCurve(), description='Skill gain points based on skill effectiveness.')
     DYNAMIC_SKILL_INTERVAL = TunableRange(description='\n        Interval used when dynamic loot is used in a\n        PeriodicStatisticChangeElement.\n        ', tunable_type=float, default=1, minimum=1)
@@ -8,6 +8,7 @@ import sims4.resources
 
 class StaticCommodity(HasTunableReference, BaseStatistic, metaclass=TunedInstanceMetaclass, manager=services.get_instance_manager(sims4.resources.Types.STATIC_COMMODITY)):
     __qualname__ = 'StaticCommodity'
+    __slots__ = ()
     INSTANCE_TUNABLES = {'ad_data': Tunable(description='\n                                Autonomous desire to fulfill this static commodity.  This is analogous to \n                                the returned ad curve value of regular commodities and should generally be\n                                between 0 and 1.  If a Sim has this static commodity, they will always \n                                desire it at this value.', tunable_type=float, default=0)}
 
     def __init__(self, tracker):
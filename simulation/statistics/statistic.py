@@ -12,6 +12,7 @@ import sims4.resources
 
 class Statistic(HasTunableReference, BaseStatistic, metaclass=HashedTunedInstanceMetaclass, manager=services.statistic_manager()):
     __qualname__ = 'Statistic'
+    __slots__ = ()
     INSTANCE_TUNABLES = {'stat_asm_param': TunableStatAsmParam.TunableFactory(locked_args={'use_effective_skill_level': True}), 'initial_value': Tunable(int, 0, description='The initial value of this statistic.'), 'min_value_tuning': Tunable(int, 0, description='The minimum value that this statistic can reach.', export_modes=ExportModes.All), 'max_value_tuning': Tunable(int, 100, description='The minimum value that this statistic can reach.', export_modes=ExportModes.All), 'stat_name': TunableLocalizedString(description='Localized name of this resource.', export_modes=ExportModes.All), 'icon': TunableResourceKey('PNG:missing_image', resource_types=sims4.resources.CompoundTypes.IMAGE, description='Icon to be displayed for the Statistic.'), 'persisted_tuning': Tunable(bool, True, description="Whether this statistic will persist when saving a Sim or an object. For example, a Sims's SI score statistic should never persist.")}
 
     def __init__(self, tracker):
@@ -1,6 +1,6 @@
 import collections
+import heapq
 import math
-import operator
 from filters.tunable import TunableSimFilter
 from objects import ALL_HIDDEN_REASONS
 from protocolbuffers import GameplaySaveData_pb2
@@ -55,7 +55,7 @@ class _StoryProgressionFilterAction(_StoryProgressionAction):
             self._pre_apply_action()
             for result in results:
                 sim_info = result.sim_info
-                while sim_info is not None and not sim_info.is_instanced(allow_hidden_flags=ALL_HIDDEN_REASONS):
+                if sim_info is not None and not sim_info.is_instanced(allow_hidden_flags=ALL_HIDDEN_REASONS):
                     self._apply_action(sim_info)
             self._post_apply_action()
 
@@ -85,17 +85,17 @@ class StoryProgressionActionMaxPopulation(_StoryProgressionFilterAction):
         return True
 
     def _get_culling_score(self, sim_info):
-        total_score = 0
-        for relationship in sim_info.relationship_tracker:
-            rel_score = relationship.depth*self.relationship_depth_weight
-            rel_score += len(relationship.bit_track_tracker)*self.relationship_tracks_multiplier
-            if sim_info.time_sim_was_saved is None:
-                last_time_in_days = self.max_last_instantiated/2
-            else:
-                last_time_in_days = services.time_service().sim_now - sim_info.time_sim_was_saved
-                last_time_in_days = last_time_in_days.in_days()
-            rel_score += (self.max_last_instantiated - last_time_in_days)*self.instantiated_weight
-            total_score += rel_score
+        (depth_total, track_total, relationship_count) = sim_info.relationship_tracker.get_culling_totals()
+        if not relationship_count:
+            return 0
+        if sim_info.time_sim_was_saved is None:
+            last_time_in_days = self.max_last_instantiated/2
+        else:
+            last_time_in_days = services.time_service().sim_now - sim_info.time_sim_was_saved
+            last_time_in_days = last_time_in_days.in_days()
+        total_score = depth_total*self.relationship_depth_weight
+        total_score += track_total*self.relationship_tracks_multiplier
+        total_score += relationship_count*(self.max_last_instantiated - last_time_in_days)*self.instantiated_weight
         return total_score
 
     def _apply_action(self, sim_info):
@@ -117,19 +117,18 @@ class StoryProgressionActionMaxPopulation(_StoryProgressionFilterAction):
             household_manager = services.household_manager()
             for (household_id, score_list) in self._household_scores.items():
                 household = household_manager.get(household_id)
-                if len(household) != len(score_list):
-                    pass
-                household_scores.append((household_id, sum(score_list)/len(score_list)))
+                if household is None or len(household) != len(score_list):
+                    continue
+                household_scores.append((sum(score_list)/len(score_list), household_id))
             if not household_scores:
                 return
-            sorted_options = sorted(household_scores, key=operator.itemgetter(1))
+            heapq.heapify(household_scores)
             max_sim_infos = self.max_population.random_int()
             sim_info_manager = services.sim_info_manager()
-            while sorted_options:
-                while len(sim_info_manager) >= max_sim_infos:
-                    (household_id_to_remove, _) = sorted_options.pop(0)
-                    logger.info('Pruning household: {}', household_id_to_remove)
-                    household_manager.prune_household(household_id_to_remove)
+            while household_scores and len(sim_info_manager) >= max_sim_infos:
+                (_, household_id_to_remove) = heapq.heappop(household_scores)
+                logger.info('Pruning household: {}', household_id_to_remove)
+                household_manager.prune_household(household_id_to_remove)
             logger.info('Pruning households - End - current sim info count: {}', len(services.sim_info_manager()))
             self._household_scores.clear()
         else:
@@ -22,6 +22,10 @@ class StoryProgressionService(Service):
         self._next_action_index = 0
         self._story_progression_flags = StoryProgressionFlags.DISABLED
 
+    @property
+    def can_defer_start(self):
+        return True
+
     def load_options(self, options_proto):
         if options_proto is None:
             return
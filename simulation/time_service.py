@@ -25,6 +25,10 @@ class TimeService(sims4.service_manager.Service):
         self.sim_timeline = None
         self.wall_clock_timeline = None
 
+    @property
+    def service_dependencies(self):
+        return ('game_clock',)
+
     def start(self):
         sim_debugger = None
         self.sim_timeline = scheduling.Timeline(
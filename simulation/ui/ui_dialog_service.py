@@ -14,6 +14,10 @@ class UiDialogService(Service):
         self._is_phone_silenced = False
         self._enabled = True
 
+    @property
+    def can_defer_start(self):
+        return True
+
     def disable_on_teardown(self):
         self._enabled = False
 
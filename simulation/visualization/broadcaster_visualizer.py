@@ -12,14 +12,14 @@ class BroadcasterVisualizer:
         self._start()
 
     def _start(self):
-        services.current_zone().broadcaster_service.register_callback(self._on_update)
+        services.broadcaster_service().register_callback(self._on_update)
         self._on_update()
 
     def stop(self):
-        services.current_zone().broadcaster_service.unregister_callback(self._on_update)
+        services.broadcaster_service().unregister_callback(self._on_update)
 
     def _on_update(self):
-        broadcaster_service = services.current_zone().broadcaster_service
+        broadcaster_service = services.broadcaster_service()
         with Context(self.layer) as layer:
             for broadcaster in broadcaster_service.get_broadcasters_gen(inspect_only=True):
                 constraint = broadcaster.get_constraint()
@@ -284,27 +284,29 @@ class WhimsTracker:
         else:
             goals_needed = self.whims_needed if self.whims_needed > 0 else 1
         goals_found = 0
-        while prioritized_tuned_whim_sets:
-            tuned_whim_set = sims4.random.pop_weighted(prioritized_tuned_whim_sets)
+        whim_set_sampler = sims4.random.WeightedSampler(prioritized_tuned_whim_sets)
+        while whim_set_sampler:
+            tuned_whim_set = whim_set_sampler.pop()
             weighted_goal_refs = []
             if debug_goal is None:
                 if tuned_whim_set in self.sets_on_cooldown:
                     continue
                 for whim in tuned_whim_set.whims:
-                    while whim not in self._realized_goals:
+                    if whim not in self._realized_goals:
                         weighted_goal_refs.append((whim.weight, whim.goal))
             else:
                 weighted_goal_refs.append((1, debug_goal))
             whimset_target = self._whimset_target_map.get(tuned_whim_set)
-            while weighted_goal_refs:
-                tuned_goal = sims4.random.pop_weighted(weighted_goal_refs)
+            goal_sampler = sims4.random.WeightedSampler(weighted_goal_refs)
+            while goal_sampler:
+                tuned_goal = goal_sampler.pop()
                 if tuned_goal in chosen_tuned_goals:
                     continue
                 is_duplicate = False
                 for (goal_instance, goal_set) in self._realized_goals.items():
                     if isinstance(goal_instance, tuned_goal):
                         is_duplicate = True
-                    while goal_set is tuned_whim_set:
+                    if goal_set is tuned_whim_set:
                         is_duplicate = True
                 if is_duplicate:
                     continue
@@ -330,12 +332,10 @@ class WhimsTracker:
                     goals_found += 1
                     break
                 else:
-                    while debug_goal is not None:
+                    if debug_goal is not None:
                         logger.error('Whim Goal {} failed pre-tests during offering: {}', debug_goal, pretest.reason, owner='jjacobson')
-                        continue
-            while goals_found >= goals_needed:
+            if goals_found >= goals_needed:
                 break
-                continue
 
     def offer_goals(self, debug_goal=None, debug_target=None, request_single_goal=False, emotion_only=False):
         if not self.emotion_whim_needed and self.whims_needed == 0:
@@ -14,6 +14,7 @@ from sims4 import protocol_buffer_utils
 from sims4.callback_utils import CallableList, CallableListPreventingRecursion
 from world.lot import Lot
 from world.spawn_point import SpawnPointOption, SpawnPoint
+from zone_tick_scheduler import ZoneTickScheduler, TickService
 import adaptive_clock_speed
 import alarms
 import areaserver
@@ -31,6 +32,7 @@ import persistence_error_types
 import persistence_module
 import placement
 import routing
+import routing.connectivity
 import services
 import sims4.log
 import sims4.random
@@ -39,7 +41,8 @@ import zone_types
 logger = sims4.log.Logger('Zone')
 TickMetric = collections.namedtuple(
     'TickMetric', ['absolute_ticks', 'sim_now', 'clock_speed',
-                   'clock_speed_multiplier', 'game_time', 'multiplier_type'])
+                   'clock_speed_multiplier', 'game_time', 'multiplier_type',
+                   'service_times'])
 ZONE_OBJECT_LEAK_DISABLE_REASON = 'Zone shutting down'
 
 
@@ -77,10 +80,17 @@ class Zone:
                 self._zone_state_callbacks[key] = CallableList()
         self._client = None
         self._tick_metrics = None
+        self.service_manager = None
+        self.tick_scheduler = ZoneTickScheduler()
 
     def __repr__(self):
         return '<Zone ID: {0:#x}>'.format(self.id)
 
+    def get_service(self, name):
+        if self.service_manager is not None:
+            self.service_manager.start_deferred_service(name)
+        return getattr(self, name, None)
+
     def ref(self, callback=None):
         return weakref.ref(self, callback)
 
@@ -214,22 +224,38 @@ class Zone:
         self._royalty_alarm_manager.start_schedule()
 
     def update(self, absolute_ticks):
+        scheduler = self.tick_scheduler
+        scheduler.start_tick()
         if self._zone_state == zone_types.ZoneState.CLIENT_CONNECTED:
             self.game_clock.tick_game_clock(absolute_ticks)
         elif self._zone_state == zone_types.ZoneState.HITTING_THEIR_MARKS:
-            self.time_service.update(time_slice=False)
-            self.sim_filter_service.update()
-            self.situation_manager.update()
-            self.broadcaster_service.update()
-            self.zone_spin_up_service.update()
+            scheduler.run(TickService.TIME_SERVICE, self.time_service.update,
+                          time_slice=False)
+            scheduler.run_gen(TickService.SIM_FILTER_SERVICE,
+                              self.sim_filter_service.update_gen)
+            scheduler.run_gen(TickService.SITUATION_MANAGER,
+                              self.situation_manager.update_gen)
+            broadcaster_service = getattr(self, 'broadcaster_service', None)
+            if broadcaster_service is not None:
+                scheduler.run_gen(TickService.BROADCASTER_SERVICE,
+                                  broadcaster_service.update_gen)
+            scheduler.run(TickService.ZONE_SPIN_UP_SERVICE,
+                          self.zone_spin_up_service.update)
         elif self._zone_state == zone_types.ZoneState.RUNNING:
             self.game_clock.tick_game_clock(absolute_ticks)
-            self.time_service.update()
-            self.sim_filter_service.update()
+            scheduler.run(TickService.TIME_SERVICE, self.time_service.update)
+            scheduler.run_gen(TickService.SIM_FILTER_SERVICE,
+                              self.sim_filter_service.update_gen)
             if self.game_clock.clock_speed() != ClockSpeedMode.PAUSED:
-                self.situation_manager.update()
-                self.broadcaster_service.update()
-                adaptive_clock_speed.AdaptiveClockSpeed.update_adaptive_speed()
+                scheduler.run_gen(TickService.SITUATION_MANAGER,
+                                  self.situation_manager.update_gen)
+                broadcaster_service = getattr(self, 'broadcaster_service', None)
+                if broadcaster_service is not None:
+                    scheduler.run_gen(TickService.BROADCASTER_SERVICE,
+                                      broadcaster_service.update_gen)
+                scheduler.run(
+                    TickService.ADAPTIVE_CLOCK_SPEED,
+                    adaptive_clock_speed.AdaptiveClockSpeed.update_adaptive_speed)
         self._gather_tick_metrics(absolute_ticks)
 
     def _gather_tick_metrics(self, absolute_ticks):
@@ -241,10 +267,12 @@ class Zone:
                 clock_speed_multiplier=
                 self.game_clock.current_clock_speed_scale(),
                 game_time=self.game_clock.now(),
-                multiplier_type=self.game_clock.clock_speed_multiplier_type))
+                multiplier_type=self.game_clock.clock_speed_multiplier_type,
+                service_times=self.tick_scheduler.get_tick_times()))
 
     def start_gathering_tick_metrics(self):
         self._tick_metrics = []
+        self.tick_scheduler.clear_metrics()
 
     def stop_gathering_tick_metrics(self):
         self._tick_metrics = None
@@ -326,7 +354,7 @@ class Zone:
         self._set_zone_state(zone_types.ZoneState.SHUTDOWN_STARTED)
         logger.debug('Zone teardown: disable event manager')
         self.event_manager.disable_on_teardown()
-        self.ui_dialog_service.disable_on_teardown()
+        self.get_service('ui_dialog_service').disable_on_teardown()
         logger.debug('Zone teardown: destroy situations')
         self.situation_manager.destroy_situations_on_teardown()
         logger.debug('Zone teardown: flush sim_infos to client')
@@ -367,6 +395,8 @@ class Zone:
             owner='sscholl')
         self.client_object_managers.clear()
         interactions.constraints.RequiredSlot.clear_required_slot_cache()
+        routing.connectivity.clear_goal_cache()
+        self.tick_scheduler.shutdown()
         self.service_manager.stop_services(self)
         self.ensure_callable_list_is_empty(self.navmesh_change_callbacks)
         self.ensure_callable_list_is_empty(self.wall_contour_update_callbacks)
@@ -392,6 +422,7 @@ class Zone:
 
     def on_loading_screen_animation_finished(self):
         logger.debug('on_loading_screen_animation_finished')
+        self.service_manager.start_deferred_services()
         services.game_clock_service().restore_saved_clock_speed()
         services.sim_info_manager().on_loading_screen_animation_finished()
         services.get_event_manager().process_events_for_household(
@@ -438,7 +438,7 @@ class _FinalPlayableState(_ZoneSpinUpState):
         zone = services.current_zone()
         zone_spin_up_service = zone.zone_spin_up_service
         zone.venue_service.setup_special_event_alarm()
-        zone.ambient_service.begin_walkbys()
+        zone.get_service('ambient_service').begin_walkbys()
         client = zone_spin_up_service._client_connect_data.client
         if client is not None:
             with telemetry_helper.begin_hook(
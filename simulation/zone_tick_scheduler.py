@@ -0,0 +1,115 @@
+import time
+from sims4.tuning.tunable import TunableMapping, TunableEnumEntry, Tunable
+import enum
+import sims4.log
+logger = sims4.log.Logger('ZoneTickScheduler')
+HISTOGRAM_BUCKETS_MILLISECONDS = (1, 2, 5, 10, 20, 50, 100)
+
+class TickService(enum.Int, export=False):
+    __qualname__ = 'TickService'
+    TIME_SERVICE = 0
+    SIM_FILTER_SERVICE = 1
+    SITUATION_MANAGER = 2
+    BROADCASTER_SERVICE = 3
+    ADAPTIVE_CLOCK_SPEED = 4
+    ZONE_SPIN_UP_SERVICE = 5
+    HEAP_CENSUS = 6
+    GSI_DUMP = 7
+
+class _ScheduledTickService:
+    __qualname__ = '_ScheduledTickService'
+
+    def __init__(self, tick_service):
+        self.tick_service = tick_service
+        self.update_gen = None
+        self.last_time_ms = 0
+        self.total_time_ms = 0
+        self.max_time_ms = 0
+        self.update_count = 0
+        self.over_budget_count = 0
+        self.histogram = [0]*(len(HISTOGRAM_BUCKETS_MILLISECONDS) + 1)
+
+    @property
+    def budget_ms(self):
+        return ZoneTickScheduler.SERVICE_BUDGETS.get(self.tick_service, ZoneTickScheduler.DEFAULT_BUDGET_MILLISECONDS)
+
+    def record(self, elapsed_ms):
+        self.last_time_ms += elapsed_ms
+        self.total_time_ms += elapsed_ms
+        self.max_time_ms = max(self.max_time_ms, self.last_time_ms)
+        self.update_count += 1
+        bucket = len(HISTOGRAM_BUCKETS_MILLISECONDS)
+        for (index, bucket_ms) in enumerate(HISTOGRAM_BUCKETS_MILLISECONDS):
+            if elapsed_ms < bucket_ms:
+                bucket = index
+                break
+        self.histogram[bucket] += 1
+        if elapsed_ms > self.budget_ms:
+            self.over_budget_count += 1
+
+class ZoneTickScheduler:
+    __qualname__ = 'ZoneTickScheduler'
+    DEFAULT_BUDGET_MILLISECONDS = Tunable(description='\n        The time budget in milliseconds given each tick to a zone service that\n        has no entry in Service Budgets.\n        ', tunable_type=int, default=10)
+    SERVICE_BUDGETS = TunableMapping(description='\n        Per-service time budgets in milliseconds. Services that update through\n        a generator stop once their budget is spent and resume where they left\n        off on the next tick. Services that cannot yield always run to\n        completion, but are counted as over budget when they exceed it.\n        ', key_type=TunableEnumEntry(tunable_type=TickService, default=TickService.SIM_FILTER_SERVICE), value_type=Tunable(tunable_type=int, default=10))
+
+    def __init__(self):
+        self._services = {}
+
+    def _get_scheduled_service(self, tick_service):
+        scheduled_service = self._services.get(tick_service)
+        if scheduled_service is None:
+            scheduled_service = self._services[tick_service] = _ScheduledTickService(tick_service)
+        return scheduled_service
+
+    def start_tick(self):
+        for scheduled_service in self._services.values():
+            scheduled_service.last_time_ms = 0
+
+    def run(self, tick_service, update, *args, **kwargs):
+        scheduled_service = self._get_scheduled_service(tick_service)
+        start_time = time.monotonic()
+        try:
+            update(*args, **kwargs)
+        finally:
+            scheduled_service.record((time.monotonic() - start_time)*1000)
+
+    def run_gen(self, tick_service, update_gen_fn):
+        scheduled_service = self._get_scheduled_service(tick_service)
+        start_time = time.monotonic()
+        end_time = start_time + scheduled_service.budget_ms/1000
+        try:
+            if scheduled_service.update_gen is None:
+                scheduled_service.update_gen = update_gen_fn()
+            while time.monotonic() < end_time:
+                next(scheduled_service.update_gen)
+        except StopIteration:
+            scheduled_service.update_gen = None
+        except:
+            scheduled_service.update_gen = None
+            logger.exception('Exception while updating {}.', tick_service)
+            return False
+        finally:
+            scheduled_service.record((time.monotonic() - start_time)*1000)
+        return True
+
+    def cancel(self, tick_service):
+        scheduled_service = self._services.get(tick_service)
+        if scheduled_service is not None and scheduled_service.update_gen is not None:
+            scheduled_service.update_gen.close()
+            scheduled_service.update_gen = None
+
+    def get_tick_times(self):
+        return tuple((scheduled_service.tick_service, scheduled_service.last_time_ms) for scheduled_service in self._services.values())
+
+    def get_service_metrics_gen(self):
+        yield from self._services.values()
+
+    def clear_metrics(self):
+        for (tick_service, scheduled_service) in self._services.items():
+            update_gen = scheduled_service.update_gen
+            scheduled_service = self._services[tick_service] = _ScheduledTickService(tick_service)
+            scheduled_service.update_gen = update_gen
+
+    def shutdown(self):
+        for tick_service in self._services:
+            self.cancel(tick_service)